@@ -5,7 +5,6 @@
 Selenium을 사용한 동적 크롤링 및 다중 소스 데이터 수집
 """
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import re
@@ -21,21 +20,25 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import logging
+from task_runner import iter_completed
+from http_transport import create_session
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class AdvancedAuctionCrawler:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, driver_pool=None):
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         self.driver = None
+        # WebDriverPool이 주어지면 요청마다 Chrome을 새로 띄우지 않고 풀에서 재사용
+        self.driver_pool = driver_pool
         
-    def setup_selenium_driver(self, headless=True):
-        """Selenium WebDriver 설정"""
+    def create_selenium_driver(self, headless=True):
+        """Selenium WebDriver 생성 (호출자가 직접 종료해야 함)"""
         try:
             chrome_options = Options()
             if headless:
@@ -49,16 +52,21 @@ class AdvancedAuctionCrawler:
             chrome_options.add_experimental_option('useAutomationExtension', False)
             chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
             
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.driver.set_page_load_timeout(30)
+            driver = webdriver.Chrome(options=chrome_options)
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver.set_page_load_timeout(30)
             
             logger.info("Selenium WebDriver 설정 완료")
-            return True
+            return driver
             
         except Exception as e:
             logger.error(f"Selenium WebDriver 설정 실패: {e}")
-            return False
+            return None
+    
+    def setup_selenium_driver(self, headless=True):
+        """Selenium WebDriver 설정"""
+        self.driver = self.create_selenium_driver(headless)
+        return self.driver is not None
     
     def close_driver(self):
         """WebDriver 종료"""
@@ -66,44 +74,60 @@ class AdvancedAuctionCrawler:
             self.driver.quit()
             self.driver = None
     
+    def acquire_driver(self):
+        """크롤링용 WebDriver 확보 (풀이 있으면 대여, 없으면 새로 생성)"""
+        if self.driver_pool:
+            return self.driver_pool.acquire()
+        return self.create_selenium_driver()
+    
+    def release_driver(self, driver, discard=False):
+        """크롤링이 끝난 WebDriver 반납 (풀이 없으면 종료)"""
+        if self.driver_pool:
+            self.driver_pool.release(driver, discard=discard)
+        else:
+            driver.quit()
+    
     def crawl_court_auction_selenium(self, case_number):
         """Selenium을 사용한 법원경매사이트 크롤링"""
-        if not self.setup_selenium_driver():
+        # 동시 수집 시 소스별로 독립된 드라이버 사용
+        driver = self.acquire_driver()
+        if not driver:
             return None
-            
+        
+        discard = False
         try:
             # 법원경매사이트 접속
             base_url = "https://www.courtauction.go.kr"
             search_url = f"{base_url}/pgj/index.on"
             
             logger.info(f"법원경매사이트 접속: {search_url}")
-            self.driver.get(search_url)
+            driver.get(search_url)
             
             # 페이지 로딩 대기
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             
             # 검색 폼 찾기 및 사건번호 입력
             try:
                 # 사건번호 입력 필드 찾기
-                case_input = WebDriverWait(self.driver, 5).until(
+                case_input = WebDriverWait(driver, 5).until(
                     EC.presence_of_element_located((By.NAME, "caseNo"))
                 )
                 case_input.clear()
                 case_input.send_keys(case_number)
                 
                 # 검색 버튼 클릭
-                search_button = self.driver.find_element(By.XPATH, "//input[@type='submit' or @type='button'][contains(@value, '검색') or contains(@onclick, 'search')]")
+                search_button = driver.find_element(By.XPATH, "//input[@type='submit' or @type='button'][contains(@value, '검색') or contains(@onclick, 'search')]")
                 search_button.click()
                 
                 # 검색 결과 대기
-                WebDriverWait(self.driver, 10).until(
+                WebDriverWait(driver, 10).until(
                     EC.presence_of_element_located((By.CLASS_NAME, "tbl_list"))
                 )
                 
                 # 결과 데이터 추출
-                auction_data = self.extract_court_auction_data_selenium(case_number)
+                auction_data = self.extract_court_auction_data_selenium(driver, case_number)
                 return auction_data
                 
             except TimeoutException:
@@ -112,15 +136,17 @@ class AdvancedAuctionCrawler:
                 
         except Exception as e:
             logger.error(f"법원경매사이트 크롤링 실패: {e}")
+            # 상태를 알 수 없는 드라이버는 재사용하지 않음
+            discard = True
             return None
         finally:
-            self.close_driver()
+            self.release_driver(driver, discard)
     
-    def extract_court_auction_data_selenium(self, case_number):
+    def extract_court_auction_data_selenium(self, driver, case_number):
         """Selenium으로 법원경매 데이터 추출"""
         try:
             # 결과 테이블 찾기
-            table = self.driver.find_element(By.CLASS_NAME, "tbl_list")
+            table = driver.find_element(By.CLASS_NAME, "tbl_list")
             rows = table.find_elements(By.TAG_NAME, "tr")
             
             if len(rows) < 2:
@@ -159,17 +185,20 @@ class AdvancedAuctionCrawler:
     
     def crawl_richgo_selenium(self, location, property_type):
         """Selenium을 사용한 리치고 크롤링"""
-        if not self.setup_selenium_driver():
+        # 동시 수집 시 소스별로 독립된 드라이버 사용
+        driver = self.acquire_driver()
+        if not driver:
             return None
-            
+        
+        discard = False
         try:
             # 리치고 사이트 접속
             richgo_url = "https://m.richgo.ai/pc"
             logger.info(f"리치고 사이트 접속: {richgo_url}")
-            self.driver.get(richgo_url)
+            driver.get(richgo_url)
             
             # 페이지 로딩 대기
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             
@@ -179,7 +208,7 @@ class AdvancedAuctionCrawler:
             # 검색 기능 찾기 및 사용
             try:
                 # 검색 입력 필드 찾기
-                search_input = WebDriverWait(self.driver, 5).until(
+                search_input = WebDriverWait(driver, 5).until(
                     EC.presence_of_element_located((By.XPATH, "//input[contains(@placeholder, '검색') or contains(@placeholder, '지역')]"))
                 )
                 search_input.clear()
@@ -190,7 +219,7 @@ class AdvancedAuctionCrawler:
                 time.sleep(2)
                 
                 # 결과 데이터 추출
-                richgo_data = self.extract_richgo_data_selenium(location, property_type)
+                richgo_data = self.extract_richgo_data_selenium(driver, location, property_type)
                 return richgo_data
                 
             except TimeoutException:
@@ -199,15 +228,17 @@ class AdvancedAuctionCrawler:
                 
         except Exception as e:
             logger.error(f"리치고 크롤링 실패: {e}")
+            # 상태를 알 수 없는 드라이버는 재사용하지 않음
+            discard = True
             return None
         finally:
-            self.close_driver()
+            self.release_driver(driver, discard)
     
-    def extract_richgo_data_selenium(self, location, property_type):
+    def extract_richgo_data_selenium(self, driver, location, property_type):
         """Selenium으로 리치고 데이터 추출"""
         try:
             # 페이지 소스에서 데이터 추출
-            page_source = self.driver.page_source
+            page_source = driver.page_source
             soup = BeautifulSoup(page_source, 'html.parser')
             
             # Next.js 데이터 추출
@@ -229,8 +260,14 @@ class AdvancedAuctionCrawler:
             logger.error(f"리치고 데이터 추출 실패: {e}")
             return None
     
-    def crawl_multiple_sources(self, case_number, location=None, property_type=None):
-        """다중 소스에서 데이터 수집"""
+    def crawl_multiple_sources(self, case_number, location=None, property_type=None,
+                               concurrent=False, max_workers=3, deadline=60):
+        """
+        다중 소스에서 데이터 수집
+
+        concurrent=True이면 소스별 크롤링을 스레드 풀(max_workers)에서 동시에 실행하고,
+        deadline(초) 안에 끝난 소스만 통합한다. 응답 시간이 소스 합계가 아닌 가장 느린 소스로 줄어든다.
+        """
         results = {
             'caseNumber': case_number,
             'sources': {},
@@ -238,6 +275,9 @@ class AdvancedAuctionCrawler:
             'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         
+        if concurrent:
+            return self.crawl_multiple_sources_concurrent(case_number, location, property_type, max_workers, deadline)
+        
         # 1. 법원경매사이트 크롤링
         logger.info("법원경매사이트 크롤링 시작...")
         court_data = self.crawl_court_auction_selenium(case_number)
@@ -269,6 +309,70 @@ class AdvancedAuctionCrawler:
         
         return results
     
+    def get_source_tasks(self, case_number, location=None, property_type=None):
+        """소스 이름별 크롤링 작업 (순서가 결과 병합 순서)"""
+        tasks = {
+            'court_auction': lambda: self.crawl_court_auction_selenium(case_number)
+        }
+        if location:
+            tasks['richgo'] = lambda: self.crawl_richgo_selenium(location, property_type)
+        tasks['other_sites'] = lambda: self.crawl_other_real_estate_sites(case_number, location, property_type)
+        return tasks
+    
+    def crawl_multiple_sources_concurrent(self, case_number, location, property_type, max_workers=3, deadline=60):
+        """소스별 크롤링을 동시에 실행하고 끝나는 순서대로 결과 병합"""
+        # 마지막 통합 결과(combined) 이벤트만 사용
+        combined = None
+        for event in self.iter_multiple_sources(case_number, location, property_type, max_workers, deadline):
+            if event['event'] == 'combined':
+                combined = event['data']
+        return combined
+    
+    def iter_multiple_sources(self, case_number, location=None, property_type=None, max_workers=3, deadline=60):
+        """
+        소스별 크롤링을 동시에 실행하고 끝나는 대로 이벤트 생성 (스트리밍 응답용)
+
+        - {'event': 'source', 'source': 이름, 'data': 결과}: 소스 크롤링 성공
+        - {'event': 'source_failed', 'source': 이름, 'error': 사유}: 소스 크롤링 실패
+        - {'event': 'combined', 'data': 전체 결과}: 마지막 이벤트 (crawl_multiple_sources와 같은 구조)
+        """
+        results = {
+            'caseNumber': case_number,
+            'sources': {},
+            'combined': {},
+            'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        tasks = self.get_source_tasks(case_number, location, property_type)
+        logger.info(f"다중 소스 동시 크롤링 시작: {list(tasks)} (최대 {deadline}초)")
+        
+        collected = {}
+        task_results = iter_completed(tasks, max_workers=max_workers, deadline=deadline)
+        try:
+            for source_name, data, error in task_results:
+                if error:
+                    logger.warning(f"{source_name} 크롤링 실패: {error}")
+                    yield {'event': 'source_failed', 'source': source_name, 'error': str(error)}
+                elif data:
+                    collected[source_name] = data
+                    logger.info(f"{source_name} 크롤링 성공")
+                    yield {'event': 'source', 'source': source_name, 'data': data}
+                else:
+                    logger.warning(f"{source_name} 크롤링 실패")
+                    yield {'event': 'source_failed', 'source': source_name, 'error': '데이터 없음'}
+        finally:
+            # 스트리밍 중 연결이 끊기면 아직 시작하지 않은 작업 취소
+            task_results.close()
+        
+        # 완료 순서와 관계없이 순차 모드와 같은 소스 순서로 정렬
+        results['sources'] = {name: collected[name] for name in tasks if name in collected}
+        missing = [name for name in tasks if name not in collected]
+        if missing:
+            results['missingSources'] = missing
+        
+        results['combined'] = self.combine_and_analyze_data(results['sources'])
+        
+        yield {'event': 'combined', 'data': results}
+    
     def crawl_other_real_estate_sites(self, case_number, location, property_type):
         """기타 부동산 사이트 크롤링"""
         other_data = []
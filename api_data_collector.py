@@ -5,18 +5,19 @@ API 기반 부동산 데이터 수집 시스템
 공식 API와 비공식 API를 통한 데이터 수집
 """
 
-import requests
 import json
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+from task_runner import iter_completed
+from http_transport import create_session
 
 logger = logging.getLogger(__name__)
 
 class APIDataCollector:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
@@ -33,140 +34,156 @@ class APIDataCollector:
             'naver_real_estate': 'https://land.naver.com/api/auction'
         }
     
-    def collect_court_auction_data(self, case_number: str) -> Optional[Dict]:
+    def build_court_auction_request(self, case_number: str):
+        """법원경매 API 요청 정보 (method, url, 요청 옵션, 응답 JSON 파싱 함수)"""
+        # 실제 API 엔드포인트 (예시)
+        url = f"{self.api_endpoints['court_auction']}/search"
+        params = {
+            'caseNo': case_number,
+            'format': 'json'
+        }
+        return ('GET', url, {'params': params},
+                lambda data: self.parse_court_auction_api_data(data, case_number))
+    
+    def build_richgo_request(self, location: str, property_type: str):
+        """리치고 API 요청 정보"""
+        # 리치고 내부 API 호출
+        url = f"{self.api_endpoints['richgo']}/search"
+        payload = {
+            'location': location,
+            'propertyType': property_type,
+            'limit': 10
+        }
+        return ('POST', url, {'json': payload},
+                lambda data: self.parse_richgo_api_data(data, location, property_type))
+    
+    def build_naver_real_estate_request(self, location: str, property_type: str):
+        """네이버 부동산 API 요청 정보"""
+        # 네이버 부동산 API (비공식)
+        url = "https://land.naver.com/api/auction/search"
+        params = {
+            'q': location,
+            'type': property_type,
+            'page': 1,
+            'size': 10
+        }
+        return ('GET', url, {'params': params},
+                lambda data: self.parse_naver_api_data(data, location, property_type))
+    
+    def build_kb_real_estate_request(self, location: str, property_type: str):
+        """KB부동산 API 요청 정보"""
+        # KB부동산 공식 API
+        url = "https://api.kbland.kr/api/auction/search"
+        headers = {
+            'Authorization': 'Bearer YOUR_API_KEY',  # 실제 API 키 필요
+            'Content-Type': 'application/json'
+        }
+        
+        payload = {
+            'location': location,
+            'propertyType': property_type,
+            'dateFrom': (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'),
+            'dateTo': datetime.now().strftime('%Y-%m-%d')
+        }
+        return ('POST', url, {'json': payload, 'headers': headers},
+                lambda data: self.parse_kb_api_data(data, location, property_type))
+    
+    def get_api_requests(self, case_number: str, location: str, property_type: str) -> Dict:
+        """
+        소스 이름별 API 요청 정보 (순서가 결과 병합 순서)
+        동기 수집과 비동기 수집(async_crawl)이 함께 사용
+        """
+        return {
+            'court_auction': self.build_court_auction_request(case_number),
+            'richgo': self.build_richgo_request(location, property_type),
+            'naver': self.build_naver_real_estate_request(location, property_type),
+            'kb': self.build_kb_real_estate_request(location, property_type)
+        }
+    
+    def call_api(self, label: str, api_request, timeout: float = 10) -> Optional[Dict]:
+        """API 요청 정보대로 호출하고 응답 파싱 (200 응답이 아니면 None)"""
+        method, url, options, parse = api_request
+        response = self.session.request(method, url, timeout=timeout, **options)
+        
+        if response.status_code == 200:
+            return parse(response.json())
+        
+        logger.warning(f"{label} API 호출 실패: {response.status_code}")
+        return None
+    
+    def collect_court_auction_data(self, case_number: str, timeout: float = 10) -> Optional[Dict]:
         """법원경매 API 데이터 수집"""
         try:
-            # 실제 API 엔드포인트 (예시)
-            url = f"{self.api_endpoints['court_auction']}/search"
-            params = {
-                'caseNo': case_number,
-                'format': 'json'
-            }
-            
-            response = self.session.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return self.parse_court_auction_api_data(data, case_number)
-            else:
-                logger.warning(f"법원경매 API 호출 실패: {response.status_code}")
-                return None
-                
+            return self.call_api('법원경매', self.build_court_auction_request(case_number), timeout)
         except Exception as e:
             logger.error(f"법원경매 API 수집 실패: {e}")
             return None
     
-    def collect_richgo_data(self, location: str, property_type: str) -> Optional[Dict]:
+    def collect_richgo_data(self, location: str, property_type: str, timeout: float = 10) -> Optional[Dict]:
         """리치고 API 데이터 수집"""
         try:
-            # 리치고 내부 API 호출
-            url = f"{self.api_endpoints['richgo']}/search"
-            payload = {
-                'location': location,
-                'propertyType': property_type,
-                'limit': 10
-            }
-            
-            response = self.session.post(url, json=payload, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return self.parse_richgo_api_data(data, location, property_type)
-            else:
-                logger.warning(f"리치고 API 호출 실패: {response.status_code}")
-                return None
-                
+            return self.call_api('리치고', self.build_richgo_request(location, property_type), timeout)
         except Exception as e:
             logger.error(f"리치고 API 수집 실패: {e}")
             return None
     
-    def collect_naver_real_estate_data(self, location: str, property_type: str) -> Optional[Dict]:
+    def collect_naver_real_estate_data(self, location: str, property_type: str, timeout: float = 10) -> Optional[Dict]:
         """네이버 부동산 API 데이터 수집"""
         try:
-            # 네이버 부동산 API (비공식)
-            url = "https://land.naver.com/api/auction/search"
-            params = {
-                'q': location,
-                'type': property_type,
-                'page': 1,
-                'size': 10
-            }
-            
-            response = self.session.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return self.parse_naver_api_data(data, location, property_type)
-            else:
-                logger.warning(f"네이버 부동산 API 호출 실패: {response.status_code}")
-                return None
-                
+            return self.call_api('네이버 부동산', self.build_naver_real_estate_request(location, property_type), timeout)
         except Exception as e:
             logger.error(f"네이버 부동산 API 수집 실패: {e}")
             return None
     
-    def collect_kb_real_estate_data(self, location: str, property_type: str) -> Optional[Dict]:
+    def collect_kb_real_estate_data(self, location: str, property_type: str, timeout: float = 10) -> Optional[Dict]:
         """KB부동산 API 데이터 수집"""
         try:
-            # KB부동산 공식 API
-            url = "https://api.kbland.kr/api/auction/search"
-            headers = {
-                'Authorization': 'Bearer YOUR_API_KEY',  # 실제 API 키 필요
-                'Content-Type': 'application/json'
-            }
-            
-            payload = {
-                'location': location,
-                'propertyType': property_type,
-                'dateFrom': (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'),
-                'dateTo': datetime.now().strftime('%Y-%m-%d')
-            }
-            
-            response = self.session.post(url, json=payload, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return self.parse_kb_api_data(data, location, property_type)
-            else:
-                logger.warning(f"KB부동산 API 호출 실패: {response.status_code}")
-                return None
-                
+            return self.call_api('KB부동산', self.build_kb_real_estate_request(location, property_type), timeout)
         except Exception as e:
             logger.error(f"KB부동산 API 수집 실패: {e}")
             return None
     
-    def collect_multiple_api_data(self, case_number: str, location: str, property_type: str) -> Dict:
-        """다중 API에서 데이터 수집"""
-        results = {
-            'caseNumber': case_number,
-            'location': location,
-            'propertyType': property_type,
-            'sources': {},
-            'combined': {},
-            'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+    def collect_multiple_api_data(self, case_number: str, location: str, property_type: str,
+                                  concurrent: bool = False, timeout: float = 10,
+                                  deadline: Optional[float] = 15) -> Dict:
+        """
+        다중 API에서 데이터 수집
+
+        concurrent=True이면 API별 호출을 스레드 풀에서 동시에 실행한다.
+        각 호출은 timeout(초), 전체 수집은 deadline(초)으로 제한되며
+        제한 시간 안에 끝나지 않은 API는 결과에서 제외된다.
+        """
+        results = self.create_results(case_number, location, property_type)
+        
+        if concurrent:
+            # 마지막 통합 결과(combined) 이벤트만 사용
+            combined = None
+            for event in self.iter_multiple_api_data(case_number, location, property_type, timeout, deadline):
+                if event['event'] == 'combined':
+                    combined = event['data']
+            return combined
         
         # 1. 법원경매 API
         logger.info("법원경매 API 데이터 수집 시작...")
-        court_data = self.collect_court_auction_data(case_number)
+        court_data = self.collect_court_auction_data(case_number, timeout)
         if court_data:
             results['sources']['court_auction'] = court_data
         
         # 2. 리치고 API
         logger.info("리치고 API 데이터 수집 시작...")
-        richgo_data = self.collect_richgo_data(location, property_type)
+        richgo_data = self.collect_richgo_data(location, property_type, timeout)
         if richgo_data:
             results['sources']['richgo'] = richgo_data
         
         # 3. 네이버 부동산 API
         logger.info("네이버 부동산 API 데이터 수집 시작...")
-        naver_data = self.collect_naver_real_estate_data(location, property_type)
+        naver_data = self.collect_naver_real_estate_data(location, property_type, timeout)
         if naver_data:
             results['sources']['naver'] = naver_data
         
         # 4. KB부동산 API
         logger.info("KB부동산 API 데이터 수집 시작...")
-        kb_data = self.collect_kb_real_estate_data(location, property_type)
+        kb_data = self.collect_kb_real_estate_data(location, property_type, timeout)
         if kb_data:
             results['sources']['kb'] = kb_data
         
@@ -175,6 +192,66 @@ class APIDataCollector:
         
         return results
     
+    def iter_multiple_api_data(self, case_number: str, location: str, property_type: str,
+                               timeout: float = 10, deadline: Optional[float] = 15) -> Iterator[Dict]:
+        """
+        API별 호출을 동시에 실행하고 끝나는 대로 이벤트 생성 (스트리밍 응답용)
+
+        - {'event': 'source', 'source': 이름, 'data': 결과}: API 수집 성공
+        - {'event': 'source_failed', 'source': 이름, 'error': 사유}: API 수집 실패
+        - {'event': 'combined', 'data': 전체 결과}: 마지막 이벤트 (collect_multiple_api_data와 같은 구조)
+        """
+        results = self.create_results(case_number, location, property_type)
+        tasks = self.get_api_tasks(case_number, location, property_type, timeout)
+        logger.info(f"다중 API 동시 수집 시작: {list(tasks)} (최대 {deadline}초)")
+        
+        collected = {}
+        task_results = iter_completed(tasks, deadline=deadline)
+        try:
+            for source_name, data, error in task_results:
+                if error:
+                    logger.warning(f"{source_name} API 수집 실패: {error}")
+                    yield {'event': 'source_failed', 'source': source_name, 'error': str(error)}
+                elif data:
+                    collected[source_name] = data
+                    yield {'event': 'source', 'source': source_name, 'data': data}
+                else:
+                    yield {'event': 'source_failed', 'source': source_name, 'error': '데이터 없음'}
+        finally:
+            # 스트리밍 중 연결이 끊기면 아직 시작하지 않은 호출 취소
+            task_results.close()
+        
+        yield {'event': 'combined', 'data': self.merge_collected_data(results, list(tasks), collected)}
+    
+    def create_results(self, case_number: str, location: str, property_type: str) -> Dict:
+        """다중 API 수집 결과 기본 구조"""
+        return {
+            'caseNumber': case_number,
+            'location': location,
+            'propertyType': property_type,
+            'sources': {},
+            'combined': {},
+            'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+    
+    def merge_collected_data(self, results: Dict, source_names: List[str], collected: Dict) -> Dict:
+        """동시 수집 결과를 results에 병합 (완료 순서와 관계없이 순차 수집과 같은 소스 순서 유지)"""
+        results['sources'] = {name: collected[name] for name in source_names if name in collected}
+        missing = [name for name in source_names if name not in collected]
+        if missing:
+            results['missingSources'] = missing
+        results['combined'] = self.combine_api_data(results['sources'])
+        return results
+    
+    def get_api_tasks(self, case_number: str, location: str, property_type: str, timeout: float = 10) -> Dict:
+        """소스 이름별 API 수집 작업 (순서가 결과 병합 순서)"""
+        return {
+            'court_auction': lambda: self.collect_court_auction_data(case_number, timeout),
+            'richgo': lambda: self.collect_richgo_data(location, property_type, timeout),
+            'naver': lambda: self.collect_naver_real_estate_data(location, property_type, timeout),
+            'kb': lambda: self.collect_kb_real_estate_data(location, property_type, timeout)
+        }
+    
     def parse_court_auction_api_data(self, data: Dict, case_number: str) -> Dict:
         """법원경매 API 데이터 파싱"""
         try:
@@ -5,17 +5,35 @@ Flask 백엔드 서버
 경매 데이터 크롤링 API 제공
 """
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory
 from flask_cors import CORS
 import json
 import os
+import math
+import atexit
+import threading
+from datetime import datetime
+import numpy as np
 from auction_crawler import CourtAuctionCrawler
 from richgo_crawler import RichgoCrawler
 from advanced_crawler import AdvancedAuctionCrawler
 from api_data_collector import APIDataCollector
 from real_court_auction_crawler import RealCourtAuctionCrawler
 from official_api_integration import OfficialAPIIntegration
-from auction_statistics import AuctionStatisticsAnalyzer
+from auction_statistics import AuctionStatisticsAnalyzer, RANKING_METRICS
+from webdriver_pool import WebDriverPool
+from response_cache import ResponseCache, cached_json_response
+from single_flight import SingleFlight
+from crawl_result_store import CrawlResultStore
+from circuit_breaker import upstream_breakers
+from task_runner import iter_completed
+import bid_simulation
+import auction_costs
+from bid_optimizer import BidOptimizer
+from monte_carlo import MonteCarloSimulator, DEFAULT_BID_VOLATILITY
+from portfolio_simulation import PortfolioSimulator
+from scenario_sweep import ScenarioSweep, MARKET_CONDITIONS
+from probability_tables import ProbabilityTableStore, lookup as lookup_probability_table
 
 # Firebase 핸들러 추가
 try:
@@ -39,7 +57,7 @@ except Exception as e:
         firestore = None
 
 app = Flask(__name__)
-CORS(app)  # CORS 허용
+CORS(app, expose_headers=['ETag', 'X-Sale-Price-Rate', 'X-Probability-Table-Axes'])  # CORS 허용 (캐시 검증용 ETag, 확률 테이블 정보 노출)
 
 # 크롤러 인스턴스
 crawler = CourtAuctionCrawler()
@@ -50,6 +68,113 @@ real_crawler = RealCourtAuctionCrawler()
 official_api = OfficialAPIIntegration()
 statistics_analyzer = AuctionStatisticsAnalyzer()
 
+# 고급 크롤링용 WebDriver 풀 (요청마다 Chrome을 새로 띄우지 않고 재사용)
+webdriver_pool = WebDriverPool(
+    advanced_crawler.create_selenium_driver,
+    max_size=int(os.getenv('SELENIUM_POOL_SIZE', '2')),
+    max_uses=int(os.getenv('SELENIUM_POOL_MAX_USES', '50')),
+    checkout_timeout=float(os.getenv('SELENIUM_POOL_CHECKOUT_TIMEOUT', '30'))
+)
+advanced_crawler.driver_pool = webdriver_pool
+atexit.register(webdriver_pool.close)
+
+# 서버 시작 시 미리 띄워 둘 브라우저 수 (0이면 예열 안 함, import만 할 때는 예열하지 않음)
+SELENIUM_POOL_WARM = int(os.getenv('SELENIUM_POOL_WARM', '0'))
+
+def start_webdriver_warmup():
+    """서버 기동을 막지 않도록 백그라운드에서 브라우저 예열"""
+    threading.Thread(
+        target=webdriver_pool.warm,
+        args=(SELENIUM_POOL_WARM,),
+        name='webdriver-warmup',
+        daemon=True
+    ).start()
+
+# 통계 조회 API 응답 캐시 (통계를 다시 로드하면 analyzer.version이 바뀌어 무효화)
+statistics_cache = ResponseCache(max_bytes=int(os.getenv('STATISTICS_CACHE_BYTES', str(8 * 1024 * 1024))))
+statistics_cached = cached_json_response(statistics_cache, lambda: statistics_analyzer.version)
+
+# 매각통계 원본 파일 변경 확인 주기(초), 바뀐 지역만 다시 로드 (0이면 사용 안 함)
+STATISTICS_RELOAD_INTERVAL = float(os.getenv('STATISTICS_RELOAD_INTERVAL', '60'))
+
+# 같은 사건번호로 동시에 들어온 크롤링 요청은 하나만 실행하고 결과 공유
+crawl_flight = SingleFlight()
+
+# 실제 경매 데이터 저장소 (사건번호, 소스별 결과를 디스크에 보관)
+crawl_store = CrawlResultStore(os.getenv('CRAWL_STORE_PATH', 'crawl_results.sqlite3'))
+
+# 만료된 크롤링 결과 삭제 주기(초) (0이면 사용 안 함)
+CRAWL_STORE_PURGE_INTERVAL = float(os.getenv('CRAWL_STORE_PURGE_INTERVAL', '3600'))
+
+def start_background_tasks():
+    """
+    서버 프로세스의 백그라운드 스레드 시작 (import만 할 때는 시작하지 않음)
+    - 매각통계 원본 파일 변경 확인
+    - 만료된 크롤링 결과 삭제
+    """
+    if STATISTICS_RELOAD_INTERVAL > 0:
+        statistics_analyzer.start_watcher(STATISTICS_RELOAD_INTERVAL)
+        atexit.register(statistics_analyzer.stop_watcher)
+    if CRAWL_STORE_PURGE_INTERVAL > 0:
+        crawl_store.start_purger(CRAWL_STORE_PURGE_INTERVAL)
+        atexit.register(crawl_store.stop_purger)
+
+def stop_background_tasks():
+    """start_background_tasks로 시작한 스레드 중지"""
+    statistics_analyzer.stop_watcher()
+    crawl_store.stop_purger()
+
+# 실제 경매 데이터 소스 (저장소 소스 이름: 응답에 표시할 출처), 우선순위 순
+REAL_AUCTION_SOURCES = {
+    'official_api': '공식 API',
+    'real_crawl': '실제 크롤링'
+}
+
+# 백그라운드 갱신 중인 사건번호
+refreshing_cases = set()
+refreshing_lock = threading.Lock()
+
+# 업스트림 호스트별 서킷 브레이커 설정 (연속 실패 횟수, 차단 시간(초))
+upstream_breakers.failure_threshold = int(os.getenv('UPSTREAM_FAILURE_THRESHOLD', '3'))
+upstream_breakers.reset_timeout = float(os.getenv('UPSTREAM_RESET_TIMEOUT', '60'))
+
+# 실제 경매 데이터 일괄 조회 시 동시에 조회할 사건 수와 요청당 최대 사건 수
+REAL_AUCTION_BATCH_CONCURRENCY = int(os.getenv('REAL_AUCTION_BATCH_CONCURRENCY', '4'))
+REAL_AUCTION_BATCH_MAX_CASES = int(os.getenv('REAL_AUCTION_BATCH_MAX_CASES', '100'))
+
+# 다중 소스 동시 수집 시 요청당 전체 제한 시간(초)
+ADVANCED_CRAWL_DEADLINE = float(os.getenv('ADVANCED_CRAWL_DEADLINE', '60'))
+
+# 다중 API 동시 수집 시 API별 제한 시간과 요청당 전체 제한 시간(초)
+API_COLLECT_TIMEOUT = float(os.getenv('API_COLLECT_TIMEOUT', '10'))
+API_COLLECT_DEADLINE = float(os.getenv('API_COLLECT_DEADLINE', '15'))
+
+# 입찰 시뮬레이션 요청당 최대 계산 조합 수 (입찰가 × 경쟁자 수 × 입찰긴급도)
+SIMULATION_MAX_CELLS = int(os.getenv('SIMULATION_MAX_CELLS', '1000000'))
+
+# 몬테카를로 시뮬레이션 (프로세스 풀 크기, 샤드 수, 기본/최대 가상 경매 건수)
+monte_carlo = MonteCarloSimulator(
+    statistics_analyzer,
+    max_workers=int(os.getenv('MONTE_CARLO_WORKERS', '0')) or None,
+    shards=int(os.getenv('MONTE_CARLO_SHARDS', '8'))
+)
+atexit.register(monte_carlo.close)
+MONTE_CARLO_AUCTIONS = int(os.getenv('MONTE_CARLO_AUCTIONS', '1000000'))
+MONTE_CARLO_MAX_AUCTIONS = int(os.getenv('MONTE_CARLO_MAX_AUCTIONS', '10000000'))
+# 최대 경쟁자 수 (샤드 배치 메모리가 경매 건수 × 경쟁자 수에 비례)
+MONTE_CARLO_MAX_COMPETITORS = int(os.getenv('MONTE_CARLO_MAX_COMPETITORS', '100'))
+
+# 포트폴리오 일괄 시뮬레이션 (요청당 최대 물건 수, 한 번에 벡터 연산할 물건 수)
+portfolio_simulator = PortfolioSimulator(statistics_analyzer)
+PORTFOLIO_MAX_PROPERTIES = int(os.getenv('PORTFOLIO_MAX_PROPERTIES', '10000'))
+PORTFOLIO_CHUNK_SIZE = int(os.getenv('PORTFOLIO_CHUNK_SIZE', '1000'))
+
+# 권장 입찰가 시나리오 분석 요청당 최대 시나리오 수
+SWEEP_MAX_SCENARIOS = int(os.getenv('SWEEP_MAX_SCENARIOS', '100000'))
+
+# 구/군별 낙찰 확률 조회 테이블 (매각가율별로 한 번만 생성)
+probability_tables = ProbabilityTableStore(statistics_analyzer)
+
 @app.route('/')
 def serve_index():
     """메인 페이지 서빙"""
@@ -153,6 +278,14 @@ def get_richgo_data():
             'error': str(e)
         }), 500
 
+def get_crawl_request_error(case_number, location, property_type):
+    """크롤링 요청 값 검증 (단일 실행 키로 쓰이므로 사건번호는 문자열, 지역/물건 종류는 문자열 또는 null), 오류 메시지 또는 None"""
+    if not isinstance(case_number, str) or not case_number.strip():
+        return '사건번호가 필요합니다.'
+    if not all(value is None or isinstance(value, str) for value in (location, property_type)):
+        return 'location, propertyType은 문자열이어야 합니다.'
+    return None
+
 @app.route('/api/advanced-crawl', methods=['POST'])
 def advanced_crawl():
     """
@@ -164,13 +297,21 @@ def advanced_crawl():
         location = data.get('location')
         property_type = data.get('propertyType')
         
-        if not case_number:
-            return jsonify({'error': '사건번호가 필요합니다.'}), 400
+        error = get_crawl_request_error(case_number, location, property_type)
+        if error:
+            return jsonify({'error': error}), 400
         
         print(f"고급 크롤링 요청: {case_number}, {location}, {property_type}")
         
-        # 고급 크롤링 실행
-        results = advanced_crawler.crawl_multiple_sources(case_number, location, property_type)
+        # 고급 크롤링 실행 (기본: 소스별 동시 크롤링)
+        concurrent = bool(data.get('concurrent', True))
+        results = crawl_flight.do(
+            ('advanced-crawl', case_number.strip(), location, property_type, concurrent),
+            advanced_crawler.crawl_multiple_sources,
+            case_number, location, property_type,
+            concurrent=concurrent,
+            deadline=ADVANCED_CRAWL_DEADLINE
+        )
         
         if results and results['combined']['sources_count'] > 0:
             print(f"고급 크롤링 성공: {results['combined']['sources_count']}개 소스")
@@ -202,13 +343,22 @@ def api_collect():
         location = data.get('location')
         property_type = data.get('propertyType')
         
-        if not case_number:
-            return jsonify({'error': '사건번호가 필요합니다.'}), 400
+        error = get_crawl_request_error(case_number, location, property_type)
+        if error:
+            return jsonify({'error': error}), 400
         
         print(f"API 수집 요청: {case_number}, {location}, {property_type}")
         
         # API 기반 데이터 수집
-        results = api_collector.collect_multiple_api_data(case_number, location, property_type)
+        concurrent = bool(data.get('concurrent', True))
+        results = crawl_flight.do(
+            ('api-collect', case_number.strip(), location, property_type, concurrent),
+            api_collector.collect_multiple_api_data,
+            case_number, location, property_type,
+            concurrent=concurrent,
+            timeout=API_COLLECT_TIMEOUT,
+            deadline=API_COLLECT_DEADLINE
+        )
         
         if results and results['combined']['sources_count'] > 0:
             print(f"API 수집 성공: {results['combined']['sources_count']}개 소스")
@@ -229,6 +379,147 @@ def api_collect():
             'error': str(e)
         }), 500
 
+@app.route('/api/advanced-crawl/stream', methods=['POST'])
+def advanced_crawl_stream():
+    """
+    고급 크롤링 스트리밍 API - 소스별 결과를 끝나는 대로 전송하고 마지막에 통합 결과(combined) 전송
+    형식: NDJSON (기본) 또는 SSE (Accept: text/event-stream 또는 format: 'sse')
+    """
+    try:
+        data = request.get_json()
+        case_number = data.get('caseNumber')
+        location = data.get('location')
+        property_type = data.get('propertyType')
+        
+        error = get_crawl_request_error(case_number, location, property_type)
+        if error:
+            return jsonify({'error': error}), 400
+        
+        print(f"고급 크롤링 스트리밍 요청: {case_number}, {location}, {property_type}")
+        
+        # 같은 조건의 스트리밍 요청은 소스별 크롤링을 한 번만 실행하고 이벤트 공유
+        events = crawl_flight.stream(
+            ('advanced-crawl-stream', case_number.strip(), location, property_type),
+            advanced_crawler.iter_multiple_sources,
+            case_number, location, property_type,
+            deadline=ADVANCED_CRAWL_DEADLINE
+        )
+        return build_stream_response(events, wants_event_stream(data))
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/api-collect/stream', methods=['POST'])
+def api_collect_stream():
+    """
+    API 기반 데이터 수집 스트리밍 API - API별 결과를 끝나는 대로 전송하고 마지막에 통합 결과(combined) 전송
+    형식: NDJSON (기본) 또는 SSE (Accept: text/event-stream 또는 format: 'sse')
+    """
+    try:
+        data = request.get_json()
+        case_number = data.get('caseNumber')
+        location = data.get('location')
+        property_type = data.get('propertyType')
+        
+        error = get_crawl_request_error(case_number, location, property_type)
+        if error:
+            return jsonify({'error': error}), 400
+        
+        print(f"API 수집 스트리밍 요청: {case_number}, {location}, {property_type}")
+        
+        events = crawl_flight.stream(
+            ('api-collect-stream', case_number.strip(), location, property_type),
+            api_collector.iter_multiple_api_data,
+            case_number, location, property_type,
+            timeout=API_COLLECT_TIMEOUT,
+            deadline=API_COLLECT_DEADLINE
+        )
+        return build_stream_response(events, wants_event_stream(data))
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+def wants_event_stream(data):
+    """SSE 형식 요청 여부"""
+    return data.get('format') == 'sse' or 'text/event-stream' in request.headers.get('Accept', '')
+
+def build_stream_response(events, sse=False):
+    """이벤트({'event': 종류, ...})를 NDJSON 또는 SSE 스트리밍 응답으로 변환"""
+    if sse:
+        return Response(
+            (to_sse_event(event) for event in events),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+    return Response((to_ndjson_line(event) for event in events), mimetype='application/x-ndjson')
+
+def to_sse_event(payload):
+    """SSE 이벤트 하나 (event 필드를 SSE 이벤트 이름으로 사용)"""
+    return f"event: {payload['event']}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+def fetch_real_auction_data(case_number, race=True):
+    """
+    공식 API -> 실제 크롤링 순으로 실제 경매 데이터를 수집하고 결과 저장소에 기록
+    (저장소 소스 이름, 데이터) 반환, 실패하면 (None, None)
+    """
+    case_key = crawl_store.normalize_case_number(case_number)
+    
+    # 1. 공식 API 시도
+    real_data = crawl_flight.do(
+        ('official-api', case_key),
+        official_api.get_official_auction_data, case_number
+    )
+    if real_data:
+        return store_real_auction_data(case_number, 'official_api', real_data)
+    
+    # 2. 실제 크롤링 시도 (기본: 후보 소스 동시 요청 후 먼저 찾은 결과 사용)
+    real_data = crawl_flight.do(
+        ('real-auction-data', case_key, race),
+        real_crawler.get_real_auction_data, case_number, race=race
+    )
+    if real_data:
+        return store_real_auction_data(case_number, 'real_crawl', real_data)
+    
+    return None, None
+
+def store_real_auction_data(case_number, source, real_data):
+    """수집한 실제 경매 데이터를 저장소에 기록하고 (저장소 소스 이름, 데이터) 반환"""
+    print(f"{REAL_AUCTION_SOURCES[source]}에서 실제 데이터 수집 성공: {case_number}")
+    crawl_store.put(case_number, source, real_data, real_data.get('auctionDate'))
+    return source, real_data
+
+def get_stored_real_auction_data(case_number):
+    """저장소에서 실제 경매 데이터 조회 (신선한 결과 우선, 같으면 소스 우선순위 순)"""
+    stored_results = [crawl_store.get(case_number, source) for source in REAL_AUCTION_SOURCES]
+    stored_results = [stored for stored in stored_results if stored]
+    fresh_results = [stored for stored in stored_results if not stored.is_stale]
+    return (fresh_results or stored_results or [None])[0]
+
+def refresh_real_auction_data_async(case_number, race=True):
+    """오래된 저장 결과를 백그라운드에서 갱신 (같은 사건번호는 한 번만)"""
+    case_key = crawl_store.normalize_case_number(case_number)
+    with refreshing_lock:
+        if case_key in refreshing_cases:
+            return
+        refreshing_cases.add(case_key)
+    
+    def refresh():
+        try:
+            fetch_real_auction_data(case_number, race)
+        except Exception as e:
+            print(f"백그라운드 갱신 실패: {case_number}, {e}")
+        finally:
+            with refreshing_lock:
+                refreshing_cases.discard(case_key)
+    
+    threading.Thread(target=refresh, daemon=True).start()
+
 @app.route('/api/real-auction-data', methods=['POST'])
 def get_real_auction_data():
     """
@@ -238,49 +529,770 @@ def get_real_auction_data():
         data = request.get_json()
         case_number = data.get('caseNumber')
         
-        if not case_number:
+        # 저장소 키를 만들기 전에 문자열인지 확인
+        if not isinstance(case_number, str) or not case_number.strip():
             return jsonify({'error': '사건번호가 필요합니다.'}), 400
         
         print(f"실제 경매 데이터 요청: {case_number}")
+        race = data.get('race', True)
         
-        # 1. 공식 API 시도
-        real_data = official_api.get_official_auction_data(case_number)
-        if real_data:
-            print(f"공식 API에서 실제 데이터 수집 성공: {case_number}")
-            return jsonify({
-                'success': True,
-                'data': real_data,
-                'source': '공식 API'
-            })
+        payload, status = lookup_real_auction_data(case_number, race)
+        return jsonify(payload), status
         
-        # 2. 실제 크롤링 시도
-        real_data = real_crawler.get_real_auction_data(case_number)
-        if real_data:
-            print(f"실제 크롤링으로 데이터 수집 성공: {case_number}")
-            return jsonify({
-                'success': True,
-                'data': real_data,
-                'source': '실제 크롤링'
-            })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+def lookup_real_auction_data(case_number, race=True):
+    """
+    저장소 -> 공식 API -> 실제 크롤링 -> 시뮬레이션 순으로 실제 경매 데이터 조회
+    (응답 본문, 상태 코드) 반환
+    """
+    # 0. 저장된 결과가 있으면 바로 응답 (오래된 결과면 백그라운드에서 갱신)
+    stored = get_stored_real_auction_data(case_number)
+    if stored:
+        if stored.is_stale:
+            refresh_real_auction_data_async(case_number, race)
+        return build_stored_real_auction_response(stored), 200
+    
+    # 1~2. 공식 API, 실제 크롤링 시도
+    source, real_data = fetch_real_auction_data(case_number, race)
+    if real_data:
+        return build_real_auction_response(source, real_data), 200
+    
+    # 3. 실패시 시뮬레이션 데이터 반환
+    simulation_response = build_simulation_response(case_number)
+    if simulation_response:
+        return simulation_response, 200
+    
+    return {
+        'success': False,
+        'error': '데이터를 수집할 수 없습니다.'
+    }, 404
+
+def build_stored_real_auction_response(stored):
+    """저장소 결과 응답 본문"""
+    return {
+        'success': True,
+        'data': stored.payload,
+        'source': REAL_AUCTION_SOURCES[stored.source],
+        'cached': True,
+        'stale': stored.is_stale,
+        'fetchedAt': datetime.fromtimestamp(stored.fetched_at).strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+def build_real_auction_response(source, real_data):
+    """새로 수집한 실제 데이터 응답 본문"""
+    return {
+        'success': True,
+        'data': real_data,
+        'source': REAL_AUCTION_SOURCES[source]
+    }
+
+def build_simulation_response(case_number):
+    """실제 데이터를 찾지 못했을 때의 시뮬레이션 데이터 응답 본문 (생성 실패 시 None)"""
+    print(f"실제 데이터 수집 실패, 시뮬레이션 데이터 반환: {case_number}")
+    simulation_data = crawler.get_auction_data(case_number)
+    if not simulation_data:
+        return None
+    
+    simulation_data['isRealData'] = False
+    simulation_data['dataQuality'] = '낮음 (시뮬레이션)'
+    return {
+        'success': True,
+        'data': simulation_data,
+        'source': '시뮬레이션',
+        'warning': '실제 데이터를 찾을 수 없어 시뮬레이션 데이터를 제공합니다.'
+    }
+
+@app.route('/api/real-auction-data/batch', methods=['POST'])
+def get_real_auction_data_batch():
+    """
+    실제 경매 데이터 일괄 조회 API
+    사건번호별 결과를 끝나는 순서대로 NDJSON 한 줄씩 스트리밍하고 마지막 줄에 요약 전송
+    """
+    try:
+        data = request.get_json()
+        case_numbers = data.get('caseNumbers')
+        
+        if not isinstance(case_numbers, list) or not case_numbers:
+            return jsonify({'error': '사건번호 목록이 필요합니다.'}), 400
         
-        # 3. 실패시 시뮬레이션 데이터 반환
-        print(f"실제 데이터 수집 실패, 시뮬레이션 데이터 반환: {case_number}")
-        simulation_data = crawler.get_auction_data(case_number)
-        if simulation_data:
-            simulation_data['isRealData'] = False
-            simulation_data['dataQuality'] = '낮음 (시뮬레이션)'
+        # 공백만 다른 중복 사건번호는 한 번만 조회 (처음 나온 순서 유지)
+        unique_cases = {}
+        for case_number in case_numbers:
+            if isinstance(case_number, str) and case_number.strip():
+                unique_cases.setdefault(crawl_store.normalize_case_number(case_number), case_number.strip())
+        
+        if not unique_cases:
+            return jsonify({'error': '사건번호 목록이 필요합니다.'}), 400
+        
+        if len(unique_cases) > REAL_AUCTION_BATCH_MAX_CASES:
             return jsonify({
-                'success': True,
-                'data': simulation_data,
-                'source': '시뮬레이션',
-                'warning': '실제 데이터를 찾을 수 없어 시뮬레이션 데이터를 제공합니다.'
-            })
+                'success': False,
+                'error': f'한 번에 최대 {REAL_AUCTION_BATCH_MAX_CASES}건까지 조회할 수 있습니다.'
+            }), 400
+        
+        print(f"실제 경매 데이터 일괄 요청: {len(unique_cases)}건")
+        race = data.get('race', True)
         
+        return Response(
+            stream_real_auction_batch(list(unique_cases.values()), race),
+            mimetype='application/x-ndjson'
+        )
+        
+    except Exception as e:
         return jsonify({
             'success': False,
-            'error': '데이터를 수집할 수 없습니다.'
-        }), 404
-        
+            'error': str(e)
+        }), 500
+
+def stream_real_auction_batch(case_numbers, race=True):
+    """
+    사건번호별 조회 결과를 NDJSON 줄로 생성
+    저장소에 있는 결과를 먼저 보내고, 나머지는 REAL_AUCTION_BATCH_CONCURRENCY건씩 동시에 조회하여 끝나는 순서대로 전송
+    """
+    succeeded = 0
+    pending_cases = []
+    
+    for case_number in case_numbers:
+        stored = get_stored_real_auction_data(case_number)
+        if stored:
+            if stored.is_stale:
+                refresh_real_auction_data_async(case_number, race)
+            succeeded += 1
+            yield to_ndjson_line(dict(build_stored_real_auction_response(stored), caseNumber=case_number, status=200))
+        else:
+            pending_cases.append(case_number)
+    
+    tasks = {
+        case_number: lambda case_number=case_number: lookup_real_auction_data(case_number, race)
+        for case_number in pending_cases
+    }
+    results = iter_completed(tasks, max_workers=REAL_AUCTION_BATCH_CONCURRENCY)
+    try:
+        for case_number, result, error in results:
+            if error:
+                payload, status = {'success': False, 'error': str(error)}, 500
+            else:
+                payload, status = result
+            
+            if status == 200:
+                succeeded += 1
+            yield to_ndjson_line(dict(payload, caseNumber=case_number, status=status))
+    finally:
+        # 클라이언트 연결이 끊기면 아직 시작하지 않은 조회 취소
+        results.close()
+    
+    yield to_ndjson_line({'done': True, 'total': len(case_numbers), 'succeeded': succeeded})
+
+def to_ndjson_line(payload):
+    """NDJSON 스트림의 한 줄"""
+    return json.dumps(payload, ensure_ascii=False) + '\n'
+
+@app.route('/api/simulate', methods=['POST'])
+def simulate_bids():
+    """
+    입찰 시뮬레이션 API
+    입찰가 구간 × 경쟁자 수 × 입찰긴급도 전체 조합의 낙찰 확률과 수익률을 한 번에 계산
+    (bidPrice를 보내면 최적 입찰가도 함께 계산)
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        try:
+            params = parse_simulation_request(data)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
+        result = bid_simulation.simulate_bid_grid(
+            params['bidPrices'], params['marketPrice'],
+            params['competitorCounts'], params['urgencies'],
+            params['failedCount'], params['salePriceRate'], params['renovationCost']
+        )
+        simulation = {
+            'bidPrices': params['bidPrices'],
+            'competitorCounts': params['competitorCounts'],
+            'urgencies': [bid_simulation.normalize_urgency(u) for u in params['urgencies']],
+            'priceRatios': result['price_ratios'].tolist(),
+            'probabilities': result['probabilities'].tolist(),
+            'profits': result['profits'].tolist(),
+            'expectedProfits': result['expected_profits'].tolist()
+        }
+
+        if params['bidPrice'] is not None:
+            simulation['optimalBid'] = bid_simulation.calculate_optimal_bid(
+                params['bidPrice'], params['marketPrice'], params['appraisalPrice'], params['minimumBid'],
+                params['competitorCounts'][0], params['urgencies'][0], params['failedCount'],
+                params['renovationCost'], params['auctionType'], params['salePriceRate']
+            )
+
+        return jsonify({
+            'success': True,
+            'data': simulation
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/simulate/optimal-bid', methods=['POST'])
+def simulate_optimal_bid():
+    """
+    최적 입찰가 탐색 API
+    mode=profit(기본값): 리스크 조정 수익률이 가장 높은 입찰가
+    mode=probability: 목표 낙찰 확률(targetProbability, 없으면 입찰긴급도별 목표 범위 중앙값)에 도달하는 가장 낮은 입찰가
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        mode = data.get('mode', 'profit')
+        if mode not in ('profit', 'probability'):
+            return jsonify({
+                'success': False,
+                'error': 'mode는 profit 또는 probability여야 합니다.'
+            }), 400
+
+        try:
+            params = parse_simulation_request(data)
+            precision = float(data.get('precision', 1000))
+            target_probability = data.get('targetProbability')
+            target_probability = float(target_probability) if target_probability is not None else None
+            low = float(data['lowerBound']) if data.get('lowerBound') is not None else None
+            high = float(data['upperBound']) if data.get('upperBound') is not None else None
+            if not all(math.isfinite(value) for value in (precision, target_probability, low, high) if value is not None):
+                raise ValueError('precision, targetProbability, lowerBound, upperBound는 숫자여야 합니다.')
+            if precision < 1:
+                raise ValueError('precision은 1원 이상이어야 합니다.')
+            if target_probability is not None and not 0 < target_probability <= 1:
+                raise ValueError('targetProbability는 0 초과 1 이하여야 합니다.')
+
+            optimizer = BidOptimizer(
+                params['marketPrice'], params['appraisalPrice'], params['minimumBid'],
+                params['competitorCounts'][0], params['urgencies'][0], params['failedCount'],
+                params['salePriceRate'], params['renovationCost'], data.get('marketCondition', 'normal')
+            )
+            low, high = optimizer.get_bounds(low, high)
+            if precision > high - low:
+                raise ValueError(f'precision은 탐색 구간 크기({high - low:.0f}원) 이하여야 합니다.')
+            if mode == 'profit':
+                result = optimizer.solve_max_profit(precision, low, high)
+            else:
+                result = optimizer.solve_target_probability(target_probability, precision, low, high)
+        except (TypeError, ValueError) as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
+        result['mode'] = mode
+        return jsonify({
+            'success': True,
+            'data': result
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/simulate/portfolio', methods=['POST'])
+def simulate_portfolio():
+    """
+    포트폴리오 일괄 시뮬레이션 API
+    물건 목록의 권장 입찰가, 낙찰 확률, 예상 수익률을 PORTFOLIO_CHUNK_SIZE개씩 계산하여 스트리밍
+    형식: NDJSON (기본) 또는 SSE (Accept: text/event-stream 또는 format: 'sse')
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        properties = data.get('properties')
+
+        if not isinstance(properties, list) or not properties:
+            return jsonify({'error': '물건 목록이 필요합니다.'}), 400
+
+        if len(properties) > PORTFOLIO_MAX_PROPERTIES:
+            return jsonify({
+                'success': False,
+                'error': f'한 번에 최대 {PORTFOLIO_MAX_PROPERTIES}건까지 시뮬레이션할 수 있습니다.'
+            }), 400
+
+        print(f"포트폴리오 시뮬레이션 요청: {len(properties)}건")
+
+        events = portfolio_simulator.iter_results(properties, PORTFOLIO_CHUNK_SIZE)
+        return build_stream_response(events, wants_event_stream(data))
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/simulate/costs', methods=['POST'])
+def simulate_costs():
+    """
+    경매 부대비용 일괄 계산 API
+    입찰가 목록(bidPrices, 없으면 최저입찰가의 80% ~ 감정가의 120% 구간)의 항목별 부대비용을 한 번에 계산
+    propertyType(s), homeCount(s)는 하나의 값 또는 입찰가와 같은 길이의 목록
+    marketPrice를 보내면 입찰가별 예상 수익률(%) 곡선도 함께 계산
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+
+        def to_array(name, single_name, default, dtype=float):
+            values = data.get(name, data.get(single_name, default))
+            try:
+                values = np.atleast_1d(np.asarray(values, dtype=dtype))
+            except (TypeError, ValueError):
+                raise ValueError(f'{name}는 숫자 또는 숫자 목록이어야 합니다.')
+            if values.ndim > 1 or values.size == 0:
+                raise ValueError(f'{name}는 하나의 값 또는 목록이어야 합니다.')
+            if dtype is float and not np.all(np.isfinite(values)):
+                raise ValueError(f'{name}는 숫자 또는 숫자 목록이어야 합니다.')
+            return values
+
+        def to_number(name, default):
+            value = data.get(name, default)
+            if value is None:
+                return None
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f'{name}는 숫자여야 합니다.')
+            if not math.isfinite(number):
+                raise ValueError(f'{name}는 숫자여야 합니다.')
+            return number
+
+        try:
+            if data.get('bidPrices', data.get('bidPrice')) is not None:
+                bid_prices = to_array('bidPrices', 'bidPrice', None)
+            else:
+                minimum_bid = to_number('minimumBid', None) or 0
+                appraisal_price = to_number('appraisalPrice', None) or 0
+                grid_points = int(data.get('gridPoints', 10))
+                if minimum_bid <= 0 or appraisal_price <= 0 or grid_points < 2:
+                    raise ValueError('bidPrices 또는 minimumBid, appraisalPrice, gridPoints(2 이상)가 필요합니다.')
+                # 입찰가 구간을 만들기 전에 개수부터 제한
+                if grid_points > SIMULATION_MAX_CELLS:
+                    raise ValueError(f'입찰가 수({grid_points})가 최대 {SIMULATION_MAX_CELLS}개를 초과합니다.')
+                bid_prices = bid_simulation.create_bid_grid(minimum_bid, appraisal_price, grid_points)
+
+            property_types = to_array('propertyTypes', 'propertyType', '아파트', dtype=object)
+            home_counts = to_array('homeCounts', 'homeCount', 1)
+            renovation_cost = to_number('renovationCost', 0) or 0
+            market_price = to_number('marketPrice', None)
+
+            if any(values.size not in (1, bid_prices.size) for values in (property_types, home_counts)):
+                raise ValueError('propertyTypes, homeCounts 목록은 입찰가 목록과 길이가 같아야 합니다.')
+            if np.any(bid_prices <= 0):
+                raise ValueError('입찰가는 0보다 커야 합니다.')
+            if len(bid_prices) > SIMULATION_MAX_CELLS:
+                raise ValueError(f'입찰가 수({len(bid_prices)})가 최대 {SIMULATION_MAX_CELLS}개를 초과합니다.')
+
+            costs = auction_costs.calculate_detailed_auction_costs(bid_prices, property_types, home_counts)
+        except (TypeError, ValueError) as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
+        result = {
+            'bidPrices': costs['bid_price'].tolist(),
+            'deposit': costs['deposit'].tolist(),
+            'acquisitionTax': costs['acquisition_tax'].tolist(),
+            'localEducationTax': costs['local_education_tax'].tolist(),
+            'ruralSpecialTax': costs['rural_special_tax'].tolist(),
+            'totalTaxes': costs['total_taxes'].tolist(),
+            'housingBond': costs['housing_bond'].tolist(),
+            'totalRegistrationFees': costs['total_registration_fees'].tolist(),
+            'legalFee': costs['legal_fee'].tolist(),
+            'unpaidUtilities': costs['unpaid_utilities'].tolist(),
+            'totalAdditionalCosts': costs['total_additional_costs'].tolist(),
+            'totalInvestment': costs['total_investment'].tolist(),
+            'costPercentage': costs['cost_percentage'].tolist()
+        }
+
+        if market_price is not None:
+            result['expectedProfits'] = bid_simulation.calculate_expected_profit(
+                market_price, costs['total_investment'] + renovation_cost
+            ).tolist()
+
+        return jsonify({
+            'success': True,
+            'data': result
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/simulate/sweep', methods=['POST'])
+def simulate_sweep():
+    """
+    권장 입찰가 시나리오 분석 API
+    경쟁자 수, 입찰긴급도, 시장 상황, 수리비 조합(factors)별 권장 입찰가와 수익률을 한 번에 계산하고
+    요인별 토네이도(민감도) 표 반환
+    design: factorial(기본값, 완전요인 설계) 또는 lhs(라틴 하이퍼큐브, samples개)
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        design = data.get('design', 'factorial')
+        if design not in ('factorial', 'lhs'):
+            return jsonify({
+                'success': False,
+                'error': 'design은 factorial 또는 lhs여야 합니다.'
+            }), 400
+
+        try:
+            params = parse_simulation_request(data)
+            if params['bidPrice'] is None:
+                raise ValueError('bidPrice 값이 필요합니다.')
+            samples = int(data.get('samples', 1000))
+            seed = int(data['seed']) if data.get('seed') is not None else None
+            if samples < 1:
+                raise ValueError('samples는 1 이상이어야 합니다.')
+            if data.get('factors') is not None and not isinstance(data['factors'], dict):
+                raise ValueError('factors는 요인별 값 목록 객체여야 합니다.')
+
+            sweep = ScenarioSweep(
+                params['marketPrice'], params['appraisalPrice'], params['minimumBid'], params['bidPrice'],
+                params['failedCount'], params['salePriceRate'], params['auctionType']
+            )
+            factors = sweep.normalize_factors(data.get('factors'), design)
+            scenario_count = sweep.count_scenarios(factors, design, samples)
+            if scenario_count > SWEEP_MAX_SCENARIOS:
+                raise ValueError(f'시나리오 수({scenario_count})가 최대 {SWEEP_MAX_SCENARIOS}개를 초과합니다.')
+
+            base = {
+                'competitorCount': params['competitorCounts'][0],
+                'urgency': params['urgencies'][0],
+                'marketCondition': data.get('marketCondition', 'normal'),
+                'renovationCost': params['renovationCost']
+            }
+            if base['marketCondition'] not in MARKET_CONDITIONS:
+                raise ValueError('marketCondition은 hot, normal, cold 중 하나여야 합니다.')
+        except (TypeError, ValueError) as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
+        print(f"시나리오 분석 요청: {design}, {scenario_count}개 시나리오")
+
+        return jsonify({
+            'success': True,
+            'data': sweep.run(base, factors, design, samples, seed)
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/probability-table', methods=['GET'])
+def get_probability_table():
+    """
+    구/군별 낙찰 확률 테이블 API (NumPy .npy 바이너리, float32)
+    축: (입찰긴급도, 경쟁자 수, 유찰 횟수, 가격비율), 축 정보는 X-Probability-Table-Axes 헤더(JSON)
+    """
+    try:
+        region = request.args.get('region', '')
+        district = request.args.get('district', '')
+
+        if not region:
+            return jsonify({
+                'success': False,
+                'error': '지역 정보가 필요합니다.'
+            }), 400
+
+        entry = probability_tables.get_district_table(region, district)
+        if not entry:
+            return jsonify({
+                'success': False,
+                'error': f'{region} {district} 데이터를 찾을 수 없습니다.'
+            }), 404
+
+        if request.if_none_match.contains(entry['etag']):
+            response = Response(status=304)
+        else:
+            response = Response(entry['npy'], mimetype='application/octet-stream')
+            response.headers['Content-Disposition'] = 'inline; filename="probability_table.npy"'
+        response.set_etag(entry['etag'])
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Sale-Price-Rate'] = str(entry['sale_price_rate'])
+        response.headers['X-Probability-Table-Axes'] = probability_tables.get_axes_header()
+        return response
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/probability-table/lookup', methods=['POST'])
+def lookup_probability():
+    """
+    구/군별 낙찰 확률 테이블 조회 API
+    가격비율 목록(priceRatios)의 낙찰 확률을 모델 재계산 없이 테이블에서 조회 (interpolate: 선형 보간 여부)
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        region = data.get('region', '')
+        district = data.get('district', '')
+
+        if not region:
+            return jsonify({
+                'success': False,
+                'error': '지역 정보가 필요합니다.'
+            }), 400
+
+        try:
+            price_ratios = data.get('priceRatios', data.get('priceRatio'))
+            if price_ratios is None:
+                raise ValueError
+            price_ratios = np.asarray(price_ratios, dtype=float)
+            competitor_count = float(data.get('competitorCount', 5))
+            failed_count = float(data.get('failedCount', 0))
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': 'priceRatios는 숫자 또는 숫자 목록이어야 합니다.'
+            }), 400
+
+        if not (math.isfinite(competitor_count) and math.isfinite(failed_count)):
+            return jsonify({
+                'success': False,
+                'error': 'competitorCount, failedCount는 숫자여야 합니다.'
+            }), 400
+
+        entry = probability_tables.get_district_table(region, district)
+        if not entry:
+            return jsonify({
+                'success': False,
+                'error': f'{region} {district} 데이터를 찾을 수 없습니다.'
+            }), 404
+
+        probabilities = lookup_probability_table(
+            entry['table'], price_ratios, competitor_count,
+            data.get('urgency', '보통'), failed_count,
+            interpolate=bool(data.get('interpolate', False))
+        )
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'salePriceRate': entry['sale_price_rate'],
+                'probabilities': probabilities.tolist()
+            }
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+def parse_simulation_request(data):
+    """시뮬레이션 요청 값 검증 및 기본값 적용 (잘못된 값이면 ValueError)"""
+    def to_number(name, default=None):
+        value = data.get(name, default)
+        if value is None:
+            raise ValueError(f'{name} 값이 필요합니다.')
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f'{name}는 숫자여야 합니다.')
+        if not math.isfinite(number):
+            raise ValueError(f'{name}는 숫자여야 합니다.')
+        return number
+
+    def to_numbers(name, single_name, default):
+        values = data.get(name, data.get(single_name, default))
+        if not isinstance(values, list):
+            values = [values]
+        if not values:
+            raise ValueError(f'{name}가 비어 있습니다.')
+        try:
+            numbers = [float(v) for v in values]
+        except (TypeError, ValueError):
+            raise ValueError(f'{name}는 숫자 목록이어야 합니다.')
+        if not all(math.isfinite(v) for v in numbers):
+            raise ValueError(f'{name}는 숫자 목록이어야 합니다.')
+        return numbers
+
+    params = {
+        'marketPrice': to_number('marketPrice'),
+        'appraisalPrice': to_number('appraisalPrice'),
+        'minimumBid': to_number('minimumBid'),
+        'failedCount': to_number('failedCount', 0),
+        'salePriceRate': to_number('salePriceRate', bid_simulation.DEFAULT_SALE_PRICE_RATE),
+        'renovationCost': to_number('renovationCost', 0),
+        'auctionType': data.get('auctionType', 'realEstate'),
+        'bidPrice': to_number('bidPrice') if data.get('bidPrice') is not None else None,
+        'competitorCounts': to_numbers('competitorCounts', 'competitorCount', 5)
+    }
+
+    if params['marketPrice'] <= 0 or params['appraisalPrice'] <= 0 or params['minimumBid'] <= 0:
+        raise ValueError('marketPrice, appraisalPrice, minimumBid는 0보다 커야 합니다.')
+
+    urgencies = data.get('urgencies', data.get('urgency', '보통'))
+    params['urgencies'] = urgencies if isinstance(urgencies, list) and urgencies else [urgencies]
+
+    # 입찰가 목록이 없으면 최저입찰가의 80% ~ 감정가의 120% 구간 (gridPoints개)
+    if data.get('bidPrices') is not None:
+        params['bidPrices'] = to_numbers('bidPrices', 'bidPrices', None)
+    else:
+        grid_points = int(to_number('gridPoints', 10))
+        if grid_points < 2:
+            raise ValueError('gridPoints는 2 이상이어야 합니다.')
+        # 입찰가 구간을 만들기 전에 개수부터 제한
+        if grid_points > SIMULATION_MAX_CELLS:
+            raise ValueError(f'입찰가 수({grid_points})가 최대 {SIMULATION_MAX_CELLS}개를 초과합니다.')
+        params['bidPrices'] = bid_simulation.create_bid_grid(
+            params['minimumBid'], params['appraisalPrice'], grid_points
+        ).tolist()
+
+    cells = len(params['bidPrices']) * len(params['competitorCounts']) * len(params['urgencies'])
+    if cells > SIMULATION_MAX_CELLS:
+        raise ValueError(f'계산 조합 수({cells})가 최대 {SIMULATION_MAX_CELLS}개를 초과합니다.')
+
+    return params
+
+@app.route('/api/simulate/monte-carlo', methods=['POST'])
+def simulate_monte_carlo():
+    """
+    몬테카를로 낙찰 확률 API
+    구/군별 매각률, 매각가율로 가상 경매를 반복 실행하여 입찰가별 낙찰 확률과 95% 신뢰구간 반환
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+
+        try:
+            appraisal_price = float(data.get('appraisalPrice') or 0)
+            minimum_bid = float(data.get('minimumBid') or 0)
+            competitor_count = int(data.get('competitorCount', 5))
+            failed_count = float(data.get('failedCount', 0))
+            volatility = float(data.get('volatility', DEFAULT_BID_VOLATILITY))
+            auctions = int(data.get('auctions', MONTE_CARLO_AUCTIONS))
+            seed = int(data['seed']) if data.get('seed') is not None else None
+            grid_points = int(data.get('gridPoints', 25))
+            bid_prices = data.get('bidPrices')
+            if isinstance(bid_prices, list):
+                bid_prices = [float(price) for price in bid_prices]
+            sale_rate = float(data['saleRate']) if data.get('saleRate') is not None else None
+            sale_price_rate = float(data['salePriceRate']) if data.get('salePriceRate') is not None else None
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': '시뮬레이션 값은 숫자여야 합니다.'
+            }), 400
+
+        if bid_prices is not None and not isinstance(bid_prices, list):
+            return jsonify({
+                'success': False,
+                'error': 'bidPrices는 배열이어야 합니다.'
+            }), 400
+
+        # 입찰가 목록을 만들기 전에 개수부터 제한
+        point_count = grid_points if bid_prices is None else len(bid_prices)
+        if not 1 <= point_count <= SIMULATION_MAX_CELLS:
+            return jsonify({
+                'success': False,
+                'error': f'입찰가 수는 1 이상 {SIMULATION_MAX_CELLS} 이하여야 합니다.'
+            }), 400
+
+        numbers = [appraisal_price, minimum_bid, failed_count, volatility, sale_rate, sale_price_rate] + (bid_prices or [])
+        if not all(math.isfinite(value) for value in numbers if value is not None):
+            return jsonify({
+                'success': False,
+                'error': '시뮬레이션 값은 숫자여야 합니다.'
+            }), 400
+
+        if sale_rate is not None and not 0 < sale_rate <= 100:
+            return jsonify({
+                'success': False,
+                'error': 'saleRate는 0 초과 100 이하여야 합니다.'
+            }), 400
+
+        if sale_price_rate is not None and sale_price_rate <= 0:
+            return jsonify({
+                'success': False,
+                'error': 'salePriceRate는 0보다 커야 합니다.'
+            }), 400
+
+        if appraisal_price <= 0 or minimum_bid <= 0:
+            return jsonify({
+                'success': False,
+                'error': '감정가와 최저입찰가가 필요합니다.'
+            }), 400
+
+        if not 1 <= competitor_count <= MONTE_CARLO_MAX_COMPETITORS:
+            return jsonify({
+                'success': False,
+                'error': f'competitorCount는 1 이상 {MONTE_CARLO_MAX_COMPETITORS} 이하여야 합니다.'
+            }), 400
+
+        if not 1 <= auctions <= MONTE_CARLO_MAX_AUCTIONS:
+            return jsonify({
+                'success': False,
+                'error': f'auctions는 1 이상 {MONTE_CARLO_MAX_AUCTIONS} 이하여야 합니다.'
+            }), 400
+
+        if bid_prices is None:
+            bid_prices = np.linspace(minimum_bid, appraisal_price * 1.2, grid_points).tolist()
+
+        # 매각률, 매각가율을 직접 보내지 않으면 구/군 통계 사용
+        market = monte_carlo.get_market_parameters(data.get('region'), data.get('district'))
+        if sale_rate is not None:
+            market['sale_rate'] = sale_rate
+            market['source'] = 'request'
+        if sale_price_rate is not None:
+            market['sale_price_rate'] = sale_price_rate
+            market['source'] = 'request'
+
+        print(f"몬테카를로 시뮬레이션 요청: {auctions}건, {len(bid_prices)}개 입찰가 ({market['source']})")
+
+        result = monte_carlo.simulate(
+            [price / appraisal_price for price in bid_prices],
+            minimum_bid / appraisal_price,
+            competitor_count=competitor_count,
+            sale_rate=market['sale_rate'],
+            sale_price_rate=market['sale_price_rate'],
+            failed_count=failed_count,
+            urgency=data.get('urgency', '보통'),
+            volatility=volatility,
+            auctions=auctions,
+            seed=seed
+        )
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'bidPrices': bid_prices,
+                'bidRatios': result['bid_ratios'].tolist(),
+                'winProbabilities': result['probabilities'].tolist(),
+                'lower': result['lower'].tolist(),
+                'upper': result['upper'].tolist(),
+                'auctions': result['auctions'],
+                # 128비트 시드는 JS 숫자로 표현할 수 없으므로 문자열로 반환
+                'seed': str(result['seed']),
+                'market': {
+                    'saleRate': market['sale_rate'],
+                    'salePriceRate': market['sale_price_rate'],
+                    'source': market['source']
+                },
+                'elapsed': round(result['elapsed'], 4)
+            }
+        })
+
     except Exception as e:
         return jsonify({
             'success': False,
@@ -304,6 +1316,28 @@ def get_api_key_info():
             'error': str(e)
         }), 500
 
+@app.route('/api/upstream-health', methods=['GET'])
+def get_upstream_health():
+    """
+    업스트림 호스트별 서킷 브레이커 상태 API (모니터링용)
+    """
+    try:
+        return jsonify({
+            'success': True,
+            'data': {
+                'hosts': upstream_breakers.get_status(),
+                'negativeCache': {
+                    'officialApi': len(official_api.negative_cache),
+                    'realCrawl': len(real_crawler.negative_cache)
+                }
+            }
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/regional-stats', methods=['GET'])
 def get_regional_stats():
     """
@@ -350,6 +1384,7 @@ def get_regional_stats():
         }), 500
 
 @app.route('/api/statistics/district', methods=['POST'])
+@statistics_cached
 def get_district_statistics():
     """지역별 구/군 통계 정보 조회"""
     try:
@@ -369,11 +1404,20 @@ def get_district_statistics():
                 'success': True,
                 'data': stats
             })
-        else:
+        
+        # 여러 구/군에 해당하는 이름이면 후보 목록을 함께 반환
+        _, candidates = statistics_analyzer.resolve_district(region, district)
+        if len(candidates) > 1:
             return jsonify({
                 'success': False,
-                'error': f'{region} {district} 데이터를 찾을 수 없습니다.'
-            }), 404
+                'error': f'{region} {district}에 해당하는 구/군이 여러 개입니다.',
+                'candidates': candidates
+            }), 409
+        
+        return jsonify({
+            'success': False,
+            'error': f'{region} {district} 데이터를 찾을 수 없습니다.'
+        }), 404
             
     except Exception as e:
         return jsonify({
@@ -382,6 +1426,7 @@ def get_district_statistics():
         }), 500
 
 @app.route('/api/statistics/region-summary', methods=['POST'])
+@statistics_cached
 def get_region_summary():
     """지역별 전체 요약 통계 조회"""
     try:
@@ -413,6 +1458,7 @@ def get_region_summary():
         }), 500
 
 @app.route('/api/statistics/investment-recommendation', methods=['POST'])
+@statistics_cached
 def get_investment_recommendation():
     """지역/구별 투자 추천 정보 조회"""
     try:
@@ -439,13 +1485,15 @@ def get_investment_recommendation():
         }), 500
 
 @app.route('/api/statistics/top-districts', methods=['POST'])
+@statistics_cached
 def get_top_districts():
     """지역별 상위 구/군 조회"""
     try:
         data = request.get_json()
         region = data.get('region', '')
-        criteria = data.get('criteria', 'sale_rate')  # sale_rate 또는 sale_price_rate
+        criteria = data.get('criteria', 'sale_rate')  # RANKING_METRICS 중 하나
         limit = data.get('limit', 5)
+        order = data.get('order', 'desc')  # desc 또는 asc
         
         if not region:
             return jsonify({
@@ -453,22 +1501,27 @@ def get_top_districts():
                 'error': '지역 정보가 필요합니다.'
             }), 400
         
-        if criteria == 'sale_rate':
-            top_districts = statistics_analyzer.find_best_districts_by_sale_rate(region, limit)
-        elif criteria == 'sale_price_rate':
-            top_districts = statistics_analyzer.find_best_districts_by_sale_price_rate(region, limit)
-        else:
+        if criteria not in RANKING_METRICS:
+            return jsonify({
+                'success': False,
+                'error': f"criteria는 {', '.join(RANKING_METRICS)} 중 하나여야 합니다."
+            }), 400
+        
+        if order not in ('desc', 'asc'):
             return jsonify({
                 'success': False,
-                'error': 'criteria는 sale_rate 또는 sale_price_rate여야 합니다.'
+                'error': 'order는 desc 또는 asc여야 합니다.'
             }), 400
         
+        top_districts = statistics_analyzer.get_top_districts(region, criteria, limit, ascending=(order == 'asc'))
+        
         return jsonify({
             'success': True,
             'data': {
                 'region': region,
                 'criteria': criteria,
-                'districts': [{'district': d[0], 'value': d[1]} for d in top_districts]
+                'order': order,
+                'districts': top_districts
             }
         })
             
@@ -479,6 +1532,7 @@ def get_top_districts():
         }), 500
 
 @app.route('/api/statistics/all-regions', methods=['GET'])
+@statistics_cached
 def get_all_regions_summary():
     """모든 지역의 요약 통계 조회"""
     try:
@@ -494,6 +1548,73 @@ def get_all_regions_summary():
             'error': str(e)
         }), 500
 
+@app.route('/api/statistics/trend', methods=['POST'])
+@statistics_cached
+def get_statistics_trend():
+    """
+    지역/구별 기간 추세 조회
+    보관 중인 모든 기간 파일의 구간 합계, window개월 이동 매각률, 전년 동기 대비 변화 (start, end: YYYYMM)
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        region = data.get('region', '')
+        district = data.get('district', '')
+        
+        if not region:
+            return jsonify({
+                'success': False,
+                'error': '지역 정보가 필요합니다.'
+            }), 400
+        
+        try:
+            window = int(data.get('window', 12))
+            trend = statistics_analyzer.get_district_trend(
+                region, district, data.get('start'), data.get('end'), window
+            )
+        except (TypeError, ValueError) as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        if trend:
+            return jsonify({
+                'success': True,
+                'data': trend
+            })
+        
+        location = f"{region} {district}".strip()
+        return jsonify({
+            'success': False,
+            'error': f'{location} 기간 데이터를 찾을 수 없습니다.'
+        }), 404
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/statistics/reload', methods=['POST'])
+def reload_statistics():
+    """매각통계 원본 파일이 바뀐 지역만 즉시 다시 로드 (서버 재시작 없이 반영)"""
+    try:
+        reloaded = statistics_analyzer.reload_changed_regions()
+        print(f"매각통계 다시 로드 요청: {', '.join(reloaded) if reloaded else '변경 없음'}")
+        return jsonify({
+            'success': True,
+            'data': {
+                'reloaded': reloaded,
+                'version': statistics_analyzer.version
+            }
+        })
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 # ===== Firebase 통합 API 엔드포인트 =====
 
 @app.route('/api/firebase/search-auctions', methods=['POST'])
@@ -600,4 +1721,9 @@ def internal_error(error):
 if __name__ == '__main__':
     print("경매 시뮬레이터 백엔드 서버 시작...")
     print("http://localhost:5001 에서 접속 가능합니다.")
+    # 디버그 리로더는 감시 프로세스와 서버 프로세스에서 모두 이 블록을 실행하므로 서버 프로세스에서만 시작
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_background_tasks()
+        if SELENIUM_POOL_WARM > 0:
+            start_webdriver_warmup()
     app.run(debug=True, host='0.0.0.0', port=5001)
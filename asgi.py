@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기(ASGI) 서버 진입점
+크롤링 API(/api/real-auction-data, /api/api-collect, /api/advanced-crawl)는 이벤트 루프에서 직접 처리하고
+나머지 경로는 기존 Flask 앱(app.py)으로 전달. 경로와 JSON 응답 형식은 Flask 서버와 동일
+
+실행: uvicorn asgi:application --host 0.0.0.0 --port 5001
+"""
+
+import os
+import json
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+
+import app as flask_backend
+from async_crawl import AsyncCrawlService
+from single_flight import AsyncSingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Selenium 등 블로킹 작업(고급 크롤링)을 동시에 실행할 최대 스레드 수
+ASYNC_BLOCKING_LIMIT = int(os.getenv('ASYNC_BLOCKING_LIMIT', '4'))
+
+# Flask로 전달한 요청을 동시에 처리할 최대 스레드 수 (기존 threaded Flask 서버와 같이 요청마다 다른 스레드)
+ASYNC_WSGI_THREADS = int(os.getenv('ASYNC_WSGI_THREADS', '32'))
+
+crawl_service = AsyncCrawlService(
+    flask_backend.official_api,
+    flask_backend.real_crawler,
+    flask_backend.api_collector
+)
+
+# 같은 사건번호로 동시에 들어온 요청은 코루틴 하나만 실행하고 결과 공유
+async_crawl_flight = AsyncSingleFlight()
+
+# 백그라운드 갱신 작업 (완료 전에 가비지 컬렉션되지 않도록 참조 유지)
+background_tasks = set()
+
+blocking_semaphore = None
+
+class JSONRequestError(Exception):
+    """요청 본문이 JSON 객체가 아닌 경우"""
+
+async def read_json(receive):
+    """요청 본문 전체를 읽어 JSON 객체로 반환"""
+    body = b''
+    while True:
+        message = await receive()
+        body += message.get('body', b'')
+        if not message.get('more_body'):
+            break
+
+    try:
+        data = json.loads(body or b'null')
+    except ValueError as e:
+        raise JSONRequestError(f"잘못된 JSON 요청입니다: {e}")
+    if not isinstance(data, dict):
+        raise JSONRequestError("JSON 객체 형식의 요청이 필요합니다.")
+    return data
+
+async def send_json(send, payload, status=200):
+    """JSON 응답 전송 (Flask-CORS 기본 설정과 같이 모든 출처 허용)"""
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json; charset=utf-8'),
+            (b'content-length', str(len(body)).encode()),
+            (b'access-control-allow-origin', b'*')
+        ]
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+async def run_blocking(func, *args, **kwargs):
+    """블로킹 함수를 제한된 수의 스레드에서 실행"""
+    global blocking_semaphore
+    if blocking_semaphore is None:
+        blocking_semaphore = asyncio.Semaphore(ASYNC_BLOCKING_LIMIT)
+    async with blocking_semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+async def fetch_real_auction_data(case_number, race=True):
+    """app.fetch_real_auction_data의 비동기 버전 (공식 API -> 실제 크롤링, 결과 저장소에 기록)"""
+    case_key = flask_backend.crawl_store.normalize_case_number(case_number)
+
+    # 1. 공식 API 시도
+    real_data = await async_crawl_flight.do(
+        ('official-api', case_key),
+        crawl_service.get_official_auction_data, case_number
+    )
+    if real_data:
+        return await asyncio.to_thread(
+            flask_backend.store_real_auction_data, case_number, 'official_api', real_data
+        )
+
+    # 2. 실제 크롤링 시도
+    real_data = await async_crawl_flight.do(
+        ('real-auction-data', case_key, race),
+        crawl_service.get_real_auction_data, case_number, race=race
+    )
+    if real_data:
+        return await asyncio.to_thread(
+            flask_backend.store_real_auction_data, case_number, 'real_crawl', real_data
+        )
+
+    return None, None
+
+def refresh_real_auction_data_async(case_number, race=True):
+    """오래된 저장 결과를 백그라운드 코루틴으로 갱신 (같은 사건번호는 한 번만)"""
+    case_key = flask_backend.crawl_store.normalize_case_number(case_number)
+    with flask_backend.refreshing_lock:
+        if case_key in flask_backend.refreshing_cases:
+            return
+        flask_backend.refreshing_cases.add(case_key)
+
+    async def refresh():
+        try:
+            await fetch_real_auction_data(case_number, race)
+        except Exception as e:
+            print(f"백그라운드 갱신 실패: {case_number}, {e}")
+        finally:
+            with flask_backend.refreshing_lock:
+                flask_backend.refreshing_cases.discard(case_key)
+
+    task = asyncio.ensure_future(refresh())
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+async def real_auction_data(data):
+    """실제 경매 데이터 수집 API (POST /api/real-auction-data)"""
+    case_number = data.get('caseNumber')
+    if not isinstance(case_number, str) or not case_number.strip():
+        return {'error': '사건번호가 필요합니다.'}, 400
+
+    print(f"실제 경매 데이터 요청 (async): {case_number}")
+    race = data.get('race', True)
+
+    # 0. 저장된 결과가 있으면 바로 응답 (오래된 결과면 백그라운드에서 갱신)
+    # SQLite 조회/저장은 이벤트 루프 밖에서 실행 (짧은 작업이므로 Selenium용 run_blocking 제한과 분리)
+    stored = await asyncio.to_thread(flask_backend.get_stored_real_auction_data, case_number)
+    if stored:
+        if stored.is_stale:
+            refresh_real_auction_data_async(case_number, race)
+        return flask_backend.build_stored_real_auction_response(stored), 200
+
+    # 1~2. 공식 API, 실제 크롤링 시도
+    source, real_data = await fetch_real_auction_data(case_number, race)
+    if real_data:
+        return flask_backend.build_real_auction_response(source, real_data), 200
+
+    # 3. 실패시 시뮬레이션 데이터 반환
+    simulation_response = flask_backend.build_simulation_response(case_number)
+    if simulation_response:
+        return simulation_response, 200
+
+    return {'success': False, 'error': '데이터를 수집할 수 없습니다.'}, 404
+
+async def api_collect(data):
+    """API 기반 데이터 수집 (POST /api/api-collect)"""
+    case_number = data.get('caseNumber')
+    location = data.get('location')
+    property_type = data.get('propertyType')
+
+    error = flask_backend.get_crawl_request_error(case_number, location, property_type)
+    if error:
+        return {'error': error}, 400
+
+    print(f"API 수집 요청 (async): {case_number}, {location}, {property_type}")
+
+    results = await async_crawl_flight.do(
+        ('api-collect', case_number.strip(), location, property_type),
+        crawl_service.collect_multiple_api_data,
+        case_number, location, property_type,
+        timeout=flask_backend.API_COLLECT_TIMEOUT,
+        deadline=flask_backend.API_COLLECT_DEADLINE
+    )
+
+    if results and results['combined']['sources_count'] > 0:
+        print(f"API 수집 성공: {results['combined']['sources_count']}개 소스")
+        return {'success': True, 'data': results}, 200
+
+    print("API 수집 실패")
+    return {'success': False, 'error': 'API에서 데이터를 수집할 수 없습니다.'}, 404
+
+async def advanced_crawl(data):
+    """고급 크롤링 API (POST /api/advanced-crawl), Selenium을 사용하므로 제한된 스레드에서 실행"""
+    case_number = data.get('caseNumber')
+    location = data.get('location')
+    property_type = data.get('propertyType')
+
+    error = flask_backend.get_crawl_request_error(case_number, location, property_type)
+    if error:
+        return {'error': error}, 400
+
+    print(f"고급 크롤링 요청 (async): {case_number}, {location}, {property_type}")
+
+    concurrent = bool(data.get('concurrent', True))
+    results = await run_blocking(
+        flask_backend.crawl_flight.do,
+        ('advanced-crawl', case_number.strip(), location, property_type, concurrent),
+        flask_backend.advanced_crawler.crawl_multiple_sources,
+        case_number, location, property_type,
+        concurrent=concurrent,
+        deadline=flask_backend.ADVANCED_CRAWL_DEADLINE
+    )
+
+    if results and results['combined']['sources_count'] > 0:
+        print(f"고급 크롤링 성공: {results['combined']['sources_count']}개 소스")
+        return {'success': True, 'data': results}, 200
+
+    print("고급 크롤링 실패")
+    return {'success': False, 'error': '데이터를 수집할 수 없습니다.'}, 404
+
+class ThreadPoolWsgiInstance(WsgiToAsgiInstance):
+    """WsgiToAsgiInstance와 같지만 WSGI 앱을 공유 스레드 하나가 아닌 스레드 풀에서 실행"""
+
+    def __init__(self, wsgi_application, executor):
+        super().__init__(wsgi_application)
+        self.executor = executor
+
+    async def run_wsgi_app(self, body):
+        # 기본 구현은 thread_sensitive 모드라 모든 요청이 한 스레드에서 차례로 실행됨
+        run = WsgiToAsgiInstance.__dict__['run_wsgi_app'].func
+        await sync_to_async(run, thread_sensitive=False, executor=self.executor)(self, body)
+
+class ThreadPoolWsgiToAsgi(WsgiToAsgi):
+    """요청마다 스레드 풀에서 Flask 앱을 실행하는 WSGI -> ASGI 어댑터"""
+
+    def __init__(self, wsgi_application, max_threads=ASYNC_WSGI_THREADS):
+        super().__init__(wsgi_application)
+        self.executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix='wsgi')
+
+    async def __call__(self, scope, receive, send):
+        await ThreadPoolWsgiInstance(self.wsgi_application, self.executor)(scope, receive, send)
+
+# 이벤트 루프에서 직접 처리하는 경로 (나머지는 Flask 앱으로 전달)
+ASYNC_ROUTES = {
+    ('POST', '/api/real-auction-data'): real_auction_data,
+    ('POST', '/api/api-collect'): api_collect,
+    ('POST', '/api/advanced-crawl'): advanced_crawl
+}
+
+class AsyncCrawlApplication:
+    def __init__(self, wsgi_app, routes):
+        self.wsgi = ThreadPoolWsgiToAsgi(wsgi_app)
+        self.routes = routes
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+
+        handler = None
+        if scope['type'] == 'http':
+            handler = self.routes.get((scope['method'], scope['path']))
+
+        if handler is None:
+            await self.wsgi(scope, receive, send)
+            return
+
+        try:
+            payload, status = await handler(await read_json(receive))
+        except JSONRequestError as e:
+            payload, status = {'success': False, 'error': str(e)}, 400
+        except Exception as e:
+            payload, status = {'success': False, 'error': str(e)}, 500
+        await send_json(send, payload, status)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                flask_backend.start_background_tasks()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                flask_backend.stop_background_tasks()
+                await crawl_service.close()
+                self.wsgi.executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+application = AsyncCrawlApplication(flask_backend.app, ASYNC_ROUTES)
+
+if __name__ == '__main__':
+    import uvicorn
+
+    print("경매 시뮬레이터 백엔드 서버 시작 (비동기 모드)...")
+    print("http://localhost:5001 에서 접속 가능합니다.")
+    uvicorn.run('asgi:application', host='0.0.0.0', port=5001)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 크롤링 서비스
+기존 크롤러의 요청 정보와 파싱 함수를 그대로 사용하고 HTTP 요청만 httpx.AsyncClient로 보내
+요청마다 스레드를 점유하지 않고 이벤트 루프 하나에서 수백 건의 크롤링을 동시에 처리
+"""
+
+import os
+import asyncio
+import logging
+from typing import Dict, Optional
+
+import httpx
+
+from task_runner import aiter_completed
+from circuit_breaker import CircuitBreakerRegistry, upstream_breakers
+from http_transport import HTTP_RETRY_TOTAL
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 루프 하나가 동시에 열 수 있는 최대 연결 수와 유지할 keep-alive 연결 수
+HTTP_ASYNC_MAX_CONNECTIONS = int(os.getenv('HTTP_ASYNC_MAX_CONNECTIONS', '200'))
+HTTP_ASYNC_MAX_KEEPALIVE = int(os.getenv('HTTP_ASYNC_MAX_KEEPALIVE', '50'))
+
+def create_async_client() -> httpx.AsyncClient:
+    """공유 비동기 HTTP 클라이언트 (requests와 같이 리다이렉트를 따라감)"""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=HTTP_ASYNC_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_ASYNC_MAX_KEEPALIVE
+        ),
+        transport=httpx.AsyncHTTPTransport(retries=HTTP_RETRY_TOTAL),
+        follow_redirects=True
+    )
+
+class AsyncCrawlService:
+    def __init__(self, official_api, real_crawler, api_collector,
+                 breakers: Optional[CircuitBreakerRegistry] = None):
+        """
+        - official_api, real_crawler, api_collector: 요청 정보, 파싱 함수, 실패 캐시를 제공하는 동기 크롤러
+        - breakers: 호스트별 서킷 브레이커 (기본값: 동기 크롤러와 같은 레지스트리)
+        """
+        self.official_api = official_api
+        self.real_crawler = real_crawler
+        self.api_collector = api_collector
+        self.breakers = breakers or upstream_breakers
+        self.client = create_async_client()
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def request(self, session, method: str, url: str, options: Dict, timeout: float):
+        """동기 크롤러 세션의 헤더를 그대로 사용하여 서킷 브레이커를 거쳐 비동기 요청"""
+        headers = dict(session.headers)
+        headers.update(options.get('headers') or {})
+        options = dict(options, headers=headers)
+        return await self.breakers.async_request(self.client, method, url, timeout=timeout, **options)
+
+    async def get_official_auction_data(self, case_number: str) -> Optional[Dict]:
+        """OfficialAPIIntegration.get_official_auction_data의 비동기 버전 (같은 순서, 실패 캐시 공유)"""
+        official_api = self.official_api
+        for name, (method, url, options, parse) in official_api.get_official_requests(case_number).items():
+            if official_api.negative_cache.contains((name, case_number)):
+                continue
+
+            try:
+                response = await self.request(official_api.session, method, url, options, timeout=15)
+            except Exception as e:
+                # 요청 오류는 서킷 브레이커가 기록하므로 실패 캐시에는 남기지 않음
+                logger.warning(f"{name} 공식 API 호출 실패: {e}")
+                continue
+
+            if response.status_code != 200:
+                continue
+            try:
+                data = parse(response.json())
+            except Exception as e:
+                logger.warning(f"{name} 공식 API 응답 파싱 실패: {e}")
+                continue
+
+            if data:
+                return data
+            official_api.negative_cache.add((name, case_number))
+
+        return None
+
+    async def fetch_candidate(self, method: str, url: str, options: Dict, parse) -> Optional[Dict]:
+        """RealCourtAuctionCrawler.fetch_candidate의 비동기 버전"""
+        crawler = self.real_crawler
+        cache_key = crawler.get_negative_cache_key(method, url, options)
+        if crawler.negative_cache.contains(cache_key):
+            return None
+
+        response = await self.request(crawler.session, method, url, options, timeout=15)
+        response.raise_for_status()
+
+        # HTML 파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        auction_data = await asyncio.to_thread(parse, response.content)
+        if not auction_data:
+            crawler.negative_cache.add(cache_key)
+        return auction_data
+
+    async def get_real_auction_data(self, case_number: str, race: bool = True,
+                                    max_concurrency: int = 8, deadline: float = 30) -> Optional[Dict]:
+        """
+        RealCourtAuctionCrawler.get_real_auction_data의 비동기 버전
+        race=False이면 후보 소스를 우선순위 순서로 하나씩 요청
+        """
+        candidates = self.real_crawler.get_candidate_requests(case_number)
+        tasks = {
+            name: lambda spec=spec: self.fetch_candidate(*spec)
+            for name, spec in candidates.items()
+        }
+        logger.info(f"경매 데이터 비동기 수집 시작: {len(tasks)}개 후보 (최대 {deadline}초)")
+
+        results = aiter_completed(tasks, max_concurrency=max_concurrency if race else 1, deadline=deadline)
+        try:
+            async for name, auction_data, error in results:
+                if error:
+                    logger.warning(f"{name} 수집 실패: {error}")
+                elif auction_data:
+                    logger.info(f"{name}에서 경매 데이터 수집 성공: {case_number}")
+                    return auction_data
+        finally:
+            # 남은 후보 요청 취소
+            await results.aclose()
+
+        return None
+
+    async def call_api(self, label: str, api_request, timeout: float = 10) -> Optional[Dict]:
+        """APIDataCollector.call_api의 비동기 버전"""
+        method, url, options, parse = api_request
+        response = await self.request(self.api_collector.session, method, url, options, timeout=timeout)
+
+        if response.status_code == 200:
+            return parse(response.json())
+
+        logger.warning(f"{label} API 호출 실패: {response.status_code}")
+        return None
+
+    async def collect_multiple_api_data(self, case_number: str, location: str, property_type: str,
+                                        timeout: float = 10, deadline: Optional[float] = 15) -> Dict:
+        """APIDataCollector.collect_multiple_api_data(concurrent=True)의 비동기 버전 (같은 결과 구조)"""
+        collector = self.api_collector
+        results = collector.create_results(case_number, location, property_type)
+        api_requests = collector.get_api_requests(case_number, location, property_type)
+        tasks = {
+            name: lambda name=name, api_request=api_request: self.call_api(name, api_request, timeout)
+            for name, api_request in api_requests.items()
+        }
+        logger.info(f"다중 API 비동기 수집 시작: {list(tasks)} (최대 {deadline}초)")
+
+        collected = {}
+        async for source_name, data, error in aiter_completed(tasks, deadline=deadline):
+            if error:
+                logger.warning(f"{source_name} API 수집 실패: {error}")
+            elif data:
+                collected[source_name] = data
+
+        return collector.merge_collected_data(results, list(tasks), collected)
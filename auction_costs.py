@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+경매 부대비용 계산 엔진
+script.js의 calculateDetailedAuctionCosts(2024년 취득세율 반영)를 NumPy로 구현하여
+입찰가 배열과 물건 속성(주택 유형, 보유 주택 수)의 모든 조합을 한 번의 벡터 연산으로 계산
+"""
+
+import logging
+from typing import Dict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 물건 유형 분류 (취득세율 기준)
+HOUSING, LAND, COMMERCIAL = 0, 1, 2
+PROPERTY_CATEGORIES = {
+    '아파트': HOUSING, '오피스텔': HOUSING, '빌라': HOUSING, '단독주택': HOUSING,
+    '토지': LAND
+}
+
+# 1주택자 낙찰가 구간별 취득세율 (면적 무관)
+ACQUISITION_TAX_BRACKETS = np.array([600000000, 900000000, 1200000000, 1500000000])
+ACQUISITION_TAX_RATES = np.array([0.01, 0.02, 0.03, 0.04, 0.05])
+
+# 다주택자 취득세율 (2주택 8%, 3~5주택 12%, 6주택 이상 15%)
+MULTI_HOME_TAX_RATES = (0.08, 0.12, 0.15)
+
+# 주택 외 물건 취득세율 (토지 평균 3%, 상업용 부동산 4%)
+LAND_TAX_RATE = 0.03
+COMMERCIAL_TAX_RATE = 0.04
+
+# 낙찰가 구간별 법무사 수수료
+LEGAL_FEE_BRACKETS = np.array([100000000, 300000000, 500000000])
+LEGAL_FEES = np.array([500000, 800000, 1250000, 1750000])
+
+# 세금/등기 비율
+LOCAL_EDUCATION_TAX_RATE = 0.20      # 지방교육세: 취득세 × 20%
+RURAL_SPECIAL_TAX_RATE = 0.15        # 농어촌특별세: 취득세 × 15%
+OWNERSHIP_TRANSFER_TAX_RATE = 0.002  # 소유권이전등기: 낙찰가 × 0.2%
+REGISTRATION_EDUCATION_TAX_RATE = 0.20
+HOUSING_BOND_RATE = 0.20             # 국민주택채권 (수도권): 취득세액 × 20%
+UNPAID_UTILITIES_RATE = 0.005        # 미납 공과금 추정: 낙찰가 × 0.5%
+DEPOSIT_RATE = 0.1                   # 입찰보증금: 낙찰가 × 10%
+
+def get_property_categories(property_type) -> np.ndarray:
+    """물건 유형(문자열 또는 배열)을 취득세 분류(HOUSING/LAND/COMMERCIAL)로 변환"""
+    property_type = np.asarray(property_type, dtype=object)
+    categories = [PROPERTY_CATEGORIES.get(value, COMMERCIAL) for value in property_type.ravel()]
+    return np.array(categories, dtype=np.intp).reshape(property_type.shape)
+
+def calculate_acquisition_tax_rate(bid_price, property_type='아파트', home_count=1) -> np.ndarray:
+    """취득세율 (인자는 스칼라 또는 배열, 브로드캐스팅)"""
+    bid_price = np.asarray(bid_price, dtype=float)
+    home_count = np.asarray(home_count, dtype=float)
+    categories = get_property_categories(property_type)
+
+    # JS와 같이 1, 2주택은 정확히 일치할 때만, 그 외(0, 소수 포함)는 6주택 이상 세율
+    single_home_rate = ACQUISITION_TAX_RATES[np.searchsorted(ACQUISITION_TAX_BRACKETS, bid_price, side='left')]
+    housing_rate = np.select(
+        [home_count == 1, home_count == 2, (home_count >= 3) & (home_count <= 5)],
+        [single_home_rate, MULTI_HOME_TAX_RATES[0], MULTI_HOME_TAX_RATES[1]],
+        default=MULTI_HOME_TAX_RATES[2]
+    )
+    return np.select(
+        [categories == HOUSING, categories == LAND],
+        [housing_rate, LAND_TAX_RATE],
+        default=COMMERCIAL_TAX_RATE
+    )
+
+def calculate_detailed_auction_costs(bid_price, property_type='아파트', home_count=1) -> Dict[str, np.ndarray]:
+    """
+    calculateDetailedAuctionCosts의 벡터 버전
+    bid_price, property_type, home_count는 스칼라 또는 배열이며 브로드캐스팅 규칙에 따라 결합된다.
+    (JS의 isFirstHome, area 인자는 계산에 쓰이지 않으므로 받지 않음)
+
+    반환값: 항목별 비용 배열 (입찰보증금은 합계에 포함하지 않음)
+    """
+    bid_price = np.asarray(bid_price, dtype=float)
+    # 물건 속성 배열의 모양에 맞추어 모든 항목을 같은 모양으로 반환
+    bid_price, acquisition_tax_rate = np.broadcast_arrays(
+        bid_price, calculate_acquisition_tax_rate(bid_price, property_type, home_count)
+    )
+
+    acquisition_tax = bid_price * acquisition_tax_rate
+    local_education_tax = acquisition_tax * LOCAL_EDUCATION_TAX_RATE
+    rural_special_tax = acquisition_tax * RURAL_SPECIAL_TAX_RATE
+    total_taxes = acquisition_tax + local_education_tax + rural_special_tax
+
+    ownership_transfer_tax = bid_price * OWNERSHIP_TRANSFER_TAX_RATE
+    registration_education_tax = ownership_transfer_tax * REGISTRATION_EDUCATION_TAX_RATE
+    housing_bond = acquisition_tax * HOUSING_BOND_RATE
+    stamp_tax = np.where(bid_price > 100000000, 50000.0, 0.0)
+    mortgage_stamp_tax = np.where(bid_price > 1000000000, 150000.0, 0.0)
+    total_registration_fees = (ownership_transfer_tax + registration_education_tax + housing_bond
+                               + stamp_tax + mortgage_stamp_tax)
+
+    legal_fee = LEGAL_FEES[np.searchsorted(LEGAL_FEE_BRACKETS, bid_price, side='left')].astype(float)
+    unpaid_utilities = bid_price * UNPAID_UTILITIES_RATE
+
+    total_additional_costs = total_taxes + total_registration_fees + legal_fee + unpaid_utilities
+    deposit = bid_price * DEPOSIT_RATE
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cost_percentage = total_additional_costs / bid_price * 100
+
+    return {
+        'bid_price': bid_price,
+        'deposit': deposit,
+        'remaining_payment': bid_price - deposit,
+        'acquisition_tax': acquisition_tax,
+        'local_education_tax': local_education_tax,
+        'rural_special_tax': rural_special_tax,
+        'total_taxes': total_taxes,
+        'ownership_transfer_tax': ownership_transfer_tax,
+        'registration_education_tax': registration_education_tax,
+        'housing_bond': housing_bond,
+        'stamp_tax': stamp_tax,
+        'mortgage_stamp_tax': mortgage_stamp_tax,
+        'total_registration_fees': total_registration_fees,
+        'legal_fee': legal_fee,
+        'unpaid_utilities': unpaid_utilities,
+        'total_additional_costs': total_additional_costs,
+        'total_investment': bid_price + total_additional_costs,
+        'cost_percentage': cost_percentage
+    }
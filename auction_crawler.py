@@ -5,18 +5,18 @@
 GPTers 커뮤니티의 경매 AI 도전기에서 영감을 받아 구현
 """
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import re
 from urllib.parse import quote
 import time
 from datetime import datetime
+from http_transport import create_session
 
 class CourtAuctionCrawler:
     def __init__(self):
         self.base_url = "https://www.courtauction.go.kr"
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
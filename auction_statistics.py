@@ -6,138 +6,615 @@
 """
 
 import pandas as pd
+import numpy as np
 import os
 import json
-from typing import Dict, List, Tuple, Optional
+import glob
+import time
+import pickle
+import hashlib
+import threading
+from typing import Dict, List, NamedTuple, Tuple, Optional
+
+from statistics_timeseries import StatisticsTimeSeries, parse_period, parse_statistics_filename
+
+# 지역별 매각통계 원본 파일
+EXCEL_FILES = [
+    ('서울', '지역별 매각통계_서울_202408~202509.xls'),
+    ('경기', '지역별 매각통계_경기_202408~202509.xls'),
+    ('부산', '지역별 매각통계_부산_202408~202509.xls'),
+    ('인천', '지역별 매각통계_인천_202408~202509.xls')
+]
+
+# 같은 지역의 다른 기간 원본 파일 (월별 갱신 파일 탐색용, 파일 이름의 기간이 가장 늦은 파일 사용)
+REGION_FILE_PATTERNS = ('지역별 매각통계_{region}_*.xls', '지역별 매각통계_{region}_*.xlsx')
+
+# 지역명 표기 (사용자 입력에서 제거할 시/도 접두어)
+REGION_ALIASES = {
+    '서울': ['서울특별시', '서울시', '서울'],
+    '경기': ['경기도', '경기'],
+    '부산': ['부산광역시', '부산시', '부산'],
+    '인천': ['인천광역시', '인천시', '인천']
+}
+
+# 행정구역 접미어 ("강남구" -> "강남" 같은 약칭 생성용)
+DISTRICT_SUFFIXES = ('시', '군', '구')
+
+# 엑셀 파일의 합계 행 (구/군 순위에서 제외)
+TOTAL_ROW_NAME = '전체'
+
+# 순위를 미리 계산하는 지표 (구/군 통계 항목 또는 시장 점수)
+RANKING_METRICS = (
+    'sale_rate', 'sale_price_rate', 'auctions', 'sales',
+    'avg_sale_per_case', 'avg_appraisal_per_case', 'market_score'
+)
+
+# 파싱된 통계 스냅샷 (스키마가 바뀌면 버전을 올려 기존 스냅샷 무효화)
+DEFAULT_SNAPSHOT_PATH = 'auction_statistics.snapshot.pkl'
+SNAPSHOT_SCHEMA_VERSION = 1
+
+# 구/군별 통계 항목 (process_region_data 출력 순서)
+DISTRICT_FIELDS = (
+    'auctions', 'sales', 'appraisal_value', 'sale_value', 'sale_rate',
+    'sale_price_rate', 'avg_appraisal_per_case', 'avg_sale_per_case'
+)
+
+class StatisticsState(NamedTuple):
+    """
+    한 시점의 통계와 파생 데이터 (다시 로드할 때는 새 객체를 만들어 참조 하나만 교체)
+    조회하는 쪽은 호출마다 state를 한 번만 읽어 통계, 색인, 순위, 시계열, version을 일관되게 사용
+    """
+    # 지역별 통계
+    statistics_data: Dict
+    # 지역별 {정규화된 별칭: [구/군 이름]} 색인
+    district_index: Dict
+    # 지역별, 지표별 내림차순/오름차순 순위
+    rankings: Dict
+    # 같은 지역의 모든 기간 파일을 모은 시계열 (추세 조회용, 기존 통계 조회에는 사용하지 않음)
+    timeseries: StatisticsTimeSeries
+    # 통계를 다시 로드할 때마다 증가 (응답 캐시 등 파생 데이터 무효화용)
+    version: int
 
 class AuctionStatisticsAnalyzer:
-    def __init__(self):
-        self.statistics_data = {}
+    def __init__(self, snapshot_path: Optional[str] = DEFAULT_SNAPSHOT_PATH):
+        self.state = StatisticsState({}, {}, {}, StatisticsTimeSeries(), 0)
+        # 파싱 결과 바이너리 스냅샷 경로 (None이면 스냅샷 사용 안 함)
+        self.snapshot_path = snapshot_path
+        # 지역별 {'source': 원본 파일 정보, 'data': 통계} (스냅샷 저장 형식과 같음)
+        self.loaded_regions = {}
+        # 지역별 시계열에 쓴 기간 파일 정보 (get_history_sources 결과, 이전 기간 파일 추가/삭제/수정 확인용)
+        self.history_sources = {}
+        # 다시 로드는 한 번에 하나씩 (읽는 쪽은 잠그지 않음)
+        self.reload_lock = threading.Lock()
+        self.watcher = None
+        self.watcher_stop = threading.Event()
         self.load_all_statistics()
     
+    @property
+    def statistics_data(self) -> Dict:
+        return self.state.statistics_data
+    
+    @property
+    def district_index(self) -> Dict:
+        return self.state.district_index
+    
+    @property
+    def rankings(self) -> Dict:
+        return self.state.rankings
+    
+    @property
+    def timeseries(self) -> StatisticsTimeSeries:
+        return self.state.timeseries
+    
+    @property
+    def version(self) -> int:
+        return self.state.version
+    
     def load_all_statistics(self):
-        """모든 지역별 매각통계 데이터를 로드"""
-        excel_files = [
-            ('서울', '지역별 매각통계_서울_202408~202509.xls'),
-            ('경기', '지역별 매각통계_경기_202408~202509.xls'),
-            ('부산', '지역별 매각통계_부산_202408~202509.xls'),
-            ('인천', '지역별 매각통계_인천_202408~202509.xls')
-        ]
+        """모든 지역별 매각통계 데이터를 로드 (변경되지 않은 파일은 스냅샷에서 로드)"""
+        snapshot = self.load_snapshot()
+        new_snapshot = {}
+        statistics_data = {}
         
-        for region, filename in excel_files:
+        for region, filename in EXCEL_FILES:
+            filename = self.get_region_file(region, filename)
             if os.path.exists(filename):
                 try:
-                    df = pd.read_excel(filename)
-                    self.statistics_data[region] = self.process_region_data(df, region)
-                    print(f"✅ {region} 지역 데이터 로드 완료: {len(df)}개 구/군")
+                    region_data, source = self.load_region(region, filename, snapshot.get(region))
+                    statistics_data[region] = region_data
+                    new_snapshot[region] = {'source': source, 'data': region_data}
                 except Exception as e:
                     print(f"❌ {region} 지역 데이터 로드 실패: {e}")
             else:
                 print(f"❌ 파일을 찾을 수 없습니다: {filename}")
+        
+        if new_snapshot and new_snapshot != snapshot:
+            self.save_snapshot(new_snapshot)
+        
+        timeseries = StatisticsTimeSeries()
+        history_sources = {}
+        for region, entry in new_snapshot.items():
+            filename = entry['source']['filename']
+            history_sources[region] = self.get_history_sources(region, filename)
+            self.build_region_timeseries(timeseries, region, filename, entry['data'])
+        
+        self.loaded_regions = new_snapshot
+        self.history_sources = history_sources
+        self.state = StatisticsState(
+            statistics_data, self.build_district_index(statistics_data), self.build_rankings(statistics_data),
+            timeseries, self.state.version + 1
+        )
     
-    def process_region_data(self, df: pd.DataFrame, region: str) -> Dict:
-        """지역별 데이터를 처리하여 구조화된 형태로 변환"""
-        processed_data = {
-            'region': region,
-            'districts': {},
-            'summary': {
-                'total_auctions': 0,
-                'total_sales': 0,
-                'total_appraisal_value': 0,
-                'total_sale_value': 0,
-                'overall_sale_rate': 0.0,
-                'overall_sale_price_rate': 0.0
-            }
-        }
+    def load_region(self, region: str, filename: str, cached: Optional[Dict] = None) -> Tuple[Dict, Dict]:
+        """지역 원본 파일 로드 (원본이 스냅샷과 같으면 스냅샷 데이터 사용), (통계, 원본 파일 정보) 반환"""
+        source = self.get_source_info(filename, cached['source'] if cached else None)
         
-        total_auctions = 0
-        total_sales = 0
-        total_appraisal = 0
-        total_sale_value = 0
+        if cached and self.is_same_source(cached['source'], source):
+            region_data = cached['data']
+            print(f"✅ {region} 지역 데이터 로드 완료 (스냅샷): {len(region_data['districts'])}개 구/군")
+        else:
+            df = pd.read_excel(filename)
+            region_data = self.process_region_data(df, region)
+            print(f"✅ {region} 지역 데이터 로드 완료: {len(df)}개 구/군")
         
-        for _, row in df.iterrows():
-            district = row['시/군/구']
-            # 숫자에서 쉼표 제거
-            auctions = int(str(row['경매건수']).replace(',', ''))
-            sales = int(str(row['매각건수']).replace(',', ''))
+        return region_data, source
+    
+    @staticmethod
+    def get_region_file(region: str, filename: str) -> str:
+        """
+        지역 원본 파일 경로
+        같은 폴더에 설정된 파일과 기간 길이가 같고 끝 월이 더 늦은 파일이 있으면 그 파일 (월별 갱신 파일)
+        파일 이름에서 기간을 읽을 수 없거나 기간 길이가 다른 파일은 사용하지 않음
+        """
+        configured = parse_statistics_filename(filename)
+        if not configured or configured[0] != region:
+            return filename
+        span = configured[2] - configured[1]
+        
+        best, best_end = filename, configured[2]
+        for candidate in AuctionStatisticsAnalyzer.get_region_history_files(region, filename):
+            parsed = parse_statistics_filename(candidate)
+            if (parsed and parsed[0] == region and parsed[2] - parsed[1] == span
+                    and parsed[2] > best_end):
+                best, best_end = candidate, parsed[2]
+        return best
+    
+    @staticmethod
+    def get_region_history_files(region: str, filename: str) -> List[str]:
+        """같은 폴더에 있는 지역의 모든 기간 원본 파일"""
+        directory = os.path.dirname(filename)
+        files = set()
+        for pattern in REGION_FILE_PATTERNS:
+            files.update(glob.glob(os.path.join(directory, pattern.format(region=region))))
+        return sorted(files, key=os.path.basename)
+    
+    @staticmethod
+    def get_history_sources(region: str, filename: str) -> Tuple[Tuple[str, int, int], ...]:
+        """지역의 모든 기간 원본 파일의 (경로, 크기, 수정 시각) 목록"""
+        sources = []
+        for history_file in AuctionStatisticsAnalyzer.get_region_history_files(region, filename):
+            try:
+                stat = os.stat(history_file)
+            except OSError:
+                continue
+            sources.append((history_file, stat.st_size, stat.st_mtime_ns))
+        return tuple(sources)
+    
+    def build_region_timeseries(self, timeseries: StatisticsTimeSeries, region: str, filename: str,
+                                region_data: Dict):
+        """
+        지역 시계열 갱신 (현재 파일은 이미 파싱한 통계를 쓰고 이전 기간 파일만 새로 파싱)
+        기간을 파일 이름에서 읽을 수 없는 파일은 제외
+        """
+        periods = []
+        for history_file in self.get_region_history_files(region, filename):
+            parsed = parse_statistics_filename(history_file)
+            if not parsed or parsed[0] != region:
+                continue
             
-            # 감정가와 매각가에서 쉼표 제거하고 숫자로 변환
-            appraisal_str = str(row['감정가(단위:원)']).replace(',', '')
-            sale_str = str(row['매각가(단위:원)']).replace(',', '')
+            if history_file == filename:
+                data = region_data
+            else:
+                try:
+                    data = self.process_region_data(pd.read_excel(history_file), region)
+                except Exception as e:
+                    print(f"⚠️ {region} 이전 기간 파일 로드 실패: {history_file}: {e}")
+                    continue
             
-            try:
-                appraisal_value = int(appraisal_str) if appraisal_str.isdigit() else 0
-                sale_value = int(sale_str) if sale_str.isdigit() else 0
-            except:
-                appraisal_value = 0
-                sale_value = 0
+            districts = {name: stats for name, stats in data['districts'].items() if name != TOTAL_ROW_NAME}
+            periods.append((parsed[1], parsed[2], districts))
+        
+        timeseries.set_region(region, periods)
+    
+    @staticmethod
+    def is_unchanged(source: Dict, filename: str) -> bool:
+        """원본 파일이 마지막 로드 이후 그대로인지 (경로, 크기, 수정 시각 비교)"""
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return False
+        return (source.get('filename') == filename and source.get('size') == stat.st_size
+                and source.get('mtime_ns') == stat.st_mtime_ns)
+    
+    def reload_changed_regions(self) -> List[str]:
+        """
+        원본 파일이 바뀐 지역만 다시 로드하여 통계, 색인, 순위, 시계열을 교체하고 version 증가
+        이전 기간 파일만 추가/삭제/수정된 지역은 시계열만 다시 만든다.
+        새 StatisticsState를 만들어 참조 하나만 바꿔 끼우므로(copy-on-write) 읽는 쪽은 잠금 없이 이전 또는 새 데이터를 본다.
+        다시 로드한 지역 목록 반환 (로드에 실패한 지역은 이전 데이터 유지)
+        """
+        with self.reload_lock:
+            loaded = dict(self.loaded_regions)
+            history_sources = dict(self.history_sources)
+            changed = []
+            history_changed = []
+            source_updated = False
             
-            # 매각율과 매각가율에서 % 제거하고 숫자로 변환
-            sale_rate_str = str(row['매각율']).replace('%', '')
-            sale_price_rate_str = str(row['매각가율']).replace('%', '')
+            for region, filename in EXCEL_FILES:
+                filename = self.get_region_file(region, filename)
+                cached = loaded.get(region)
+                if not os.path.exists(filename):
+                    continue
+                
+                if not (cached and self.is_unchanged(cached['source'], filename)):
+                    try:
+                        region_data, source = self.load_region(region, filename, cached)
+                    except Exception as e:
+                        print(f"❌ {region} 지역 데이터 다시 로드 실패 (이전 데이터 유지): {e}")
+                        continue
+                    
+                    loaded[region] = {'source': source, 'data': region_data}
+                    # 수정 시각만 바뀌고 내용이 같으면 파일 정보만 갱신
+                    if cached and region_data is cached['data']:
+                        source_updated = True
+                    else:
+                        changed.append(region)
+                
+                history = self.get_history_sources(region, filename)
+                if history != history_sources.get(region):
+                    history_sources[region] = history
+                    if region not in changed:
+                        history_changed.append(region)
             
-            try:
-                sale_rate = float(sale_rate_str) if sale_rate_str.replace('.', '').isdigit() else 0.0
-                sale_price_rate = float(sale_price_rate_str) if sale_price_rate_str.replace('.', '').isdigit() else 0.0
-            except:
-                sale_rate = 0.0
-                sale_price_rate = 0.0
+            if changed or history_changed:
+                state = self.state
+                statistics_data = dict(state.statistics_data)
+                district_index = dict(state.district_index)
+                rankings = dict(state.rankings)
+                timeseries = StatisticsTimeSeries(state.timeseries.regions)
+                for region in changed:
+                    data = loaded[region]['data']
+                    statistics_data[region] = data
+                    district_index[region] = self.build_region_index(data)
+                    rankings[region] = self.build_region_rankings(data)
+                for region in changed + history_changed:
+                    entry = loaded[region]
+                    self.build_region_timeseries(timeseries, region, entry['source']['filename'], entry['data'])
+                
+                self.state = StatisticsState(statistics_data, district_index, rankings, timeseries, state.version + 1)
+                print(f"🔄 매각통계 다시 로드 완료: {', '.join(changed + history_changed)} (version {self.state.version})")
             
-            processed_data['districts'][district] = {
-                'auctions': auctions,
-                'sales': sales,
-                'appraisal_value': appraisal_value,
-                'sale_value': sale_value,
-                'sale_rate': sale_rate,
-                'sale_price_rate': sale_price_rate,
-                'avg_appraisal_per_case': appraisal_value / auctions if auctions > 0 else 0,
-                'avg_sale_per_case': sale_value / sales if sales > 0 else 0
-            }
+            self.loaded_regions = loaded
+            self.history_sources = history_sources
+            if changed or source_updated:
+                self.save_snapshot(loaded)
             
-            total_auctions += auctions
-            total_sales += sales
-            total_appraisal += appraisal_value
-            total_sale_value += sale_value
+            return changed + history_changed
+    
+    def start_watcher(self, interval: float = 60):
+        """interval초마다 원본 파일 변경을 확인하여 바뀐 지역만 다시 로드하는 백그라운드 스레드 시작"""
+        if self.watcher and self.watcher.is_alive():
+            return
+        
+        def watch():
+            while not self.watcher_stop.wait(interval):
+                try:
+                    self.reload_changed_regions()
+                except Exception as e:
+                    print(f"⚠️ 매각통계 변경 확인 실패: {e}")
+        
+        self.watcher_stop.clear()
+        self.watcher = threading.Thread(target=watch, name='statistics-watcher', daemon=True)
+        self.watcher.start()
+    
+    def stop_watcher(self):
+        """원본 파일 변경 확인 중지"""
+        self.watcher_stop.set()
+    
+    def get_source_info(self, filename: str, cached_source: Optional[Dict] = None) -> Dict:
+        """원본 파일의 크기, 수정 시각, 해시 (크기와 수정 시각이 같으면 이전 해시 재사용)"""
+        stat = os.stat(filename)
+        source = {
+            'filename': filename,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns
+        }
+        
+        if (cached_source and cached_source.get('size') == source['size']
+                and cached_source.get('mtime_ns') == source['mtime_ns']):
+            source['sha256'] = cached_source.get('sha256')
+        else:
+            digest = hashlib.sha256()
+            with open(filename, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            source['sha256'] = digest.hexdigest()
+        
+        return source
+    
+    @staticmethod
+    def is_same_source(cached_source: Dict, source: Dict) -> bool:
+        """스냅샷 생성 시점과 원본 파일 내용이 같은지 (수정 시각만 바뀐 경우 포함)"""
+        return (cached_source.get('filename') == source['filename']
+                and cached_source.get('size') == source['size']
+                and cached_source.get('sha256') == source['sha256'])
+    
+    def load_snapshot(self) -> Dict:
+        """바이너리 스냅샷 로드 (없거나 스키마 버전이 다르면 빈 딕셔너리)"""
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return {}
+        
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                snapshot = pickle.load(f)
+            if snapshot.get('schema_version') != SNAPSHOT_SCHEMA_VERSION:
+                print(f"⚠️ 스냅샷 스키마 버전 불일치, 원본에서 다시 생성합니다: {self.snapshot_path}")
+                return {}
+            return snapshot['regions']
+        except Exception as e:
+            print(f"⚠️ 스냅샷 로드 실패, 원본에서 다시 생성합니다: {e}")
+            return {}
+    
+    def save_snapshot(self, regions: Dict):
+        """파싱 결과를 바이너리 스냅샷으로 저장 (임시 파일 작성 후 교체)"""
+        if not self.snapshot_path:
+            return
+        
+        temp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump({
+                    'schema_version': SNAPSHOT_SCHEMA_VERSION,
+                    'created_at': time.time(),
+                    'regions': regions
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.snapshot_path)
+        except Exception as e:
+            print(f"⚠️ 스냅샷 저장 실패: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def process_region_data(self, df: pd.DataFrame, region: str) -> Dict:
+        """지역별 데이터를 처리하여 구조화된 형태로 변환 (컬럼 단위 일괄 처리)"""
+        # 숫자에서 쉼표 제거
+        auctions = self._clean_count_column(df['경매건수'])
+        sales = self._clean_count_column(df['매각건수'])
+        
+        # 감정가와 매각가에서 쉼표 제거하고 숫자로 변환 (숫자가 아니면 0)
+        appraisal_values, sale_values = self._clean_numeric_columns(
+            df['감정가(단위:원)'], df['매각가(단위:원)'], ',', np.int64
+        )
+        
+        # 매각율과 매각가율에서 % 제거하고 숫자로 변환 (숫자가 아니면 0.0)
+        sale_rates, sale_price_rates = self._clean_numeric_columns(
+            df['매각율'], df['매각가율'], '%', np.float64, ignore='.'
+        )
+        
+        avg_appraisal = self._safe_divide(appraisal_values, auctions)
+        avg_sale = self._safe_divide(sale_values, sales)
+        
+        districts = {}
+        for district, *values in zip(
+            df['시/군/구'].tolist(), auctions.tolist(), sales.tolist(),
+            appraisal_values.tolist(), sale_values.tolist(),
+            sale_rates.tolist(), sale_price_rates.tolist(),
+            avg_appraisal.tolist(), avg_sale.tolist()
+        ):
+            districts[district] = dict(zip(DISTRICT_FIELDS, values))
         
         # 전체 요약 통계 계산
-        processed_data['summary'] = {
-            'total_auctions': total_auctions,
-            'total_sales': total_sales,
-            'total_appraisal_value': total_appraisal,
-            'total_sale_value': total_sale_value,
-            'overall_sale_rate': (total_sales / total_auctions * 100) if total_auctions > 0 else 0.0,
-            'overall_sale_price_rate': (total_sale_value / total_appraisal * 100) if total_appraisal > 0 else 0.0
+        total_auctions = int(auctions.sum())
+        total_sales = int(sales.sum())
+        total_appraisal = int(appraisal_values.sum())
+        total_sale_value = int(sale_values.sum())
+        
+        return {
+            'region': region,
+            'districts': districts,
+            'summary': {
+                'total_auctions': total_auctions,
+                'total_sales': total_sales,
+                'total_appraisal_value': total_appraisal,
+                'total_sale_value': total_sale_value,
+                'overall_sale_rate': (total_sales / total_auctions * 100) if total_auctions > 0 else 0.0,
+                'overall_sale_price_rate': (total_sale_value / total_appraisal * 100) if total_appraisal > 0 else 0.0
+            }
         }
+    
+    @staticmethod
+    def _clean_count_column(column: pd.Series) -> np.ndarray:
+        """쉼표가 포함된 건수 컬럼을 정수 배열로 변환"""
+        cleaned = column.astype(str).str.replace(',', '', regex=False)
+        return pd.to_numeric(cleaned).to_numpy(dtype=np.int64)
+    
+    @staticmethod
+    def _clean_numeric_columns(first: pd.Series, second: pd.Series, strip: str,
+                               dtype, ignore: str = '') -> Tuple[np.ndarray, np.ndarray]:
+        """
+        두 컬럼에서 strip 문자를 제거하고 숫자로 변환
+        숫자 형식이 아닌 값은 0, 한 행에서 변환에 실패한 값이 있으면 두 값 모두 0
+        """
+        cleaned, valid, parsed = [], [], []
+        for column in (first, second):
+            text = column.astype(str).fillna('').str.replace(strip, '', regex=False)
+            digits = text.str.replace(ignore, '', regex=False) if ignore else text
+            is_number = digits.str.isdigit().fillna(False).to_numpy(dtype=bool)
+            values = pd.to_numeric(text.where(is_number, '0'), errors='coerce').to_numpy(dtype=np.float64)
+            cleaned.append(text)
+            valid.append(is_number)
+            parsed.append(values)
+        
+        # 숫자 형식이지만 변환되지 않는 값이 있는 행은 두 값 모두 0 처리
+        failed = np.isnan(parsed[0]) | np.isnan(parsed[1])
+        results = []
+        for is_number, values, column in zip(valid, parsed, cleaned):
+            keep = is_number & ~failed
+            if dtype is np.int64:
+                # 큰 금액의 정밀도를 위해 정수는 문자열에서 직접 변환
+                out = np.zeros(len(values), dtype=np.int64)
+                out[keep] = column[keep].astype('int64').to_numpy()
+            else:
+                out = np.where(keep, values, 0.0)
+            results.append(out)
+        
+        return results[0], results[1]
+    
+    @staticmethod
+    def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        """분모가 0이면 0 (정수), 아니면 나눗셈 결과 (실수)"""
+        positive = denominator > 0
+        quotient = numerator / np.where(positive, denominator, 1)
+        result = quotient.astype(object)
+        result[~positive] = 0
+        return result
+    
+    def build_district_index(self, statistics_data: Dict) -> Dict:
+        """구/군 이름의 여러 표기를 정규화된 별칭으로 색인 (O(1) 조회용)"""
+        return {region: self.build_region_index(data) for region, data in statistics_data.items()}
+    
+    def build_region_index(self, data: Dict) -> Dict[str, List[str]]:
+        """지역 하나의 {정규화된 별칭: [구/군 이름]} 색인"""
+        index = {}
+        for district in data['districts']:
+            for alias in self.get_district_aliases(district):
+                candidates = index.setdefault(alias, [])
+                if district not in candidates:
+                    candidates.append(district)
+        return index
+    
+    @staticmethod
+    def get_district_aliases(district: str) -> List[str]:
+        """
+        구/군 이름의 별칭 목록
+        "수원시 영통구" -> ["수원시 영통구", "수원시영통구", "영통구", "영통", "수원 영통구", "수원시", "수원"]
+        """
+        tokens = district.split()
+        aliases = [' '.join(tokens), ''.join(tokens)]
+        
+        # 마지막 행정구역 이름 (구/군)과 접미어를 뗀 약칭
+        last = tokens[-1]
+        aliases.append(last)
+        if last.endswith(DISTRICT_SUFFIXES) and len(last) > 2:
+            aliases.append(last[:-1])
+        
+        # "수원시 영통구" 형태는 "수원 영통구", "수원시", "수원"으로도 찾을 수 있도록 (여러 구가 있으면 모호)
+        if len(tokens) >= 2:
+            city = tokens[0]
+            aliases.append(city)
+            if city.endswith('시') and len(city) > 2:
+                short_city = city[:-1]
+                aliases.append(short_city)
+                aliases.append(' '.join([short_city] + tokens[1:]))
         
-        return processed_data
+        return aliases
+    
+    def normalize_district_query(self, region: str, district: str) -> List[str]:
+        """
+        사용자 입력을 색인 조회 키 목록으로 변환 (앞선 키가 우선)
+        "서울특별시 강남구 역삼동" -> ["강남구 역삼동", "강남구역삼동", "강남구", ...]
+        "서울특별시강남구"처럼 띄어쓰기 없이 붙은 접두어는 입력 그대로의 키 다음에 떼어낸 키로 조회
+        ("부산진구"처럼 구/군 이름이 접두어로 시작하는 경우를 먼저 찾도록)
+        """
+        tokens = district.split()
+        
+        # 시/도 접두어 제거 ("서울시 강남구", "서울특별시 강남구" -> "강남구")
+        prefixes = REGION_ALIASES.get(region, [region])
+        while tokens and tokens[0] in prefixes:
+            tokens = tokens[1:]
+        if not tokens:
+            return []
+        
+        keys = self.build_query_keys(tokens)
+        # 붙어 있는 시/도 접두어 제거 ("서울특별시강남구" -> "강남구", 긴 접두어부터)
+        for prefix in sorted(prefixes, key=len, reverse=True):
+            if tokens[0].startswith(prefix):
+                keys.extend(self.build_query_keys([tokens[0][len(prefix):]] + tokens[1:]))
+                break
+        return keys
+    
+    @staticmethod
+    def build_query_keys(tokens: List[str]) -> List[str]:
+        """단어 목록의 색인 조회 키 목록 (앞선 키가 우선)"""
+        keys = [' '.join(tokens), ''.join(tokens)]
+        # 뒤쪽 세부 주소(동/읍/면 등)를 하나씩 떼어가며 조회
+        keys.extend(' '.join(tokens[:length]) for length in range(len(tokens) - 1, 0, -1))
+        # 단어 단위로 뒤에서부터 조회 ("고양 일산동구" -> "일산동구")
+        keys.extend(reversed(tokens[1:]))
+        return keys
+    
+    def resolve_district(self, region: str, district: str,
+                         state: Optional[StatisticsState] = None) -> Tuple[Optional[str], List[str]]:
+        """
+        입력된 구/군 이름을 데이터의 구/군 이름으로 변환
+        (일치하는 구/군, 후보 목록) 반환. 후보가 여러 개면 모호하므로 일치 항목은 None
+        state: 호출하는 쪽이 이미 읽은 StatisticsState (없으면 현재 state)
+        """
+        index = (state or self.state).district_index.get(region)
+        if not index or not district:
+            return None, []
+        
+        for key in self.normalize_district_query(region, district):
+            candidates = index.get(key)
+            if candidates:
+                if len(candidates) == 1:
+                    return candidates[0], candidates
+                return None, list(candidates)
+        
+        return None, []
     
     def get_district_statistics(self, region: str, district: str) -> Optional[Dict]:
-        """특정 지역의 구/군 통계 정보 반환"""
-        if region in self.statistics_data:
+        """특정 지역의 구/군 통계 정보 반환 (일치하는 구/군이 없거나 모호하면 None)"""
+        # 다시 로드 중에도 state는 한 번만 읽어 통계와 색인을 일관되게 사용
+        state = self.state
+        data = state.statistics_data.get(region)
+        if data:
             # 정확한 매칭 시도
-            if district in self.statistics_data[region]['districts']:
-                return self.statistics_data[region]['districts'][district]
-            
-            # 경기도의 경우 세분화된 구/군 정보 처리
-            if region == '경기' and '시' in district:
-                # "수원시 영통구" -> "영통구"로 변환하여 검색
-                district_parts = district.split(' ')
-                if len(district_parts) >= 2:
-                    simplified_district = district_parts[-1]  # 마지막 부분 (구/군)
-                    if simplified_district in self.statistics_data[region]['districts']:
-                        return self.statistics_data[region]['districts'][simplified_district]
+            if district in data['districts']:
+                return data['districts'][district]
             
-            # 부분 매칭 시도 (구/군 이름만으로 검색)
-            for stored_district, data in self.statistics_data[region]['districts'].items():
-                if stored_district in district or district in stored_district:
-                    return data
+            # 별칭 색인 조회 ("서울시 강남구", "수원시 영통구", "영통구", "강남" 등)
+            matched, _ = self.resolve_district(region, district, state)
+            if matched:
+                return data['districts'].get(matched)
                     
         return None
     
+    def get_district_trend(self, region: str, district: Optional[str] = None, start: Optional[str] = None,
+                           end: Optional[str] = None, window: int = 12) -> Optional[Dict]:
+        """
+        구/군(없으면 지역 전체)의 기간별 추세 (구간 합계, 이동 매각률, 전년 동기 대비 변화)
+        start, end는 YYYYMM (없으면 보관 중인 전체 기간), 잘못된 값이면 ValueError
+        """
+        state = self.state
+        if district:
+            data = state.statistics_data.get(region)
+            if data and district not in data['districts']:
+                district, _ = self.resolve_district(region, district, state)
+            if not district:
+                return None
+        
+        return state.timeseries.get_trend(
+            region, district or None,
+            parse_period(start) if start else None,
+            parse_period(end) if end else None,
+            window
+        )
+    
     def get_region_summary(self, region: str) -> Optional[Dict]:
         """지역별 전체 요약 통계 반환"""
-        if region in self.statistics_data:
-            return self.statistics_data[region]['summary']
+        data = self.statistics_data.get(region)
+        if data:
+            return data['summary']
         return None
     
     def get_all_regions_summary(self) -> Dict:
@@ -147,31 +624,64 @@ class AuctionStatisticsAnalyzer:
             summary[region] = data['summary']
         return summary
     
-    def find_best_districts_by_sale_rate(self, region: str, limit: int = 5) -> List[Tuple[str, float]]:
-        """지역별 매각률이 높은 구/군 순위 반환"""
-        if region not in self.statistics_data:
-            return []
+    def build_rankings(self, statistics_data: Dict) -> Dict:
+        """지역별, 지표별 구/군 순위를 미리 계산 (동점이면 원본 순서 유지)"""
+        return {region: self.build_region_rankings(data) for region, data in statistics_data.items()}
+    
+    def build_region_rankings(self, data: Dict) -> Dict:
+        """지역 하나의 지표별 내림차순/오름차순 순위"""
+        names = [name for name in data['districts'] if name != TOTAL_ROW_NAME]
+        region_rankings = {}
         
-        districts = []
-        for district, data in self.statistics_data[region]['districts'].items():
-            districts.append((district, data['sale_rate']))
+        for metric in RANKING_METRICS:
+            values = [self.get_metric_value(data['districts'][name], metric) for name in names]
+            array = np.array(values, dtype=np.float64)
+            region_rankings[metric] = {
+                'desc': [(names[i], values[i]) for i in np.argsort(-array, kind='stable')],
+                'asc': [(names[i], values[i]) for i in np.argsort(array, kind='stable')]
+            }
         
-        # 매각률 기준으로 내림차순 정렬
-        districts.sort(key=lambda x: x[1], reverse=True)
-        return districts[:limit]
+        return region_rankings
     
-    def find_best_districts_by_sale_price_rate(self, region: str, limit: int = 5) -> List[Tuple[str, float]]:
-        """지역별 매각가율이 높은 구/군 순위 반환"""
-        if region not in self.statistics_data:
+    def get_metric_value(self, stats: Dict, metric: str) -> float:
+        """구/군 통계에서 순위 지표 값 추출"""
+        if metric == 'market_score':
+            return self.calculate_market_score(stats)
+        return stats[metric]
+    
+    def get_top_districts(self, region: str, metric: str = 'sale_rate', limit: Optional[int] = 5,
+                          ascending: bool = False) -> List[Dict]:
+        """
+        미리 계산된 순위에서 상위 구/군 반환
+        각 항목: district, value, rank (1부터), percentile (순위 기준 상위 백분위, 1위 = 100)
+        """
+        if metric not in RANKING_METRICS:
+            raise ValueError(f"지원하지 않는 지표입니다: {metric}")
+        region_rankings = self.rankings.get(region)
+        if not region_rankings:
             return []
         
-        districts = []
-        for district, data in self.statistics_data[region]['districts'].items():
-            districts.append((district, data['sale_price_rate']))
+        ranking = region_rankings[metric]['asc' if ascending else 'desc']
+        total = len(ranking)
+        selected = ranking if limit is None else ranking[:max(limit, 0)]
         
-        # 매각가율 기준으로 내림차순 정렬
-        districts.sort(key=lambda x: x[1], reverse=True)
-        return districts[:limit]
+        return [
+            {
+                'district': district,
+                'value': value,
+                'rank': rank,
+                'percentile': round((total - rank) / (total - 1) * 100, 1) if total > 1 else 100.0
+            }
+            for rank, (district, value) in enumerate(selected, 1)
+        ]
+    
+    def find_best_districts_by_sale_rate(self, region: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """지역별 매각률이 높은 구/군 순위 반환"""
+        return [(d['district'], d['value']) for d in self.get_top_districts(region, 'sale_rate', limit)]
+    
+    def find_best_districts_by_sale_price_rate(self, region: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """지역별 매각가율이 높은 구/군 순위 반환"""
+        return [(d['district'], d['value']) for d in self.get_top_districts(region, 'sale_price_rate', limit)]
     
     def get_market_condition_score(self, region: str, district: str) -> float:
         """지역/구별 시장 상황 점수 계산 (0-100)"""
@@ -179,6 +689,11 @@ class AuctionStatisticsAnalyzer:
         if not stats:
             return 50.0  # 기본값
         
+        return self.calculate_market_score(stats)
+    
+    @staticmethod
+    def calculate_market_score(stats: Dict) -> float:
+        """구/군 통계로 시장 상황 점수 계산"""
         # 매각률과 매각가율을 종합하여 시장 상황 점수 계산
         sale_rate_score = min(stats['sale_rate'] * 2, 100)  # 매각률 * 2 (최대 100)
         sale_price_score = stats['sale_price_rate']  # 매각가율 그대로 사용
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+최적 입찰가 탐색
+generateChartData의 10개 구간 중에서 고르는 대신(findOptimalBidFromChart)
+낙찰 확률/비용 모델 위에서 직접 탐색하여 원하는 정밀도(원)의 입찰가 계산
+
+- 목표 낙찰 확률: 낙찰 확률은 입찰가에 대해 단조 증가하므로 이분 탐색으로
+  목표 확률에 도달하는 가장 낮은 입찰가를 찾음
+- 리스크 조정 수익률 최대화: 낙찰 확률이 바뀌는 지점(가격비율 구간 경계)을 이분 탐색으로 찾아
+  구간을 나누고, 각 구간에서 황금분할 탐색으로 최댓값을 찾은 뒤 가장 좋은 값 선택
+"""
+
+import math
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+import bid_simulation
+from bid_simulation import DEFAULT_SALE_PRICE_RATE, BASE_PROBABILITY_THRESHOLDS, URGENCY_LEVELS
+
+logger = logging.getLogger(__name__)
+
+# 입찰긴급도별 목표 낙찰 확률 범위 (calculateRecommendedBidForOptimalProbability)
+TARGET_PROBABILITY_RANGES = {
+    'low': (0.30, 0.40),
+    'medium': (0.40, 0.50),
+    'high': (0.50, 0.60)
+}
+
+GOLDEN_RATIO = (math.sqrt(5) - 1) / 2
+
+def bisect_lowest(predicate: Callable[[float], bool], low: float, high: float, precision: float) -> float:
+    """predicate가 참이 되는 가장 낮은 값 (low에서 거짓, high에서 참인 단조 조건)"""
+    while high - low > precision:
+        middle = (low + high) / 2
+        if predicate(middle):
+            high = middle
+        else:
+            low = middle
+    return high
+
+def golden_section_maximize(func: Callable[[float], float], low: float, high: float,
+                            precision: float) -> Tuple[float, float]:
+    """구간 안에서 func를 최대화하는 값과 최댓값 (구간 양 끝도 후보에 포함)"""
+    candidates = [(func(low), -low), (func(high), -high)]
+
+    a, b = low, high
+    c = b - GOLDEN_RATIO * (b - a)
+    d = a + GOLDEN_RATIO * (b - a)
+    fc, fd = func(c), func(d)
+    while b - a > precision:
+        # 같은 값이면 낮은 입찰가 쪽을 남김
+        if fc >= fd:
+            b, d, fd = d, c, fc
+            c = b - GOLDEN_RATIO * (b - a)
+            fc = func(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + GOLDEN_RATIO * (b - a)
+            fd = func(d)
+    candidates.extend([(fc, -c), (fd, -d)])
+
+    # 최댓값이 같으면 더 낮은 입찰가 선택
+    value, negative_bid = max(candidates)
+    return -negative_bid, value
+
+def solve_target_probability_bids(market_prices, minimum_bids, maximum_bids, competitor_counts, urgencies,
+                                  failed_counts, sale_price_rates, target_probabilities) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    여러 물건의 목표 낙찰 확률 입찰가를 한 번에 계산 (BidOptimizer.solve_target_probability의 벡터 버전, 1원 단위)
+    낙찰 확률은 가격비율 구간 경계에서만 바뀌므로 최저입찰가와 각 경계 입찰가만 평가하고
+    목표에 도달하는 첫 입찰가 선택 (도달할 수 없으면 최고 확률에 도달하는 첫 입찰가)
+
+    반환값: (입찰가, 낙찰 확률) 배열
+    """
+    market_prices = np.asarray(market_prices, dtype=float)[:, np.newaxis]
+    minimum_bids = np.ceil(np.asarray(minimum_bids, dtype=float))[:, np.newaxis]
+    maximum_bids = np.asarray(maximum_bids, dtype=float)[:, np.newaxis]
+    urgencies = np.array([bid_simulation.normalize_urgency(u) for u in urgencies], dtype=object)
+    thresholds = BASE_PROBABILITY_THRESHOLDS[bid_simulation.get_urgency_codes(urgencies)]
+
+    # 경계 입찰가 (부동소수점 오차로 경계 미만이 되면 1원 올림)
+    with np.errstate(invalid='ignore'):
+        boundaries = np.ceil(thresholds * market_prices)
+        boundaries = np.where(boundaries / market_prices < thresholds, boundaries + 1, boundaries)
+    candidates = np.concatenate([minimum_bids, np.clip(boundaries, minimum_bids, maximum_bids)], axis=1)
+
+    probabilities = bid_simulation.calculate_advanced_win_probability(
+        candidates / market_prices,
+        np.asarray(competitor_counts, dtype=float)[:, np.newaxis],
+        urgencies[:, np.newaxis],
+        np.asarray(failed_counts, dtype=float)[:, np.newaxis],
+        np.asarray(sale_price_rates, dtype=float)[:, np.newaxis]
+    )
+    reached = probabilities >= np.asarray(target_probabilities, dtype=float)[:, np.newaxis]
+    index = np.where(reached.any(axis=1), reached.argmax(axis=1), probabilities.argmax(axis=1))
+
+    rows = np.arange(len(candidates))
+    return candidates[rows, index], probabilities[rows, index]
+
+class BidOptimizer:
+    def __init__(self, market_price: float, appraisal_price: float, minimum_bid: float,
+                 competitor_count: float = 5, urgency: str = 'medium', failed_count: float = 0,
+                 sale_price_rate: float = DEFAULT_SALE_PRICE_RATE, renovation_cost: float = 0,
+                 market_condition: str = 'normal'):
+        """입찰 조건 (낙찰 확률은 generateChartData와 같이 시세 대비 가격비율로 계산)"""
+        self.market_price = market_price
+        self.appraisal_price = appraisal_price
+        self.minimum_bid = minimum_bid
+        self.competitor_count = competitor_count
+        self.urgency = bid_simulation.normalize_urgency(urgency)
+        self.failed_count = failed_count
+        self.sale_price_rate = sale_price_rate
+        self.renovation_cost = renovation_cost
+        self.market_condition = market_condition
+        # 모델 평가 횟수 (탐색 비용 확인용)
+        self.evaluations = 0
+
+    def win_probability(self, bid: float) -> float:
+        self.evaluations += 1
+        return float(bid_simulation.calculate_advanced_win_probability(
+            bid / self.market_price, self.competitor_count, self.urgency,
+            self.failed_count, self.sale_price_rate
+        ))
+
+    def total_cost(self, bid: float) -> float:
+        """입찰가 + 부대비용 + 수리비"""
+        return bid + float(bid_simulation.calculate_additional_costs(bid)) + self.renovation_cost
+
+    def risk_adjusted_profit(self, bid: float) -> float:
+        return float(bid_simulation.calculate_risk_adjusted_profit(
+            self.market_price, self.total_cost(bid), self.win_probability(bid),
+            self.market_condition, self.failed_count
+        ))
+
+    def get_bounds(self, low: Optional[float] = None, high: Optional[float] = None) -> Tuple[float, float]:
+        """탐색 구간 (기본값: 최저입찰가 ~ 감정가의 120%)"""
+        low = self.minimum_bid if low is None else max(low, self.minimum_bid)
+        high = self.appraisal_price * 1.2 if high is None else high
+        if high <= low:
+            raise ValueError('탐색 구간의 상한이 하한보다 커야 합니다.')
+        return low, high
+
+    def find_probability_breaks(self, low: float, high: float, precision: float) -> List[float]:
+        """구간 안에서 낙찰 확률이 바뀌는 입찰가 목록 (가격비율 경계 주변을 이분 탐색)"""
+        thresholds = BASE_PROBABILITY_THRESHOLDS[URGENCY_LEVELS.index(self.urgency)]
+        breaks = []
+        for threshold in thresholds[np.isfinite(thresholds)]:
+            # 경계값 계산의 부동소수점 오차를 감안해 앞뒤로 여유를 두고 탐색
+            left = max(low, threshold * self.market_price * (1 - 1e-6))
+            right = min(high, threshold * self.market_price * (1 + 1e-6))
+            if left >= right:
+                continue
+            before = self.win_probability(left)
+            if self.win_probability(right) == before:
+                continue
+            breaks.append(bisect_lowest(lambda bid: self.win_probability(bid) != before, left, right, precision))
+        return breaks
+
+    def solve_target_probability(self, target_probability: Optional[float] = None, precision: float = 1000,
+                                 low: Optional[float] = None, high: Optional[float] = None) -> Dict:
+        """
+        목표 낙찰 확률에 도달하는 가장 낮은 입찰가
+        목표가 없으면 입찰긴급도별 목표 범위의 중앙값
+        구간 안에서 도달할 수 없으면 구간 내 최고 확률에 도달하는 가장 낮은 입찰가
+        """
+        if target_probability is None:
+            target_probability = sum(TARGET_PROBABILITY_RANGES[self.urgency]) / 2
+        low, high = self.get_bounds(low, high)
+
+        def reached(bid):
+            return self.win_probability(bid) >= target_probability
+
+        if reached(low):
+            bid = low
+        elif not reached(high):
+            highest = self.win_probability(high)
+            bid = bisect_lowest(lambda bid: self.win_probability(bid) >= highest, low, high, precision)
+        else:
+            bid = bisect_lowest(reached, low, high, precision)
+
+        result = self.describe(bid, precision)
+        result['targetProbability'] = target_probability
+        result['achieved'] = result['winProbability'] >= target_probability
+        return result
+
+    def solve_max_profit(self, precision: float = 1000, low: Optional[float] = None,
+                         high: Optional[float] = None) -> Dict:
+        """리스크 조정 수익률이 가장 높은 입찰가"""
+        low, high = self.get_bounds(low, high)
+        edges = [low] + self.find_probability_breaks(low, high, precision) + [high]
+
+        best_bid, best_value = None, None
+        for segment_low, segment_high in zip(edges, edges[1:]):
+            # 확률 경계 바로 아래까지만 같은 구간 (경계값은 다음 구간에서 평가)
+            if segment_high < high:
+                segment_high = max(segment_low, segment_high - precision)
+            bid, value = golden_section_maximize(self.risk_adjusted_profit, segment_low, segment_high, precision)
+            if best_value is None or value > best_value:
+                best_bid, best_value = bid, value
+
+        return self.describe(best_bid, precision)
+
+    def describe(self, bid: float, precision: float) -> Dict:
+        """입찰가별 결과 (정밀도 단위로 올림한 입찰가 기준)"""
+        bid = math.ceil(bid / precision) * precision
+        probability = self.win_probability(bid)
+        total_cost = self.total_cost(bid)
+        return {
+            'bidPrice': bid,
+            'winProbability': probability,
+            'expectedProfit': float(bid_simulation.calculate_expected_profit(self.market_price, total_cost)),
+            'riskAdjustedProfit': self.risk_adjusted_profit(bid),
+            'totalCost': total_cost,
+            'precision': precision,
+            'evaluations': self.evaluations
+        }
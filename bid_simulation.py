@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+입찰 시뮬레이션 엔진
+script.js의 낙찰 확률/수익률 모델(calculateWinProbability, calculateAdvancedWinProbability,
+generateChartData, calculateOptimalBid)을 NumPy로 구현하여
+입찰가 구간 × 경쟁자 수 × 입찰긴급도 조합을 한 번의 벡터 연산으로 계산
+"""
+
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+
+import auction_costs
+
+logger = logging.getLogger(__name__)
+
+# 입찰긴급도 (확률 테이블의 행 순서)
+URGENCY_LEVELS = ('high', 'medium', 'low')
+URGENCY_ALIASES = {
+    '높음': 'high', '보통': 'medium', '낮음': 'low',
+    'high': 'high', 'medium': 'medium', 'low': 'low'
+}
+
+# 화면에 매각가율이 없을 때 사용하는 기본값 (getCurrentSalePriceRate)
+DEFAULT_SALE_PRICE_RATE = 80.0
+
+# 가격비율 구간별 기본 낙찰 확률: 가격비율이 i번째 경계값 미만이면 i번째 확률
+# (높음은 경계값이 하나 적으므로 마지막 구간을 같은 확률로 채움)
+BASE_PROBABILITY_THRESHOLDS = np.array([
+    [0.70, 0.80, 0.88, 0.95, 1.03, 1.13, np.inf],
+    [0.65, 0.75, 0.83, 0.90, 0.97, 1.05, 1.15],
+    [0.60, 0.70, 0.78, 0.85, 0.93, 1.03, 1.13]
+])
+BASE_PROBABILITIES = np.array([
+    [0.20, 0.40, 0.55, 0.70, 0.85, 0.95, 0.98, 0.98],
+    [0.15, 0.35, 0.50, 0.65, 0.80, 0.90, 0.95, 0.98],
+    [0.10, 0.25, 0.35, 0.45, 0.60, 0.75, 0.85, 0.90]
+])
+
+# 경쟁자 수별 확률 조정: 2명 이하, 3~8명, 9명 이상
+COMPETITION_PENALTIES = np.array([
+    [1.05, 0.95, 0.88, 0.82, 0.78, 0.75, 0.72, 0.70],
+    [1.00, 0.90, 0.80, 0.75, 0.70, 0.65, 0.60, 0.55],
+    [0.95, 0.85, 0.75, 0.68, 0.62, 0.58, 0.55, 0.50]
+])
+
+# 유찰 횟수별 확률 조정: 0~3회, 그 외
+FAILURE_BONUSES = np.array([
+    [0.92, 1.15, 1.35, 1.25, 1.10],
+    [0.90, 1.10, 1.25, 1.15, 1.05],
+    [0.88, 1.05, 1.15, 1.08, 1.02]
+])
+
+# 매각가율(%) 구간별 확률 조정: 경계값 미만이면 해당 구간
+SALE_RATE_THRESHOLDS = np.array([70, 75, 80, 85, 90])
+SALE_RATE_ADJUSTMENTS = np.array([
+    [0.80, 0.90, 1.00, 1.10, 1.20, 1.30],
+    [0.75, 0.85, 0.95, 1.05, 1.15, 1.25],
+    [0.70, 0.80, 0.90, 1.00, 1.08, 1.15]
+])
+
+# 입찰긴급도별 권장 입찰가 배수 (getUrgencyMultiplier)
+URGENCY_MULTIPLIERS = {'high': 1.12, 'medium': 1.0, 'low': 0.92}
+
+# 경매 유형별 수수료율 합계 (getAuctionFees: 경매 수수료 + 등기비용 + 세금 + 기타 비용)
+AUCTION_FEE_RATES = {
+    'realEstate': 0.02 + 0.001 + 0.04 + 0.005,
+    'vehicle': 0.03 + 0.002 + 0.03 + 0.003,
+    'art': 0.15 + 0.001 + 0.10 + 0.005,
+    'general': 0.05 + 0.001 + 0.10 + 0.003
+}
+
+# 시장 상황별 리스크 프리미엄(%)과 변동성 배수 (calculateRiskPremium, calculateVolatilityAdjustment)
+MARKET_RISK_PREMIUMS = {'hot': 5, 'normal': 0, 'cold': -3}
+MARKET_VOLATILITY_FACTORS = {'hot': 1.5, 'normal': 1.0, 'cold': 0.7}
+
+def normalize_urgency(urgency: Optional[str]) -> str:
+    """입찰긴급도를 high/medium/low로 변환 (알 수 없는 값은 medium)"""
+    return URGENCY_ALIASES.get(urgency, 'medium')
+
+def get_urgency_codes(urgency) -> np.ndarray:
+    """입찰긴급도(문자열 또는 배열)를 확률 테이블의 행 번호로 변환"""
+    urgency = np.asarray(urgency, dtype=object)
+    codes = [URGENCY_LEVELS.index(normalize_urgency(value)) for value in urgency.ravel()]
+    return np.array(codes, dtype=np.intp).reshape(urgency.shape)
+
+def js_round(value: float) -> int:
+    """JS Math.round와 같은 반올림 (0.5는 항상 올림)"""
+    return int(np.floor(value + 0.5))
+
+def calculate_advanced_win_probability(price_ratio, competitor_count=5, urgency='medium',
+                                       failed_count=0, sale_price_rate=DEFAULT_SALE_PRICE_RATE) -> np.ndarray:
+    """
+    calculateAdvancedWinProbability의 벡터 버전 (0.1~0.95)
+
+    모든 인자는 스칼라 또는 배열이며 NumPy 브로드캐스팅 규칙에 따라 결합된다.
+    urgency에는 '높음'/'보통'/'낮음' 또는 high/medium/low를 사용할 수 있다.
+    """
+    price_ratio = np.asarray(price_ratio, dtype=float)
+    competitor_count = np.asarray(competitor_count, dtype=float)
+    failed_count = np.asarray(failed_count, dtype=float)
+    sale_price_rate = np.asarray(sale_price_rate, dtype=float)
+    codes = get_urgency_codes(urgency)
+
+    # 값이 없으면 JS와 같은 기본값 사용 (경쟁자 5명, 유찰 0회)
+    competitor_count = np.where(np.isnan(competitor_count), 5, competitor_count)
+    failed_count = np.where(np.isnan(failed_count), 0, failed_count)
+
+    # 1. 가격비율 구간별 기본 확률
+    thresholds = BASE_PROBABILITY_THRESHOLDS[codes]
+    ratio_index = np.sum(price_ratio[..., np.newaxis] >= thresholds, axis=-1)
+    probability = BASE_PROBABILITIES[codes, ratio_index]
+
+    # 2. 경쟁자 수 조정 (JS와 같이 3~8명은 정수일 때만 해당 구간)
+    is_whole = competitor_count == np.floor(competitor_count)
+    competitor_index = np.where(
+        competitor_count <= 2, 0,
+        np.where(is_whole & (competitor_count <= 8), competitor_count - 2, 7)
+    ).astype(np.intp)
+    probability = probability * COMPETITION_PENALTIES[codes, competitor_index]
+
+    # 3. 유찰 횟수 조정
+    is_whole = failed_count == np.floor(failed_count)
+    failure_index = np.where(is_whole & (failed_count >= 0) & (failed_count <= 3), failed_count, 4).astype(np.intp)
+    probability = probability * FAILURE_BONUSES[codes, failure_index]
+
+    # 4. 매각가율 조정
+    sale_rate_index = np.searchsorted(SALE_RATE_THRESHOLDS, sale_price_rate, side='right')
+    probability = probability * SALE_RATE_ADJUSTMENTS[codes, sale_rate_index]
+
+    probability = np.clip(probability, 0.1, 0.95)
+
+    # 가격비율을 계산할 수 없으면 50%
+    return np.where(np.isnan(price_ratio), 0.5, probability)
+
+def calculate_win_probability(bid_price, expected_winning_bid, competitor_count) -> np.ndarray:
+    """calculateWinProbability(예상낙찰가 대비 입찰가 기준)의 벡터 버전, 결과는 퍼센트(5~95) 정수"""
+    price_ratio = np.asarray(bid_price, dtype=float) / np.asarray(expected_winning_bid, dtype=float)
+    probability = np.select(
+        [price_ratio >= 1.0, price_ratio >= 0.98, price_ratio >= 0.95, price_ratio >= 0.90],
+        [90, 75, 55, 35],
+        default=15
+    )
+    probability = probability - np.maximum(0, 10 - np.asarray(competitor_count, dtype=float))
+    # JS Math.round와 같이 0.5는 올림
+    return np.floor(np.clip(probability, 5, 95) + 0.5)
+
+def calculate_additional_costs(bid_price, property_type='아파트', home_count=1) -> np.ndarray:
+    """
+    낙찰가별 부대비용 합계 (calculateDetailedAuctionCosts의 totalAdditionalCosts, 기본값: 아파트, 1주택)
+    세금(취득세, 지방교육세, 농어촌특별세) + 등기비용 + 법무사 수수료 + 미납 공과금
+    """
+    return auction_costs.calculate_detailed_auction_costs(bid_price, property_type, home_count)['total_additional_costs']
+
+def calculate_expected_profit(property_value, total_cost) -> np.ndarray:
+    """예상 수익률(%) (calculateExpectedProfit)"""
+    total_cost = np.asarray(total_cost, dtype=float)
+    return (np.asarray(property_value, dtype=float) - total_cost) / total_cost * 100
+
+def calculate_risk_adjusted_profit(property_value, total_cost, win_probability,
+                                   market_condition: str = 'normal', failed_count=0) -> np.ndarray:
+    """
+    리스크 조정 수익률(%) (calculateRiskAdjustedProfit, -50~200)
+    기대 수익률(수익률 × 낙찰 확률) + 리스크 프리미엄 - 변동성 조정
+    """
+    win_probability = np.asarray(win_probability, dtype=float)
+    expected_profit = calculate_expected_profit(property_value, total_cost) * win_probability
+
+    risk_premium = (MARKET_RISK_PREMIUMS.get(market_condition, 0)
+                    - 2 * np.asarray(failed_count, dtype=float)
+                    + np.select([win_probability < 0.3, win_probability < 0.6], [10, 5], default=0))
+    volatility_adjustment = (1 - win_probability) * 15 * MARKET_VOLATILITY_FACTORS.get(market_condition, 1.0)
+
+    return np.clip(expected_profit + risk_premium - volatility_adjustment, -50, 200)
+
+def calculate_bid_profit(bid_price, market_price, renovation_cost=0) -> np.ndarray:
+    """입찰가로 낙찰받았을 때 시세 기준 예상 수익률(%) (generateChartData의 수익률)"""
+    bid_price = np.asarray(bid_price, dtype=float)
+    total_cost = bid_price + calculate_additional_costs(bid_price) + renovation_cost
+    return calculate_expected_profit(market_price, total_cost)
+
+def create_bid_grid(minimum_bid: float, appraisal_price: float, points: int = 10) -> np.ndarray:
+    """최저입찰가의 80%부터 감정가의 120%까지 균등 간격 입찰가 (generateChartData 구간)"""
+    return np.linspace(minimum_bid * 0.8, appraisal_price * 1.2, points)
+
+def simulate_bid_grid(bid_prices, market_price: float, competitor_counts=(5,), urgencies=('medium',),
+                      failed_count: float = 0, sale_price_rate: float = DEFAULT_SALE_PRICE_RATE,
+                      renovation_cost: float = 0) -> Dict[str, np.ndarray]:
+    """
+    입찰가 × 경쟁자 수 × 입찰긴급도 전체 조합의 낙찰 확률을 한 번에 계산
+
+    반환값:
+    - probabilities: (입찰긴급도, 경쟁자 수, 입찰가) 모양의 낙찰 확률
+    - profits: 입찰가별 예상 수익률(%) (경쟁자 수, 입찰긴급도와 무관)
+    - expected_profits: 낙찰 확률을 곱한 기대 수익률(%), probabilities와 같은 모양
+    """
+    bid_prices = np.asarray(bid_prices, dtype=float)
+    competitor_counts = np.asarray(competitor_counts, dtype=float)
+    codes = np.asarray([URGENCY_LEVELS.index(normalize_urgency(u)) for u in urgencies], dtype=np.intp)
+
+    price_ratios = bid_prices / market_price
+    probabilities = calculate_advanced_win_probability(
+        price_ratios[np.newaxis, np.newaxis, :],
+        competitor_counts[np.newaxis, :, np.newaxis],
+        np.array(URGENCY_LEVELS, dtype=object)[codes][:, np.newaxis, np.newaxis],
+        failed_count,
+        sale_price_rate
+    )
+    profits = calculate_bid_profit(bid_prices, market_price, renovation_cost)
+
+    return {
+        'price_ratios': price_ratios,
+        'probabilities': probabilities,
+        'profits': profits,
+        'expected_profits': probabilities * profits
+    }
+
+def generate_chart_data(market_price: float, appraisal_price: float, minimum_bid: float,
+                        competitor_count: float = 5, urgency: str = 'medium', failed_count: float = 0,
+                        renovation_cost: float = 0, sale_price_rate: float = DEFAULT_SALE_PRICE_RATE,
+                        points: int = 10) -> Dict[str, list]:
+    """입찰가격별 낙찰 확률/수익률 그래프 데이터 (generateChartData)"""
+    bid_prices = create_bid_grid(minimum_bid, appraisal_price, points)
+    result = simulate_bid_grid(bid_prices, market_price, [competitor_count], [urgency],
+                               failed_count, sale_price_rate, renovation_cost)
+    return {
+        'bidPrices': bid_prices.tolist(),
+        'probabilities': result['probabilities'][0, 0].tolist(),
+        'profits': result['profits'].tolist()
+    }
+
+def calculate_recommended_bid_price(market_price: float, sale_price_rate: float, target_profit_rate: float,
+                                    auction_type: str = 'realEstate', renovation_cost: float = 0) -> Dict:
+    """매각가율 기반 권장 입찰가 (calculateRecommendedBidPrice)"""
+    expected_auction_price = market_price * (sale_price_rate / 100)
+    total_additional_costs = renovation_cost + expected_auction_price * 0.015
+    total_fees = expected_auction_price * AUCTION_FEE_RATES.get(auction_type, AUCTION_FEE_RATES['general'])
+    target_profit = expected_auction_price * (target_profit_rate / 100)
+
+    recommended_bid_price = expected_auction_price - total_additional_costs - total_fees - target_profit
+    # 최소 입찰가 보장 (시세의 30% 이상)
+    final_bid_price = max(recommended_bid_price, market_price * 0.3)
+
+    return {
+        'recommendedBidPrice': js_round(final_bid_price),
+        'expectedAuctionPrice': js_round(expected_auction_price),
+        'totalAdditionalCosts': js_round(total_additional_costs),
+        'totalFees': js_round(total_fees),
+        'targetProfit': js_round(target_profit),
+        'profitMargin': f"{target_profit / final_bid_price * 100:.1f}"
+    }
+
+def create_target_search_ratios() -> np.ndarray:
+    """목표 확률 탐색용 가격비율 (JS 반복문과 같은 부동소수점 값을 쓰도록 누적 합으로 생성)"""
+    ratios = []
+    ratio = 0.30
+    while ratio <= 0.80:
+        ratios.append(ratio)
+        ratio += 0.01
+    return np.array(ratios)
+
+# calculatePriceRatioForTargetProbability의 탐색 구간 (0.30~0.80, 0.01 간격)
+TARGET_SEARCH_RATIOS = create_target_search_ratios()
+
+def calculate_price_ratio_for_target_probability(target_probability: float, competitor_count: float = 5,
+                                                 urgency: str = 'medium', failed_count: float = 0,
+                                                 sale_price_rate: float = DEFAULT_SALE_PRICE_RATE) -> float:
+    """목표 낙찰 확률에 가장 가까운 가격비율 (0.30~0.80을 0.01 단위로 탐색, 오차 0.01 이하면 중단)"""
+    ratios = TARGET_SEARCH_RATIOS
+    errors = np.abs(calculate_advanced_win_probability(
+        ratios, competitor_count, urgency, failed_count, sale_price_rate
+    ) - target_probability)
+
+    close_enough = np.flatnonzero(errors <= 0.01)
+    if len(close_enough):
+        errors = errors[:close_enough[0] + 1]
+    return float(ratios[np.argmin(errors)])
+
+def calculate_optimal_bids(bid_prices, market_prices, appraisal_prices, minimum_bids, competitor_counts=5,
+                           urgencies='medium', failed_counts=0, renovation_costs=0, auction_type: str = 'realEstate',
+                           sale_price_rates=DEFAULT_SALE_PRICE_RATE) -> Dict[str, np.ndarray]:
+    """
+    calculate_optimal_bid의 물건 단위 벡터 버전 (인자는 스칼라 또는 같은 길이의 배열)
+    반환값: recommended_bids, win_probabilities, expected_profits (입력 입찰가를 가치로 사용)
+    """
+    bid_prices, market_prices, appraisal_prices, minimum_bids, competitor_counts, failed_counts, \
+        renovation_costs, sale_price_rates = np.broadcast_arrays(*[
+            np.atleast_1d(np.asarray(value, dtype=float)) for value in (
+                bid_prices, market_prices, appraisal_prices, minimum_bids, competitor_counts,
+                failed_counts, renovation_costs, sale_price_rates
+            )
+        ])
+    codes = np.broadcast_to(get_urgency_codes(urgencies), bid_prices.shape)
+    urgencies = np.array(URGENCY_LEVELS, dtype=object)[codes]
+    multipliers = np.array([URGENCY_MULTIPLIERS[level] for level in URGENCY_LEVELS])
+
+    # 매각가율 기반 권장 입찰가 (calculate_recommended_bid_price)
+    target_profit_rates = np.floor((bid_prices - market_prices) / market_prices * 100 + 0.5)
+    fee_rate = AUCTION_FEE_RATES.get(auction_type, AUCTION_FEE_RATES['general'])
+    expected_auction_prices = market_prices * (sale_price_rates / 100)
+    recommended = (expected_auction_prices - (renovation_costs + expected_auction_prices * 0.015)
+                   - expected_auction_prices * fee_rate - expected_auction_prices * (target_profit_rates / 100))
+    recommended = np.floor(np.maximum(recommended, market_prices * 0.3) + 0.5)
+
+    # 1. 입찰긴급도 배수, 2. 유찰 횟수 조정과 시세 대비 안전성 조정
+    recommended = recommended * multipliers[codes]
+    recommended = np.where(failed_counts > 0, recommended * np.maximum(0.95 ** failed_counts, 0.7), recommended)
+    recommended = np.where(recommended / market_prices > 0.9, recommended * 0.95, recommended)
+
+    # 3. 최저입찰가의 105% 이상, 감정가의 98% 이하, 최저입찰가의 200% 이하
+    recommended = np.maximum(recommended, minimum_bids * 1.05)
+    recommended = np.minimum(recommended, appraisal_prices * 0.98)
+    recommended = np.minimum(recommended, minimum_bids * 2.0)
+
+    # 4. 낙찰 확률이 50~60%를 벗어나면 목표 확률에 맞는 가격비율로 다시 계산
+    def win_probability(bids, mask):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_ratios = np.where(appraisal_prices[mask] > 0, bids / appraisal_prices[mask], 1.0)
+        return calculate_advanced_win_probability(
+            price_ratios, competitor_counts[mask], urgencies[mask], failed_counts[mask], sale_price_rates[mask]
+        )
+
+    everything = np.ones(len(recommended), dtype=bool)
+    probabilities = win_probability(recommended, everything)
+    outside = (probabilities < 0.50) | (probabilities > 0.60)
+    if outside.any():
+        errors = np.abs(calculate_advanced_win_probability(
+            TARGET_SEARCH_RATIOS[np.newaxis, :], competitor_counts[outside, np.newaxis],
+            urgencies[outside, np.newaxis], failed_counts[outside, np.newaxis],
+            sale_price_rates[outside, np.newaxis]
+        ) - np.where(probabilities[outside] < 0.50, 0.52, 0.58)[:, np.newaxis])
+        # 오차 0.01 이하인 첫 비율, 없으면 오차가 가장 작은 비율
+        close_enough = errors <= 0.01
+        index = np.where(close_enough.any(axis=1), close_enough.argmax(axis=1), errors.argmin(axis=1))
+        recommended[outside] = np.maximum(appraisal_prices[outside] * TARGET_SEARCH_RATIOS[index],
+                                          minimum_bids[outside] * 1.05)
+        probabilities[outside] = win_probability(recommended[outside], outside)
+
+    # 5. 총 비용 대비 예상 수익률 (JS와 같이 입력 입찰가를 가치로 사용)
+    total_costs = recommended + calculate_additional_costs(recommended) + renovation_costs
+    return {
+        'recommended_bids': recommended,
+        'win_probabilities': probabilities,
+        'expected_profits': calculate_expected_profit(bid_prices, total_costs)
+    }
+
+def calculate_optimal_bid(bid_price: float, market_price: float, appraisal_price: float, minimum_bid: float,
+                          competitor_count: float = 5, urgency: str = 'medium', failed_count: float = 0,
+                          renovation_cost: float = 0, auction_type: str = 'realEstate',
+                          sale_price_rate: float = DEFAULT_SALE_PRICE_RATE) -> Dict:
+    """
+    최적 입찰가 계산 (calculateOptimalBid)
+    매각가율 기반 권장 입찰가에 입찰긴급도, 유찰/시세 조정과 제한 조건을 적용한 뒤
+    낙찰 확률이 50~60%를 벗어나면 목표 확률에 맞는 가격비율로 다시 계산
+    """
+    target_profit_rate = js_round((bid_price - market_price) / market_price * 100)
+    bid_calculation = calculate_recommended_bid_price(
+        market_price, sale_price_rate, target_profit_rate, auction_type, renovation_cost
+    )
+
+    # 1. 입찰긴급도 배수
+    recommended_bid = bid_calculation['recommendedBidPrice'] * URGENCY_MULTIPLIERS[normalize_urgency(urgency)]
+
+    # 2. 유찰 횟수 조정 (1회당 5% 하향, 최대 30%)과 시세 대비 안전성 조정
+    if failed_count > 0:
+        recommended_bid *= max(0.95 ** failed_count, 0.7)
+    if recommended_bid / market_price > 0.9:
+        recommended_bid *= 0.95
+
+    # 3. 최저입찰가의 105% 이상, 감정가의 98% 이하, 최저입찰가의 200% 이하
+    recommended_bid = max(recommended_bid, minimum_bid * 1.05)
+    recommended_bid = min(recommended_bid, appraisal_price * 0.98)
+    recommended_bid = min(recommended_bid, minimum_bid * 2.0)
+
+    # 4. 낙찰 확률을 목표 범위(50~60%)로 조정
+    def win_probability(bid):
+        price_ratio = bid / appraisal_price if appraisal_price > 0 else 1.0
+        return float(calculate_advanced_win_probability(
+            price_ratio, competitor_count, urgency, failed_count, sale_price_rate
+        ))
+
+    probability = win_probability(recommended_bid)
+    if probability < 0.50 or probability > 0.60:
+        target_probability = 0.52 if probability < 0.50 else 0.58
+        price_ratio = calculate_price_ratio_for_target_probability(
+            target_probability, competitor_count, urgency, failed_count, sale_price_rate
+        )
+        recommended_bid = max(appraisal_price * price_ratio, minimum_bid * 1.05)
+        probability = win_probability(recommended_bid)
+
+    # 5. 총 비용 대비 예상 수익률 (JS와 같이 입력 입찰가를 가치로 사용)
+    total_cost = recommended_bid + float(calculate_additional_costs(recommended_bid)) + renovation_cost
+    expected_profit = float(calculate_expected_profit(bid_price, total_cost))
+
+    chart_data = generate_chart_data(
+        market_price, appraisal_price, minimum_bid, competitor_count, urgency,
+        failed_count, renovation_cost, sale_price_rate
+    )
+
+    return {
+        'recommendedBid': recommended_bid,
+        'winProbability': probability,
+        'expectedProfit': expected_profit,
+        'bidPrices': chart_data['bidPrices'],
+        'probabilities': chart_data['probabilities'],
+        'profits': chart_data['profits'],
+        'saleRateBasedCalculation': bid_calculation
+    }
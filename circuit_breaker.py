@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+업스트림 호스트별 서킷 브레이커와 실패 결과 캐시
+계속 실패하는 호스트는 일정 시간 호출하지 않고 바로 건너뛰어 타임아웃 대기를 없앰
+"""
+
+import time
+import threading
+import logging
+from typing import Dict, Hashable
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# 호스트 장애로 간주하는 HTTP 상태 코드 (인증 실패 포함: 잘못된 API 키는 재시도해도 실패)
+FAILURE_STATUS_CODES = {401, 403, 429}
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출하지 않은 경우"""
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 60):
+        """
+        - failure_threshold: 연속 실패가 이 횟수에 도달하면 서킷을 엶 (호출 차단)
+        - reset_timeout: 열린 뒤 이 시간(초)이 지나면 반열림 상태에서 한 번 시험 호출
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.total_failures = 0
+        self.total_successes = 0
+        self.rejected = 0
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """호출 가능 여부 (반열림 상태에서는 시험 호출 하나만 허용)"""
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    return False
+                self.state = HALF_OPEN
+                self._trial_in_progress = False
+
+            if self.state == HALF_OPEN:
+                if self._trial_in_progress:
+                    self.rejected += 1
+                    return False
+                self._trial_in_progress = True
+
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info(f"서킷 닫힘 (호스트 복구): {self.name}")
+            self.state = CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_progress = False
+            self.total_successes += 1
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.total_failures += 1
+            self._trial_in_progress = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    logger.warning(f"서킷 열림 ({self.failures}회 연속 실패, {self.reset_timeout}초 차단): {self.name}")
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def get_status(self) -> Dict:
+        """모니터링용 상태 정보"""
+        with self._lock:
+            retry_in = None
+            if self.state == OPEN:
+                retry_in = max(0.0, round(self.reset_timeout - (time.monotonic() - self.opened_at), 1))
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'total_failures': self.total_failures,
+                'total_successes': self.total_successes,
+                'rejected': self.rejected,
+                'retry_in_seconds': retry_in
+            }
+
+class CircuitBreakerRegistry:
+    """호스트 이름별 서킷 브레이커 모음"""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        host = urlparse(url).hostname or url
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(host, self.failure_threshold, self.reset_timeout)
+                self._breakers[host] = breaker
+            return breaker
+
+    def request(self, session, method: str, url: str, **kwargs):
+        """
+        서킷 브레이커를 거쳐 HTTP 요청
+        서킷이 열려 있으면 CircuitOpenError, 연결 오류/5xx/인증 실패는 실패로 기록
+        """
+        breaker = self.for_url(url)
+        if not breaker.allow():
+            raise CircuitOpenError(f"서킷 열림으로 호출 생략: {breaker.name}")
+
+        try:
+            response = session.request(method, url, **kwargs)
+        except Exception:
+            breaker.record_failure()
+            raise
+
+        if response.status_code >= 500 or response.status_code in FAILURE_STATUS_CODES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def async_request(self, client, method: str, url: str, **kwargs):
+        """request의 비동기 버전 (client는 httpx.AsyncClient 등 await 가능한 request 메서드를 가진 객체)"""
+        breaker = self.for_url(url)
+        if not breaker.allow():
+            raise CircuitOpenError(f"서킷 열림으로 호출 생략: {breaker.name}")
+
+        try:
+            response = await client.request(method, url, **kwargs)
+        except Exception:
+            breaker.record_failure()
+            raise
+
+        if response.status_code >= 500 or response.status_code in FAILURE_STATUS_CODES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    def get_status(self) -> Dict[str, Dict]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.get_status() for host, breaker in sorted(breakers.items())}
+
+class NegativeCache:
+    """데이터가 없었던 조회를 일정 시간 기억하여 같은 조회 반복을 막음"""
+
+    def __init__(self, ttl: float = 600, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._expires = {}
+        self._lock = threading.Lock()
+
+    def contains(self, key: Hashable) -> bool:
+        with self._lock:
+            expires_at = self._expires.get(key)
+            if expires_at is None:
+                return False
+            if expires_at < time.monotonic():
+                del self._expires[key]
+                return False
+            return True
+
+    def add(self, key: Hashable):
+        with self._lock:
+            if len(self._expires) >= self.max_entries:
+                self._purge()
+            self._expires[key] = time.monotonic() + self.ttl
+
+    def discard(self, key: Hashable):
+        with self._lock:
+            self._expires.pop(key, None)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._expires)
+
+    def _purge(self):
+        now = time.monotonic()
+        for key in [key for key, expires_at in self._expires.items() if expires_at < now]:
+            del self._expires[key]
+        # 만료된 항목을 지워도 가득 차 있으면 가장 먼저 만료될 항목부터 제거
+        while len(self._expires) >= self.max_entries:
+            del self._expires[min(self._expires, key=self._expires.get)]
+
+# 모든 크롤러가 공유하는 기본 레지스트리 (모니터링 API에서 조회)
+upstream_breakers = CircuitBreakerRegistry()
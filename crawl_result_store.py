@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 결과 저장소
+사건번호와 소스별 크롤링 결과를 SQLite에 보관하여 재요청 시 디스크에서 바로 응답
+"""
+
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 소스별 신선도 유지 시간(초). 지나면 오래된(stale) 결과로 응답하면서 백그라운드 갱신
+DEFAULT_TTLS = {
+    'official_api': 6 * 3600,
+    'real_crawl': 6 * 3600
+}
+DEFAULT_TTL = 3600
+
+# 신선도 유지 시간이 지난 뒤에도 오래된 결과로 응답할 수 있는 기간(초). 지나면 없는 것으로 취급
+DEFAULT_STALE_TTL = 7 * 24 * 3600
+
+class StoredResult:
+    """저장소에서 읽은 결과"""
+    __slots__ = ('case_number', 'source', 'payload', 'auction_date', 'fetched_at', 'is_stale')
+
+    def __init__(self, case_number, source, payload, auction_date, fetched_at, is_stale):
+        self.case_number = case_number
+        self.source = source
+        self.payload = payload
+        self.auction_date = auction_date
+        self.fetched_at = fetched_at
+        self.is_stale = is_stale
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+class CrawlResultStore:
+    def __init__(self, db_path: str = 'crawl_results.sqlite3', ttls: Optional[Dict[str, float]] = None,
+                 stale_ttl: float = DEFAULT_STALE_TTL):
+        self.db_path = db_path
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.stale_ttl = stale_ttl
+        self._local = threading.local()
+        self._purger = None
+        self._purger_stop = threading.Event()
+        self._init_schema()
+
+    @staticmethod
+    def normalize_case_number(case_number: str) -> str:
+        """사건번호 정규화 (공백 제거: "2024 타경 12345" -> "2024타경12345")"""
+        return re.sub(r'\s+', '', case_number or '')
+
+    def get(self, case_number: str, source: str) -> Optional[StoredResult]:
+        """저장된 결과 조회 (stale 기간도 지난 결과는 None)"""
+        row = self._connection().execute(
+            'SELECT payload, auction_date, fetched_at FROM crawl_results WHERE case_number = ? AND source = ?',
+            (self.normalize_case_number(case_number), source)
+        ).fetchone()
+        if row is None:
+            return None
+
+        payload, auction_date, fetched_at = row
+        age = time.time() - fetched_at
+        ttl = self.ttls.get(source, DEFAULT_TTL)
+        if age > ttl + self.stale_ttl:
+            return None
+
+        return StoredResult(self.normalize_case_number(case_number), source, json.loads(payload),
+                            auction_date, fetched_at, is_stale=age > ttl)
+
+    def put(self, case_number: str, source: str, payload: Dict, auction_date: Optional[str] = None):
+        """결과 저장 (같은 사건번호와 소스의 이전 결과는 교체)"""
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO crawl_results (case_number, source, payload, auction_date, fetched_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (self.normalize_case_number(case_number), source,
+                 json.dumps(payload, ensure_ascii=False), auction_date or None, time.time())
+            )
+
+    def find_by_auction_date(self, date_from: str, date_to: str, source: Optional[str] = None) -> List[StoredResult]:
+        """경매일(YYYY-MM-DD) 범위로 저장된 결과 조회"""
+        query = ('SELECT case_number, source, payload, auction_date, fetched_at FROM crawl_results '
+                 'WHERE auction_date BETWEEN ? AND ?')
+        params = [date_from, date_to]
+        if source:
+            query += ' AND source = ?'
+            params.append(source)
+        query += ' ORDER BY auction_date'
+
+        now = time.time()
+        return [
+            StoredResult(case_number, row_source, json.loads(payload), auction_date, fetched_at,
+                         is_stale=now - fetched_at > self.ttls.get(row_source, DEFAULT_TTL))
+            for case_number, row_source, payload, auction_date, fetched_at
+            in self._connection().execute(query, params)
+        ]
+
+    def purge_expired(self) -> int:
+        """stale 기간까지 지난 결과 삭제 (TTL이 설정되지 않은 소스는 DEFAULT_TTL 기준, 삭제 건수 반환)"""
+        connection = self._connection()
+        now = time.time()
+        deleted = 0
+        with connection:
+            for source, ttl in self.ttls.items():
+                deleted += connection.execute(
+                    'DELETE FROM crawl_results WHERE source = ? AND fetched_at < ?',
+                    (source, now - ttl - self.stale_ttl)
+                ).rowcount
+
+            sources = list(self.ttls)
+            deleted += connection.execute(
+                f'DELETE FROM crawl_results WHERE source NOT IN ({", ".join("?" * len(sources))}) '
+                'AND fetched_at < ?',
+                (*sources, now - DEFAULT_TTL - self.stale_ttl)
+            ).rowcount
+        return deleted
+
+    def start_purger(self, interval: float = 3600):
+        """interval초마다 만료된 결과를 삭제하는 백그라운드 스레드 시작"""
+        if self._purger and self._purger.is_alive():
+            return
+
+        def purge():
+            while not self._purger_stop.wait(interval):
+                try:
+                    deleted = self.purge_expired()
+                    if deleted:
+                        logger.info(f"만료된 크롤링 결과 {deleted}건 삭제")
+                except Exception as e:
+                    logger.warning(f"만료된 크롤링 결과 삭제 실패: {e}")
+
+        self._purger_stop.clear()
+        self._purger = threading.Thread(target=purge, name='crawl-store-purger', daemon=True)
+        self._purger.start()
+
+    def stop_purger(self):
+        """만료된 결과 삭제 중지"""
+        self._purger_stop.set()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간 공유할 수 없으므로 스레드별로 생성
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=10)
+            self._local.connection = connection
+        return connection
+
+    def _init_schema(self):
+        connection = self._connection()
+        with connection:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS crawl_results ('
+                'case_number TEXT NOT NULL, '
+                'source TEXT NOT NULL, '
+                'payload TEXT NOT NULL, '
+                'auction_date TEXT, '
+                'fetched_at REAL NOT NULL, '
+                'PRIMARY KEY (case_number, source))'
+            )
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS idx_crawl_results_auction_date ON crawl_results (auction_date)'
+            )
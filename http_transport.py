@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공유 HTTP 연결 풀
+모든 크롤러의 requests.Session이 하나의 HTTPAdapter(연결 풀)를 함께 사용하여
+같은 호스트로의 keep-alive 연결(TLS 핸드셰이크 포함)을 요청과 크롤러 사이에서 재사용
+"""
+
+import os
+import threading
+import logging
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# 연결 풀을 유지할 호스트 수
+HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '32'))
+
+# 호스트별 최대 연결 수 (동시 크롤링 작업 수보다 크게)
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '16'))
+
+# 호스트별 연결이 모두 사용 중이면 새 연결을 만들지 않고 반납될 때까지 대기
+HTTP_POOL_BLOCK = os.getenv('HTTP_POOL_BLOCK', '1') == '1'
+
+# 연결 실패와 일시적 서버 오류 재시도 (멱등 요청만, 0.2초부터 지수 백오프)
+HTTP_RETRY_TOTAL = int(os.getenv('HTTP_RETRY_TOTAL', '2'))
+HTTP_RETRY_BACKOFF = float(os.getenv('HTTP_RETRY_BACKOFF', '0.2'))
+RETRY_STATUS_CODES = (502, 503, 504)
+RETRY_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+_shared_adapter = None
+_adapter_lock = threading.Lock()
+
+def create_retry() -> Retry:
+    """재시도 정책 (재시도 후에도 실패한 응답은 예외 대신 그대로 반환)"""
+    return Retry(
+        total=HTTP_RETRY_TOTAL,
+        read=0,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+def get_shared_adapter() -> HTTPAdapter:
+    """프로세스 전체가 공유하는 HTTPAdapter"""
+    global _shared_adapter
+    with _adapter_lock:
+        if _shared_adapter is None:
+            _shared_adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                pool_block=HTTP_POOL_BLOCK,
+                max_retries=create_retry()
+            )
+            logger.info(f"공유 HTTP 연결 풀 생성: 호스트 {HTTP_POOL_CONNECTIONS}개, 호스트당 {HTTP_POOL_MAXSIZE}개 연결")
+        return _shared_adapter
+
+def create_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """공유 연결 풀을 사용하는 세션 생성 (헤더와 쿠키는 세션별로 유지)"""
+    session = requests.Session()
+    adapter = get_shared_adapter()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+몬테카를로 경쟁 입찰 시뮬레이션
+구/군별 매각률, 매각가율로 경쟁자 입찰가 분포를 만들고 수백만 건의 가상 경매를
+NumPy 배치로 생성하여 입찰가별 낙찰 확률 곡선과 신뢰구간 계산
+
+가상 경매 한 건:
+- 잠재 경쟁자 K명이 각각 확률 q로 참여 (K명 중 한 명이라도 참여할 확률 = 매각률)
+- 참여자의 입찰가(감정가 대비)는 평균이 매각가율인 로그정규분포, 최저입찰가 미만이면 최저입찰가
+- 내 입찰가가 최고 경쟁 입찰가보다 높으면 낙찰 (동률은 패찰로 간주)
+
+경매 건수는 샤드로 나누어 프로세스 풀에서 실행하고, 샤드별 난수 시드는
+SeedSequence.spawn으로 만들어 같은 seed이면 워커 수와 관계없이 같은 결과를 반환
+"""
+
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from bid_simulation import DEFAULT_SALE_PRICE_RATE, normalize_urgency
+
+logger = logging.getLogger(__name__)
+
+# 통계가 없을 때 사용하는 매각률(%)
+DEFAULT_SALE_RATE = 30.0
+
+# 경쟁자 입찰가의 상대 표준편차 (매각가율 주변 분산)
+DEFAULT_BID_VOLATILITY = 0.08
+
+# 샤드 안에서 한 번에 생성하는 경매 건수 (메모리 사용량 제한)
+SHARD_BATCH_SIZE = 65536
+
+# 입찰긴급도별 경쟁자 입찰가 배수 (긴급할수록 경쟁이 치열한 경우를 가정하여 보수적으로 추정)
+URGENCY_COMPETITION_FACTORS = {'high': 1.03, 'medium': 1.0, 'low': 0.97}
+
+# 신뢰구간 z값 (95%)
+CONFIDENCE_Z = 1.959964
+
+def get_failure_factor(failed_count: float) -> float:
+    """유찰 횟수에 따른 입찰가 하향 배수 (1회당 5%, 최대 30%, applyMarketAdjustments와 동일)"""
+    if failed_count <= 0:
+        return 1.0
+    return max(0.95 ** failed_count, 0.7)
+
+def simulate_shard(seed_sequence: np.random.SeedSequence, auctions: int, bid_ratios: np.ndarray,
+                   competitor_count: int, participation: float, mean_ratio: float,
+                   volatility: float, minimum_ratio: float) -> np.ndarray:
+    """
+    샤드 하나의 가상 경매를 실행하고 입찰가별 낙찰 건수 반환 (프로세스 풀 워커에서 실행)
+    낙찰 건수 = 최고 경쟁 입찰가가 내 입찰가보다 낮은 경매 수
+    """
+    rng = np.random.default_rng(seed_sequence)
+    wins = np.zeros(len(bid_ratios), dtype=np.int64)
+
+    # 로그정규분포의 평균이 mean_ratio가 되도록 위치 보정
+    sigma = np.float32(volatility)
+    mu = np.float32(np.log(mean_ratio) - volatility ** 2 / 2)
+
+    remaining = auctions
+    while remaining > 0:
+        size = min(remaining, SHARD_BATCH_SIZE)
+        remaining -= size
+
+        bids = np.exp(mu + sigma * rng.standard_normal((size, competitor_count), dtype=np.float32))
+        np.maximum(bids, np.float32(minimum_ratio), out=bids)
+        bids[rng.random((size, competitor_count), dtype=np.float32) >= participation] = 0
+
+        highest = np.sort(bids.max(axis=1))
+        wins += np.searchsorted(highest, bid_ratios, side='left')
+
+    return wins
+
+class MonteCarloSimulator:
+    def __init__(self, statistics_analyzer=None, max_workers: Optional[int] = None, shards: int = 8):
+        """
+        - statistics_analyzer: 구/군별 매각률, 매각가율을 제공하는 AuctionStatisticsAnalyzer
+        - max_workers: 프로세스 풀 크기 (기본값: CPU 수, 1 이하이면 현재 프로세스에서 실행)
+        - shards: 경매 건수를 나눌 샤드 수 (결과 재현성을 위해 워커 수와 무관하게 고정)
+        """
+        self.statistics_analyzer = statistics_analyzer
+        self.max_workers = min(max_workers or os.cpu_count() or 1, shards)
+        self.shards = shards
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """프로세스 풀 (처음 사용할 때 생성)"""
+        if self.max_workers <= 1:
+            return None
+        with self.lock:
+            if self.executor is None:
+                # 서버는 여러 스레드로 요청을 처리하므로 fork 대신 forkserver(없으면 spawn)로 워커 생성
+                # (다른 스레드가 잡고 있던 잠금이 복사되어 워커가 멈추는 문제 방지)
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                if context.get_start_method() == 'forkserver':
+                    # 워커가 쓰는 계산 모듈만 fork server에서 한 번 로드
+                    # (__main__을 미리 로드하면 app.py의 서버 초기화가 fork server에서 다시 실행됨)
+                    context.set_forkserver_preload([__name__, 'bid_simulation'])
+                self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+                logger.info(f"몬테카를로 프로세스 풀 생성: {self.max_workers}개 워커, {self.shards}개 샤드")
+            return self.executor
+
+    def close(self):
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+
+    def get_market_parameters(self, region: Optional[str] = None, district: Optional[str] = None) -> Dict:
+        """구/군(없으면 지역 전체) 매각률과 매각가율, 통계가 없으면 기본값"""
+        parameters = {
+            'sale_rate': DEFAULT_SALE_RATE,
+            'sale_price_rate': DEFAULT_SALE_PRICE_RATE,
+            'source': 'default'
+        }
+        if not self.statistics_analyzer or not region:
+            return parameters
+
+        if district:
+            stats = self.statistics_analyzer.get_district_statistics(region, district)
+            if stats and stats['sale_rate'] > 0 and stats['sale_price_rate'] > 0:
+                return {
+                    'sale_rate': stats['sale_rate'],
+                    'sale_price_rate': stats['sale_price_rate'],
+                    'source': f"{region} {district}"
+                }
+
+        summary = self.statistics_analyzer.get_region_summary(region)
+        if summary and summary['overall_sale_rate'] > 0 and summary['overall_sale_price_rate'] > 0:
+            return {
+                'sale_rate': summary['overall_sale_rate'],
+                'sale_price_rate': summary['overall_sale_price_rate'],
+                'source': region
+            }
+        return parameters
+
+    def simulate(self, bid_ratios: Sequence[float], minimum_ratio: float, competitor_count: int = 5,
+                 sale_rate: float = DEFAULT_SALE_RATE, sale_price_rate: float = DEFAULT_SALE_PRICE_RATE,
+                 failed_count: float = 0, urgency: str = 'medium', volatility: float = DEFAULT_BID_VOLATILITY,
+                 auctions: int = 1000000, seed: Optional[int] = None) -> Dict:
+        """
+        입찰가(감정가 대비 비율)별 낙찰 확률 곡선과 95% 신뢰구간(Wilson) 계산
+
+        - minimum_ratio: 최저입찰가 / 감정가 (이보다 낮은 입찰은 무효)
+        - sale_rate, sale_price_rate: 매각률(%), 매각가율(%)
+        - seed: 난수 시드 (없으면 새로 만들고 결과에 포함)
+        """
+        started = time.monotonic()
+        requested_ratios = np.asarray(bid_ratios, dtype=float)
+        bid_ratios = requested_ratios.astype(np.float32)
+        competitor_count = max(int(competitor_count), 1)
+        sale_rate = min(max(sale_rate / 100, 0.0), 1.0)
+
+        # K명 중 한 명이라도 참여할 확률이 매각률이 되도록 경쟁자별 참여 확률 계산
+        participation = 1 - (1 - sale_rate) ** (1 / competitor_count)
+        mean_ratio = (sale_price_rate / 100 * get_failure_factor(failed_count)
+                      * URGENCY_COMPETITION_FACTORS[normalize_urgency(urgency)])
+
+        seed_sequence = np.random.SeedSequence(seed)
+        shard_sizes = [auctions // self.shards + (1 if i < auctions % self.shards else 0) for i in range(self.shards)]
+        args = (bid_ratios, competitor_count, participation, mean_ratio, volatility, minimum_ratio)
+
+        executor = self.get_executor()
+        if executor is None:
+            shard_wins = [simulate_shard(child, size, *args)
+                          for child, size in zip(seed_sequence.spawn(self.shards), shard_sizes)]
+        else:
+            futures = [executor.submit(simulate_shard, child, size, *args)
+                       for child, size in zip(seed_sequence.spawn(self.shards), shard_sizes)]
+            shard_wins = [future.result() for future in futures]
+
+        wins = np.sum(shard_wins, axis=0)
+        # 최저입찰가 미만 입찰은 무효
+        wins[bid_ratios < np.float32(minimum_ratio)] = 0
+        probabilities = wins / auctions
+        lower, upper = self.wilson_interval(probabilities, auctions)
+
+        elapsed = time.monotonic() - started
+        logger.info(f"몬테카를로 시뮬레이션 완료: {auctions}건, {len(bid_ratios)}개 입찰가, {elapsed:.3f}초")
+
+        return {
+            'bid_ratios': requested_ratios,
+            'probabilities': probabilities,
+            'lower': lower,
+            'upper': upper,
+            'auctions': auctions,
+            'seed': seed_sequence.entropy,
+            'shards': self.shards,
+            'participation': participation,
+            'mean_ratio': mean_ratio,
+            'elapsed': elapsed
+        }
+
+    @staticmethod
+    def wilson_interval(probabilities: np.ndarray, trials: int):
+        """이항 비율의 Wilson 신뢰구간"""
+        z2 = CONFIDENCE_Z ** 2
+        denominator = 1 + z2 / trials
+        center = (probabilities + z2 / (2 * trials)) / denominator
+        margin = CONFIDENCE_Z * np.sqrt(probabilities * (1 - probabilities) / trials + z2 / (4 * trials ** 2)) / denominator
+        return np.clip(center - margin, 0, 1), np.clip(center + margin, 0, 1)
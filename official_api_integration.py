@@ -5,17 +5,22 @@
 법원, 정부기관의 공식 API를 통한 실제 데이터 수집
 """
 
-import requests
 import json
 import logging
 from datetime import datetime
 from typing import Dict, Optional
 
+from circuit_breaker import CircuitBreakerRegistry, NegativeCache, upstream_breakers
+from http_transport import create_session
+
 logger = logging.getLogger(__name__)
 
 class OfficialAPIIntegration:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, breakers: Optional[CircuitBreakerRegistry] = None, negative_ttl: float = 600):
+        self.breakers = breakers or upstream_breakers
+        # 데이터가 없다고 확인된 (API, 사건번호) 조합은 negative_ttl 동안 다시 호출하지 않음
+        self.negative_cache = NegativeCache(ttl=negative_ttl)
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
@@ -33,25 +38,10 @@ class OfficialAPIIntegration:
     def get_official_auction_data(self, case_number: str) -> Optional[Dict]:
         """공식 API를 통한 경매 데이터 수집"""
         try:
-            # 1. 법원 경매 공식 API
-            data = self.get_court_auction_official_api(case_number)
-            if data:
-                return data
-            
-            # 2. KB부동산 공식 API
-            data = self.get_kb_land_official_api(case_number)
-            if data:
-                return data
-            
-            # 3. 정부 공공데이터 API
-            data = self.get_government_data_api(case_number)
-            if data:
-                return data
-            
-            # 4. 네이버 부동산 API
-            data = self.get_naver_real_estate_api(case_number)
-            if data:
-                return data
+            for name, fetch in self.get_official_sources():
+                data = fetch(case_number)
+                if data:
+                    return data
             
             return None
             
@@ -59,47 +49,104 @@ class OfficialAPIIntegration:
             logger.error(f"공식 API 데이터 수집 실패: {e}")
             return None
     
-    def get_court_auction_official_api(self, case_number: str) -> Optional[Dict]:
-        """법원 경매 공식 API"""
-        try:
+    def get_official_sources(self):
+        """조회 순서대로 (API 이름, 조회 함수) 목록"""
+        return [
+            # 1. 법원 경매 공식 API
+            ('court_auction', self.get_court_auction_official_api),
+            # 2. KB부동산 공식 API
+            ('kb_land', self.get_kb_land_official_api),
+            # 3. 정부 공공데이터 API
+            ('government_data', self.get_government_data_api),
+            # 4. 네이버 부동산 API
+            ('naver_real_estate', self.get_naver_real_estate_api)
+        ]
+    
+    def get_official_requests(self, case_number: str) -> Dict:
+        """
+        API별 요청 정보 {API 이름: (method, url, 요청 옵션, 응답 JSON 파싱 함수)}
+        동기 호출과 비동기 호출(async_crawl)이 함께 사용
+        """
+        return {
             # 법원 경매 공식 API 엔드포인트 (예시)
-            url = "https://api.courtauction.go.kr/v1/auction/search"
-            
-            headers = {
-                'Authorization': f'Bearer {self.api_keys["court_auction"]}',
-                'Content-Type': 'application/json'
-            }
-            
-            payload = {
-                'caseNumber': case_number,
-                'includeDetails': True
-            }
-            
-            response = self.session.post(url, json=payload, headers=headers, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if data.get('success') and data.get('data'):
-                    auction_data = data['data']
-                    
-                    return {
+            'court_auction': (
+                'POST', "https://api.courtauction.go.kr/v1/auction/search",
+                {
+                    'json': {'caseNumber': case_number, 'includeDetails': True},
+                    'headers': {
+                        'Authorization': f'Bearer {self.api_keys["court_auction"]}',
+                        'Content-Type': 'application/json'
+                    }
+                },
+                lambda data: self.parse_court_auction_response(data, case_number)
+            ),
+            # KB부동산 공식 API 엔드포인트
+            'kb_land': (
+                'POST', "https://api.kbland.kr/v1/auction/search",
+                {
+                    'json': {'caseNumber': case_number, 'includeMarketData': True},
+                    'headers': {
+                        'Authorization': f'Bearer {self.api_keys["kb_land"]}',
+                        'Content-Type': 'application/json'
+                    }
+                },
+                lambda data: self.parse_kb_land_response(data, case_number)
+            ),
+            # 정부 공공데이터포털 API
+            'government_data': (
+                'GET', "https://api.data.go.kr/v1/auction/search",
+                {
+                    'params': {
+                        'serviceKey': self.api_keys['government_data'],
                         'caseNumber': case_number,
-                        'marketPrice': auction_data.get('marketPrice', 0),
-                        'appraisalPrice': auction_data.get('appraisalPrice', 0),
-                        'minimumBid': auction_data.get('minimumBid', 0),
-                        'location': auction_data.get('location', ''),
-                        'propertyType': auction_data.get('propertyType', ''),
-                        'auctionDate': auction_data.get('auctionDate', ''),
-                        'court': auction_data.get('court', ''),
-                        'source': '법원경매 공식 API',
-                        'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'isRealData': True,
-                        'dataQuality': '높음 (공식 API)'
+                        'type': 'json',
+                        'numOfRows': 10,
+                        'pageNo': 1
                     }
-            
+                },
+                lambda data: self.parse_government_data_response(data, case_number)
+            ),
+            # 네이버 부동산 API (비공식)
+            'naver_real_estate': (
+                'POST', "https://land.naver.com/api/auction/search",
+                {
+                    'json': {'query': case_number, 'type': 'auction'},
+                    'headers': {
+                        'Authorization': f'Bearer {self.api_keys["naver_real_estate"]}',
+                        'Content-Type': 'application/json'
+                    }
+                },
+                lambda data: self.parse_naver_real_estate_response(data, case_number)
+            )
+        }
+    
+    def request(self, method: str, url: str, **kwargs):
+        """호스트별 서킷 브레이커를 거쳐 요청 (서킷이 열려 있으면 CircuitOpenError)"""
+        return self.breakers.request(self.session, method, url, **kwargs)
+    
+    def call_official_api(self, name: str, case_number: str) -> Optional[Dict]:
+        """
+        API 하나를 호출하여 경매 데이터 반환 (200 응답이 아니거나 데이터가 없으면 None)
+        200 응답에 데이터가 없을 때만 실패 캐시에 기록하고, 요청 오류는 서킷 브레이커에 맡김
+        """
+        if self.negative_cache.contains((name, case_number)):
             return None
-            
+        
+        method, url, options, parse = self.get_official_requests(case_number)[name]
+        response = self.request(method, url, timeout=15, **options)
+        
+        if response.status_code == 200:
+            data = parse(response.json())
+            if not data:
+                self.negative_cache.add((name, case_number))
+            return data
+        
+        return None
+    
+    def get_court_auction_official_api(self, case_number: str) -> Optional[Dict]:
+        """법원 경매 공식 API"""
+        try:
+            return self.call_official_api('court_auction', case_number)
         except Exception as e:
             logger.warning(f"법원 경매 공식 API 호출 실패: {e}")
             return None
@@ -107,43 +154,7 @@ class OfficialAPIIntegration:
     def get_kb_land_official_api(self, case_number: str) -> Optional[Dict]:
         """KB부동산 공식 API"""
         try:
-            # KB부동산 공식 API 엔드포인트
-            url = "https://api.kbland.kr/v1/auction/search"
-            
-            headers = {
-                'Authorization': f'Bearer {self.api_keys["kb_land"]}',
-                'Content-Type': 'application/json'
-            }
-            
-            payload = {
-                'caseNumber': case_number,
-                'includeMarketData': True
-            }
-            
-            response = self.session.post(url, json=payload, headers=headers, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if data.get('success') and data.get('data'):
-                    auction_data = data['data']
-                    
-                    return {
-                        'caseNumber': case_number,
-                        'marketPrice': auction_data.get('marketPrice', 0),
-                        'appraisalPrice': auction_data.get('appraisalPrice', 0),
-                        'minimumBid': auction_data.get('minimumBid', 0),
-                        'location': auction_data.get('location', ''),
-                        'propertyType': auction_data.get('propertyType', ''),
-                        'auctionDate': auction_data.get('auctionDate', ''),
-                        'source': 'KB부동산 공식 API',
-                        'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'isRealData': True,
-                        'dataQuality': '높음 (공식 API)'
-                    }
-            
-            return None
-            
+            return self.call_official_api('kb_land', case_number)
         except Exception as e:
             logger.warning(f"KB부동산 공식 API 호출 실패: {e}")
             return None
@@ -151,44 +162,7 @@ class OfficialAPIIntegration:
     def get_government_data_api(self, case_number: str) -> Optional[Dict]:
         """정부 공공데이터 API"""
         try:
-            # 정부 공공데이터포털 API
-            url = "https://api.data.go.kr/v1/auction/search"
-            
-            params = {
-                'serviceKey': self.api_keys['government_data'],
-                'caseNumber': case_number,
-                'type': 'json',
-                'numOfRows': 10,
-                'pageNo': 1
-            }
-            
-            response = self.session.get(url, params=params, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if data.get('response') and data.get('response').get('body'):
-                    items = data['response']['body'].get('items', [])
-                    
-                    if items:
-                        item = items[0]
-                        
-                        return {
-                            'caseNumber': case_number,
-                            'marketPrice': item.get('marketPrice', 0),
-                            'appraisalPrice': item.get('appraisalPrice', 0),
-                            'minimumBid': item.get('minimumBid', 0),
-                            'location': item.get('location', ''),
-                            'propertyType': item.get('propertyType', ''),
-                            'auctionDate': item.get('auctionDate', ''),
-                            'source': '정부 공공데이터 API',
-                            'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            'isRealData': True,
-                            'dataQuality': '높음 (정부 공식)'
-                        }
-            
-            return None
-            
+            return self.call_official_api('government_data', case_number)
         except Exception as e:
             logger.warning(f"정부 공공데이터 API 호출 실패: {e}")
             return None
@@ -196,46 +170,98 @@ class OfficialAPIIntegration:
     def get_naver_real_estate_api(self, case_number: str) -> Optional[Dict]:
         """네이버 부동산 API"""
         try:
-            # 네이버 부동산 API (비공식)
-            url = "https://land.naver.com/api/auction/search"
+            return self.call_official_api('naver_real_estate', case_number)
+        except Exception as e:
+            logger.warning(f"네이버 부동산 API 호출 실패: {e}")
+            return None
+    
+    def parse_court_auction_response(self, data: Dict, case_number: str) -> Optional[Dict]:
+        """법원 경매 공식 API 응답 파싱"""
+        if data.get('success') and data.get('data'):
+            auction_data = data['data']
             
-            headers = {
-                'Authorization': f'Bearer {self.api_keys["naver_real_estate"]}',
-                'Content-Type': 'application/json'
+            return {
+                'caseNumber': case_number,
+                'marketPrice': auction_data.get('marketPrice', 0),
+                'appraisalPrice': auction_data.get('appraisalPrice', 0),
+                'minimumBid': auction_data.get('minimumBid', 0),
+                'location': auction_data.get('location', ''),
+                'propertyType': auction_data.get('propertyType', ''),
+                'auctionDate': auction_data.get('auctionDate', ''),
+                'court': auction_data.get('court', ''),
+                'source': '법원경매 공식 API',
+                'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'isRealData': True,
+                'dataQuality': '높음 (공식 API)'
             }
+        
+        return None
+    
+    def parse_kb_land_response(self, data: Dict, case_number: str) -> Optional[Dict]:
+        """KB부동산 공식 API 응답 파싱"""
+        if data.get('success') and data.get('data'):
+            auction_data = data['data']
             
-            payload = {
-                'query': case_number,
-                'type': 'auction'
+            return {
+                'caseNumber': case_number,
+                'marketPrice': auction_data.get('marketPrice', 0),
+                'appraisalPrice': auction_data.get('appraisalPrice', 0),
+                'minimumBid': auction_data.get('minimumBid', 0),
+                'location': auction_data.get('location', ''),
+                'propertyType': auction_data.get('propertyType', ''),
+                'auctionDate': auction_data.get('auctionDate', ''),
+                'source': 'KB부동산 공식 API',
+                'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'isRealData': True,
+                'dataQuality': '높음 (공식 API)'
             }
+        
+        return None
+    
+    def parse_government_data_response(self, data: Dict, case_number: str) -> Optional[Dict]:
+        """정부 공공데이터 API 응답 파싱"""
+        if data.get('response') and data.get('response').get('body'):
+            items = data['response']['body'].get('items', [])
             
-            response = self.session.post(url, json=payload, headers=headers, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
+            if items:
+                item = items[0]
                 
-                if data.get('items'):
-                    item = data['items'][0]
-                    
-                    return {
-                        'caseNumber': case_number,
-                        'marketPrice': item.get('price', 0),
-                        'appraisalPrice': item.get('appraisalPrice', 0),
-                        'minimumBid': item.get('minimumBid', 0),
-                        'location': item.get('location', ''),
-                        'propertyType': item.get('propertyType', ''),
-                        'auctionDate': item.get('auctionDate', ''),
-                        'source': '네이버 부동산 API',
-                        'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'isRealData': True,
-                        'dataQuality': '중간 (비공식 API)'
-                    }
-            
-            return None
+                return {
+                    'caseNumber': case_number,
+                    'marketPrice': item.get('marketPrice', 0),
+                    'appraisalPrice': item.get('appraisalPrice', 0),
+                    'minimumBid': item.get('minimumBid', 0),
+                    'location': item.get('location', ''),
+                    'propertyType': item.get('propertyType', ''),
+                    'auctionDate': item.get('auctionDate', ''),
+                    'source': '정부 공공데이터 API',
+                    'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'isRealData': True,
+                    'dataQuality': '높음 (정부 공식)'
+                }
+        
+        return None
+    
+    def parse_naver_real_estate_response(self, data: Dict, case_number: str) -> Optional[Dict]:
+        """네이버 부동산 API 응답 파싱"""
+        if data.get('items'):
+            item = data['items'][0]
             
-        except Exception as e:
-            logger.warning(f"네이버 부동산 API 호출 실패: {e}")
-            return None
+            return {
+                'caseNumber': case_number,
+                'marketPrice': item.get('price', 0),
+                'appraisalPrice': item.get('appraisalPrice', 0),
+                'minimumBid': item.get('minimumBid', 0),
+                'location': item.get('location', ''),
+                'propertyType': item.get('propertyType', ''),
+                'auctionDate': item.get('auctionDate', ''),
+                'source': '네이버 부동산 API',
+                'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'isRealData': True,
+                'dataQuality': '중간 (비공식 API)'
+            }
+        
+        return None
     
     def get_api_key_info(self) -> Dict:
         """API 키 발급 정보 반환"""
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+포트폴리오 일괄 시뮬레이션
+저장된 여러 물건(시세, 감정가, 최저입찰가, 유찰 횟수, 지역/구, 경쟁자 수, 입찰긴급도)의
+권장 입찰가(calculateOptimalBid와 같은 모델), 낙찰 확률, 예상 수익률을 묶음 단위 벡터 연산으로 계산
+"""
+
+import math
+import logging
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+import bid_simulation
+
+logger = logging.getLogger(__name__)
+
+class PortfolioSimulator:
+    def __init__(self, statistics_analyzer=None):
+        """statistics_analyzer: 지역/구별 매각가율을 제공하는 AuctionStatisticsAnalyzer"""
+        self.statistics_analyzer = statistics_analyzer
+
+    def get_sale_price_rate(self, region: Optional[str], district: Optional[str]) -> Tuple[float, str]:
+        """구/군 매각가율과 출처 (통계가 없으면 기본값)"""
+        if self.statistics_analyzer and region and district:
+            stats = self.statistics_analyzer.get_district_statistics(region, district)
+            if stats and stats['sale_price_rate'] > 0:
+                return stats['sale_price_rate'], f"{region} {district}"
+        return bid_simulation.DEFAULT_SALE_PRICE_RATE, 'default'
+
+    def parse_property(self, spec: Dict, sale_price_rates: Dict) -> Dict:
+        """물건 정보 검증 및 기본값 적용 (잘못된 값이면 ValueError)"""
+        if not isinstance(spec, dict):
+            raise ValueError('물건 정보는 객체여야 합니다.')
+
+        try:
+            market_price = float(spec.get('marketPrice') or 0)
+            appraisal_price = float(spec.get('appraisalPrice') or market_price)
+            minimum_bid = float(spec.get('minimumBid') or 0)
+            bid_price = float(spec.get('bidPrice') or market_price)
+            competitor_count = float(spec.get('competitorCount', 5))
+            failed_count = float(spec.get('failedCount', 0))
+            renovation_cost = float(spec.get('renovationCost', 0))
+            home_count = float(spec.get('homeCount', 1))
+            sale_price_rate = spec.get('salePriceRate')
+            sale_price_rate = float(sale_price_rate) if sale_price_rate is not None else None
+        except (TypeError, ValueError):
+            raise ValueError('가격, 경쟁자 수, 유찰 횟수는 숫자여야 합니다.')
+
+        numbers = [market_price, appraisal_price, minimum_bid, bid_price, competitor_count,
+                   failed_count, renovation_cost, home_count]
+        if sale_price_rate is not None:
+            numbers.append(sale_price_rate)
+        if not all(math.isfinite(value) for value in numbers):
+            raise ValueError('가격, 경쟁자 수, 유찰 횟수는 유한한 숫자여야 합니다.')
+
+        if market_price <= 0 or minimum_bid <= 0 or appraisal_price <= 0:
+            raise ValueError('시세, 감정가와 최저입찰가가 필요합니다.')
+
+        for name in ('urgency', 'region', 'district', 'propertyType', 'marketCondition'):
+            if spec.get(name) is not None and not isinstance(spec[name], str):
+                raise ValueError(f'{name}은(는) 문자열이어야 합니다.')
+        urgency = bid_simulation.normalize_urgency(spec.get('urgency', '보통'))
+
+        # 같은 지역/구는 한 번만 조회
+        if sale_price_rate is None:
+            key = (spec.get('region'), spec.get('district'))
+            if key not in sale_price_rates:
+                sale_price_rates[key] = self.get_sale_price_rate(*key)
+            sale_price_rate, source = sale_price_rates[key]
+        else:
+            source = 'request'
+
+        return {
+            'id': spec.get('id', spec.get('caseNumber')),
+            'market_price': market_price,
+            'appraisal_price': appraisal_price,
+            'minimum_bid': minimum_bid,
+            'bid_price': bid_price,
+            'competitor_count': competitor_count,
+            'urgency': urgency,
+            'failed_count': failed_count,
+            'renovation_cost': renovation_cost,
+            'property_type': spec.get('propertyType', '아파트'),
+            'home_count': home_count,
+            'market_condition': spec.get('marketCondition', 'normal'),
+            'sale_price_rate': sale_price_rate,
+            'sale_price_rate_source': source
+        }
+
+    def simulate(self, properties: List[Dict]) -> List[Dict]:
+        """
+        검증된 물건 목록을 한 번에 계산
+        권장 입찰가와 낙찰 확률은 calculateOptimalBid(calculate_optimal_bids)와 같음 (입찰가가 없으면 시세 기준)
+        총 비용과 수익률은 물건 유형, 보유 주택 수, 수리비를 반영하고 시세를 가치로 사용
+        """
+        if not properties:
+            return []
+
+        def column(name):
+            return np.array([prop[name] for prop in properties], dtype=float)
+
+        market_prices = column('market_price')
+        appraisal_prices = column('appraisal_price')
+        minimum_bids = column('minimum_bid')
+        failed_counts = column('failed_count')
+        urgencies = [prop['urgency'] for prop in properties]
+
+        optimal = bid_simulation.calculate_optimal_bids(
+            column('bid_price'), market_prices, appraisal_prices, minimum_bids, column('competitor_count'),
+            urgencies, failed_counts, column('renovation_cost'), sale_price_rates=column('sale_price_rate')
+        )
+        bids, probabilities = optimal['recommended_bids'], optimal['win_probabilities']
+
+        property_types = np.array([prop['property_type'] for prop in properties], dtype=object)
+        total_costs = (bids + bid_simulation.calculate_additional_costs(bids, property_types, column('home_count'))
+                       + column('renovation_cost'))
+        expected_profits = bid_simulation.calculate_expected_profit(market_prices, total_costs)
+
+        # 시장 상황은 물건마다 다를 수 있으므로 상황별로 나누어 계산
+        market_conditions = np.array([prop['market_condition'] for prop in properties], dtype=object)
+        risk_adjusted_profits = np.empty(len(properties))
+        for condition in set(market_conditions):
+            mask = market_conditions == condition
+            risk_adjusted_profits[mask] = bid_simulation.calculate_risk_adjusted_profit(
+                market_prices[mask], total_costs[mask], probabilities[mask], condition, failed_counts[mask]
+            )
+
+        results = []
+        for i, prop in enumerate(properties):
+            bid, probability = bids[i].item(), probabilities[i].item()
+            results.append({
+                'id': prop['id'],
+                'recommendedBid': bid,
+                'winProbability': probability,
+                'bidToAppraisal': bid / prop['appraisal_price'],
+                'totalCost': total_costs[i].item(),
+                'expectedProfit': expected_profits[i].item(),
+                'riskAdjustedProfit': risk_adjusted_profits[i].item(),
+                'salePriceRate': prop['sale_price_rate'],
+                'salePriceRateSource': prop['sale_price_rate_source']
+            })
+        return results
+
+    def iter_results(self, specs: List[Dict], chunk_size: int = 1000) -> Iterator[Dict]:
+        """
+        물건 목록을 chunk_size개씩 계산하여 이벤트로 반환
+        - {'event': 'property', 'index': 요청 순서, ...결과}
+        - {'event': 'property_failed', 'index', 'id', 'error'}: 잘못된 물건 정보
+        - 마지막에 {'event': 'done', 'total', 'succeeded'}
+        """
+        sale_price_rates = {}
+        succeeded = 0
+
+        for start in range(0, len(specs), chunk_size):
+            indexes, properties = [], []
+            for index, spec in enumerate(specs[start:start + chunk_size], start):
+                try:
+                    properties.append(self.parse_property(spec, sale_price_rates))
+                    indexes.append(index)
+                except ValueError as e:
+                    spec_id = spec.get('id', spec.get('caseNumber')) if isinstance(spec, dict) else None
+                    yield {'event': 'property_failed', 'index': index, 'id': spec_id, 'error': str(e)}
+
+            for index, result in zip(indexes, self.simulate(properties)):
+                succeeded += 1
+                yield dict(result, event='property', index=index)
+
+        logger.info(f"포트폴리오 시뮬레이션 완료: {succeeded}/{len(specs)}건")
+        yield {'event': 'done', 'total': len(specs), 'succeeded': succeeded}
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+구/군별 낙찰 확률 조회 테이블
+calculateAdvancedWinProbability를 가격비율 × 경쟁자 수 × 유찰 횟수 × 입찰긴급도 격자에서 미리 계산하여
+확률 조회를 모델 재계산 대신 테이블 조회(+ 선택적 선형 보간)로 처리
+
+모델의 가격비율 경계값(0.60, 0.65, ... 1.15)이 모두 격자점이므로
+보간 없이 직전 격자점 값을 쓰면 모델과 정확히 같은 값이 나온다.
+테이블은 구/군의 매각가율에 따라서만 달라지므로 매각가율별로 한 번만 만든다.
+"""
+
+import io
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+import bid_simulation
+from bid_simulation import URGENCY_LEVELS
+
+logger = logging.getLogger(__name__)
+
+# 가격비율 격자 (0.30 ~ 1.50, 0.005 간격), 범위 밖 값은 양 끝 값과 같음
+RATIO_START = 0.30
+RATIO_STEP = 0.005
+RATIO_GRID = np.round(RATIO_START + RATIO_STEP * np.arange(241), 3)
+
+# 경쟁자 수 1~9명 (9 = 9명 이상), 유찰 횟수 0~4회 (4 = 4회 이상)
+COMPETITOR_COUNTS = np.arange(1, 10)
+FAILED_COUNTS = np.arange(0, 5)
+
+# 테이블 축 순서: (입찰긴급도, 경쟁자 수, 유찰 횟수, 가격비율)
+TABLE_AXES = {
+    'urgency': list(URGENCY_LEVELS),
+    'competitorCount': COMPETITOR_COUNTS.tolist(),
+    'failedCount': FAILED_COUNTS.tolist(),
+    'priceRatio': {'start': RATIO_START, 'step': RATIO_STEP, 'size': len(RATIO_GRID)}
+}
+
+def build_table(sale_price_rate: float) -> np.ndarray:
+    """매각가율 하나에 대한 전체 확률 테이블 (float32)"""
+    table = bid_simulation.calculate_advanced_win_probability(
+        RATIO_GRID[np.newaxis, np.newaxis, np.newaxis, :],
+        COMPETITOR_COUNTS[np.newaxis, :, np.newaxis, np.newaxis],
+        np.array(URGENCY_LEVELS, dtype=object)[:, np.newaxis, np.newaxis, np.newaxis],
+        FAILED_COUNTS[np.newaxis, np.newaxis, :, np.newaxis],
+        sale_price_rate
+    )
+    return table.astype(np.float32)
+
+def lookup(table: np.ndarray, price_ratio, competitor_count=5, urgency='medium', failed_count=0,
+           interpolate: bool = False) -> np.ndarray:
+    """
+    테이블에서 낙찰 확률 조회 (인자는 스칼라 또는 배열, 브로드캐스팅)
+    interpolate=True이면 가격비율 방향으로 인접 격자점 사이를 선형 보간 (그래프용 매끄러운 곡선)
+    """
+    price_ratio = np.asarray(price_ratio, dtype=float)
+    competitor_count = np.asarray(competitor_count, dtype=float)
+    failed_count = np.asarray(failed_count, dtype=float)
+    codes = bid_simulation.get_urgency_codes(urgency)
+
+    # 모델과 같은 구간 규칙: 3~8명, 0~3회는 정수일 때만 해당 칸, 나머지는 마지막 칸
+    is_whole = competitor_count == np.floor(competitor_count)
+    competitor_index = np.where(
+        competitor_count <= 2, 0,
+        np.where(is_whole & (competitor_count <= 8), competitor_count - 1, 8)
+    ).astype(np.intp)
+    is_whole = failed_count == np.floor(failed_count)
+    failed_index = np.where(is_whole & (failed_count >= 0) & (failed_count <= 3), failed_count, 4).astype(np.intp)
+
+    last = len(RATIO_GRID) - 1
+    lower = np.clip(np.searchsorted(RATIO_GRID, price_ratio, side='right') - 1, 0, last)
+    probability = table[codes, competitor_index, failed_index, lower]
+
+    if interpolate:
+        upper = np.minimum(lower + 1, last)
+        weight = np.clip((price_ratio - RATIO_GRID[lower]) / RATIO_STEP, 0, 1)
+        probability = probability + (table[codes, competitor_index, failed_index, upper] - probability) * weight
+
+    return np.where(np.isnan(price_ratio), 0.5, probability)
+
+class ProbabilityTableStore:
+    def __init__(self, statistics_analyzer=None, max_tables: int = 64):
+        """
+        - statistics_analyzer: 구/군별 매각가율을 제공하는 AuctionStatisticsAnalyzer
+        - max_tables: 보관할 최대 테이블 수 (통계를 다시 로드하면 매각가율이 바뀌므로 오래 안 쓴 테이블부터 삭제)
+        """
+        self.statistics_analyzer = statistics_analyzer
+        self.max_tables = max_tables
+        # {매각가율: (테이블, .npy 바이트, ETag)}, 최근 사용 순서
+        self.tables = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_sale_price_rate(self, region: Optional[str], district: Optional[str]) -> Optional[float]:
+        """구/군 매각가율 (구/군이 없으면 지역 전체, 통계가 없으면 None)"""
+        if not self.statistics_analyzer or not region:
+            return None
+        if district:
+            stats = self.statistics_analyzer.get_district_statistics(region, district)
+            return stats['sale_price_rate'] if stats and stats['sale_price_rate'] > 0 else None
+        summary = self.statistics_analyzer.get_region_summary(region)
+        if summary and summary['overall_sale_price_rate'] > 0:
+            return summary['overall_sale_price_rate']
+        return None
+
+    def get_table(self, sale_price_rate: float) -> Tuple[np.ndarray, bytes, str]:
+        """매각가율별 테이블과 직렬화된 .npy, ETag (처음 요청할 때 만들어 보관)"""
+        sale_price_rate = float(sale_price_rate)
+        with self.lock:
+            entry = self.tables.get(sale_price_rate)
+            if entry is not None:
+                self.tables.move_to_end(sale_price_rate)
+            else:
+                table = build_table(sale_price_rate)
+                buffer = io.BytesIO()
+                np.save(buffer, table)
+                body = buffer.getvalue()
+                entry = (table, body, hashlib.sha1(body).hexdigest())
+                self.tables[sale_price_rate] = entry
+                while len(self.tables) > self.max_tables:
+                    self.tables.popitem(last=False)
+                logger.info(f"낙찰 확률 테이블 생성: 매각가율 {sale_price_rate}%, {len(body)} bytes")
+            return entry
+
+    def get_district_table(self, region: Optional[str], district: Optional[str]) -> Optional[Dict]:
+        """구/군 테이블 정보 (통계가 없으면 None)"""
+        sale_price_rate = self.get_sale_price_rate(region, district)
+        if sale_price_rate is None:
+            return None
+        table, body, etag = self.get_table(sale_price_rate)
+        return {
+            'sale_price_rate': sale_price_rate,
+            'table': table,
+            'npy': body,
+            'etag': etag
+        }
+
+    @staticmethod
+    def get_axes_header() -> str:
+        """테이블 축 정보 (응답 헤더용 ASCII JSON)"""
+        return json.dumps(TABLE_AXES, separators=(',', ':'))
@@ -5,7 +5,6 @@
 더 정교한 방법으로 실제 데이터 수집
 """
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import re
@@ -21,12 +20,46 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import logging
+from task_runner import iter_completed
+from circuit_breaker import NegativeCache, upstream_breakers
+from http_transport import create_session
 
 logger = logging.getLogger(__name__)
 
+# 대법원 경매정보시스템 검색 URL
+SUPREME_COURT_URL = "https://www.scourt.go.kr/portal/information/auction/auction_list.jsp"
+
+# 부동산 사이트별 경매 검색 (추가 검색 파라미터, 결과 항목 (태그, 클래스), 가격 (태그, 클래스), 출처)
+LISTING_SITES = {
+    'real_estate114': {
+        'url': "https://www.r114.com/auction/search",
+        'params': {'type': 'auction'},
+        'item': ('div', 'auction-item'),
+        'price': ('span', 'price'),
+        'source': '부동산114 (실제)'
+    },
+    'zigbang': {
+        'url': "https://www.zigbang.com/auction/search",
+        'params': {},
+        'item': ('div', 'auction-card'),
+        'price': ('div', 'price'),
+        'source': '직방 (실제)'
+    },
+    'naver': {
+        'url': "https://land.naver.com/auction/search",
+        'params': {},
+        'item': ('div', 'auction-item'),
+        'price': ('span', 'price'),
+        'source': '네이버 부동산 (실제)'
+    }
+}
+
 class RealCourtAuctionCrawler:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, breakers=None, negative_ttl=600):
+        self.breakers = breakers or upstream_breakers
+        # 데이터가 없었던 페이지 URL(사건번호 포함)은 negative_ttl 동안 다시 요청하지 않음
+        self.negative_cache = NegativeCache(ttl=negative_ttl)
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -36,8 +69,16 @@ class RealCourtAuctionCrawler:
             'Upgrade-Insecure-Requests': '1'
         })
         
-    def get_real_auction_data(self, case_number):
-        """실제 법원경매 데이터 수집"""
+    def get_real_auction_data(self, case_number, race=False, max_workers=8, deadline=30):
+        """
+        실제 법원경매 데이터 수집
+
+        race=True이면 후보 소스를 모두 동시에 요청하고 가장 먼저 데이터를 돌려준 소스를 사용한다.
+        같은 시점에 끝난 소스끼리는 기존 순차 수집의 우선순위를 따른다.
+        """
+        if race:
+            return self.race_real_auction_data(case_number, max_workers, deadline)
+        
         try:
             # 1. 법원경매사이트 직접 접근
             real_data = self.crawl_court_auction_direct(case_number)
@@ -65,6 +106,92 @@ class RealCourtAuctionCrawler:
             logger.error(f"실제 경매 데이터 수집 실패: {e}")
             return None
     
+    def race_real_auction_data(self, case_number, max_workers=8, deadline=30):
+        """후보 소스를 동시에 요청하고 처음으로 데이터를 찾은 결과 반환 (나머지는 취소)"""
+        tasks = self.get_candidate_fetchers(case_number)
+        logger.info(f"경매 데이터 동시 수집 시작: {len(tasks)}개 후보 (최대 {deadline}초)")
+        
+        results = iter_completed(tasks, max_workers=max_workers, deadline=deadline)
+        try:
+            for name, auction_data, error in results:
+                if error:
+                    logger.warning(f"{name} 수집 실패: {error}")
+                elif auction_data:
+                    logger.info(f"{name}에서 경매 데이터 수집 성공: {case_number}")
+                    return auction_data
+        finally:
+            # 남은 후보 요청 취소
+            results.close()
+        
+        return None
+    
+    def get_candidate_fetchers(self, case_number):
+        """순차 수집과 같은 우선순위의 후보 소스별 수집 함수"""
+        return {
+            name: lambda spec=spec: self.fetch_candidate(*spec)
+            for name, spec in self.get_candidate_requests(case_number).items()
+        }
+    
+    def get_candidate_requests(self, case_number):
+        """
+        후보 소스별 요청 정보 {이름: (method, url, 요청 옵션, 응답 본문 파싱 함수)}
+        순서가 우선순위이며, 동기 수집과 비동기 수집(async_crawl)이 함께 사용
+        """
+        candidates = {}
+        parse_court_page = lambda content: self.parse_court_page(content, case_number)
+        
+        if self.parse_case_number(case_number):
+            for i, url in enumerate(self.get_court_direct_urls(case_number), 1):
+                candidates[f'court_direct_{i}'] = ('GET', url, {}, parse_court_page)
+        
+        candidates['supreme_court'] = self.get_supreme_court_request(case_number)
+        
+        for court, search_url in self.get_regional_court_urls(case_number):
+            candidates[f'regional_{court}'] = ('GET', search_url, {}, parse_court_page)
+        
+        for site in LISTING_SITES:
+            candidates[site] = self.get_listing_request(site, case_number)
+        
+        return candidates
+    
+    def get_negative_cache_key(self, method, url, options):
+        """데이터가 없었던 요청을 기억할 키"""
+        return (method, url, json.dumps(options, sort_keys=True, ensure_ascii=False))
+    
+    def fetch_candidate(self, method, url, options, parse):
+        """후보 소스 요청 후 경매 데이터 추출 (최근 데이터가 없었던 요청은 생략)"""
+        cache_key = self.get_negative_cache_key(method, url, options)
+        if self.negative_cache.contains(cache_key):
+            return None
+        
+        response = self.request(method, url, timeout=15, **options)
+        response.raise_for_status()
+        
+        auction_data = parse(response.content)
+        if not auction_data:
+            self.negative_cache.add(cache_key)
+        return auction_data
+    
+    def get_court_direct_urls(self, case_number):
+        """법원경매사이트 직접 접근 URL 패턴"""
+        return [
+            f"https://www.courtauction.go.kr/pgj/index.on?w2xPath=/pgj/ui/pgj100/PGJ163M0{i}.xml&caseNo={quote(case_number)}"
+            for i in range(1, 5)
+        ]
+    
+    def request(self, method, url, **kwargs):
+        """호스트별 서킷 브레이커를 거쳐 요청 (서킷이 열려 있으면 CircuitOpenError)"""
+        return self.breakers.request(self.session, method, url, **kwargs)
+    
+    def fetch_court_page(self, url, case_number):
+        """법원 페이지를 가져와 경매 데이터 추출 (최근 데이터가 없었던 URL은 요청 생략)"""
+        return self.fetch_candidate('GET', url, {}, lambda content: self.parse_court_page(content, case_number))
+    
+    def parse_court_page(self, content, case_number):
+        """법원 페이지 HTML에서 경매 데이터 추출"""
+        soup = BeautifulSoup(content, 'html.parser')
+        return self.extract_auction_data_from_html(soup, case_number)
+    
     def crawl_court_auction_direct(self, case_number):
         """법원경매사이트 직접 크롤링"""
         try:
@@ -74,21 +201,10 @@ class RealCourtAuctionCrawler:
                 return None
             
             # 여러 URL 패턴 시도
-            urls = [
-                f"https://www.courtauction.go.kr/pgj/index.on?w2xPath=/pgj/ui/pgj100/PGJ163M01.xml&caseNo={quote(case_number)}",
-                f"https://www.courtauction.go.kr/pgj/index.on?w2xPath=/pgj/ui/pgj100/PGJ163M02.xml&caseNo={quote(case_number)}",
-                f"https://www.courtauction.go.kr/pgj/index.on?w2xPath=/pgj/ui/pgj100/PGJ163M03.xml&caseNo={quote(case_number)}",
-                f"https://www.courtauction.go.kr/pgj/index.on?w2xPath=/pgj/ui/pgj100/PGJ163M04.xml&caseNo={quote(case_number)}"
-            ]
-            
-            for url in urls:
+            for url in self.get_court_direct_urls(case_number):
                 try:
                     logger.info(f"법원경매사이트 접근 시도: {url}")
-                    response = self.session.get(url, timeout=15)
-                    response.raise_for_status()
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    auction_data = self.extract_auction_data_from_html(soup, case_number)
+                    auction_data = self.fetch_court_page(url, case_number)
                     
                     if auction_data:
                         logger.info(f"실제 경매 데이터 수집 성공: {case_number}")
@@ -104,23 +220,19 @@ class RealCourtAuctionCrawler:
             logger.error(f"법원경매사이트 직접 크롤링 실패: {e}")
             return None
     
+    def get_supreme_court_request(self, case_number):
+        """대법원 경매정보시스템 검색 요청 (POST)"""
+        data = {
+            'caseNo': case_number,
+            'searchType': 'caseNo'
+        }
+        return ('POST', SUPREME_COURT_URL, {'data': data},
+                lambda content: self.parse_court_page(content, case_number))
+    
     def crawl_supreme_court_auction(self, case_number):
         """대법원 경매정보시스템 크롤링"""
         try:
-            # 대법원 경매정보시스템 URL
-            url = "https://www.scourt.go.kr/portal/information/auction/auction_list.jsp"
-            
-            # POST 요청으로 검색
-            data = {
-                'caseNo': case_number,
-                'searchType': 'caseNo'
-            }
-            
-            response = self.session.post(url, data=data, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            auction_data = self.extract_auction_data_from_html(soup, case_number)
+            auction_data = self.fetch_candidate(*self.get_supreme_court_request(case_number))
             
             if auction_data:
                 logger.info(f"대법원 경매정보시스템에서 데이터 수집 성공: {case_number}")
@@ -132,46 +244,47 @@ class RealCourtAuctionCrawler:
             logger.error(f"대법원 경매정보시스템 크롤링 실패: {e}")
             return None
     
+    def get_regional_court_urls(self, case_number):
+        """사건번호에 해당하는 지방법원 검색 URL 목록 [(법원, URL)]"""
+        # 사건번호에서 법원 정보 추출
+        parsed_case = self.parse_case_number(case_number)
+        if not parsed_case:
+            return []
+        
+        court_name = parsed_case.get('court_name', '')
+        
+        # 지방법원별 URL 패턴
+        court_urls = {
+            '서울': 'https://www.slcourt.go.kr/auction/',
+            '부산': 'https://www.bsdcourt.go.kr/auction/',
+            '대구': 'https://www.dgdcourt.go.kr/auction/',
+            '인천': 'https://www.icdcourt.go.kr/auction/',
+            '광주': 'https://www.gjdcourt.go.kr/auction/',
+            '대전': 'https://www.djdcourt.go.kr/auction/',
+            '울산': 'https://www.ulsdcourt.go.kr/auction/',
+            '세종': 'https://www.sjdcourt.go.kr/auction/'
+        }
+        
+        return [
+            (court, f"{base_url}search?caseNo={quote(case_number)}")
+            for court, base_url in court_urls.items()
+            if court in court_name
+        ]
+    
     def crawl_regional_court_auction(self, case_number):
         """각 지방법원별 경매 정보 크롤링"""
         try:
-            # 사건번호에서 법원 정보 추출
-            parsed_case = self.parse_case_number(case_number)
-            if not parsed_case:
-                return None
-            
-            court_code = parsed_case.get('court_code', '')
-            court_name = parsed_case.get('court_name', '')
-            
-            # 지방법원별 URL 패턴
-            court_urls = {
-                '서울': 'https://www.slcourt.go.kr/auction/',
-                '부산': 'https://www.bsdcourt.go.kr/auction/',
-                '대구': 'https://www.dgdcourt.go.kr/auction/',
-                '인천': 'https://www.icdcourt.go.kr/auction/',
-                '광주': 'https://www.gjdcourt.go.kr/auction/',
-                '대전': 'https://www.djdcourt.go.kr/auction/',
-                '울산': 'https://www.ulsdcourt.go.kr/auction/',
-                '세종': 'https://www.sjdcourt.go.kr/auction/'
-            }
-            
-            for court, base_url in court_urls.items():
-                if court in court_name:
-                    try:
-                        search_url = f"{base_url}search?caseNo={quote(case_number)}"
-                        response = self.session.get(search_url, timeout=15)
-                        response.raise_for_status()
-                        
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        auction_data = self.extract_auction_data_from_html(soup, case_number)
+            for court, search_url in self.get_regional_court_urls(case_number):
+                try:
+                    auction_data = self.fetch_court_page(search_url, case_number)
+                    
+                    if auction_data:
+                        logger.info(f"{court}지방법원에서 데이터 수집 성공: {case_number}")
+                        return auction_data
                         
-                        if auction_data:
-                            logger.info(f"{court}지방법원에서 데이터 수집 성공: {case_number}")
-                            return auction_data
-                            
-                    except Exception as e:
-                        logger.warning(f"{court}지방법원 접근 실패: {e}")
-                        continue
+                except Exception as e:
+                    logger.warning(f"{court}지방법원 접근 실패: {e}")
+                    continue
             
             return None
             
@@ -203,43 +316,47 @@ class RealCourtAuctionCrawler:
             logger.error(f"부동산 사이트 경매 정보 크롤링 실패: {e}")
             return None
     
+    def get_listing_request(self, site, case_number):
+        """부동산 사이트 경매 검색 요청 (GET)"""
+        site_info = LISTING_SITES[site]
+        params = dict({'q': case_number}, **site_info['params'])
+        return ('GET', site_info['url'], {'params': params},
+                lambda content: self.parse_listing_page(content, site, case_number))
+    
+    def parse_listing_page(self, content, site, case_number):
+        """부동산 사이트 검색 결과 HTML에서 첫 번째 경매 항목의 가격 추출"""
+        site_info = LISTING_SITES[site]
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # 경매 정보 추출
+        item_tag, item_class = site_info['item']
+        auction_items = soup.find_all(item_tag, class_=item_class)
+        if auction_items:
+            item = auction_items[0]  # 첫 번째 결과
+            
+            # 가격 정보 추출
+            price_tag, price_class = site_info['price']
+            price_elem = item.find(price_tag, class_=price_class)
+            if price_elem:
+                price_text = price_elem.get_text().strip()
+                price = self.parse_price(price_text)
+                
+                return {
+                    'caseNumber': case_number,
+                    'marketPrice': price,
+                    'appraisalPrice': int(price * 0.9),
+                    'minimumBid': int(price * 0.7),
+                    'source': site_info['source'],
+                    'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'isRealData': True
+                }
+        
+        return None
+    
     def crawl_real_estate114_auction(self, case_number):
         """부동산114 경매 검색"""
         try:
-            url = "https://www.r114.com/auction/search"
-            params = {
-                'q': case_number,
-                'type': 'auction'
-            }
-            
-            response = self.session.get(url, params=params, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 경매 정보 추출
-            auction_items = soup.find_all('div', class_='auction-item')
-            if auction_items:
-                item = auction_items[0]  # 첫 번째 결과
-                
-                # 가격 정보 추출
-                price_elem = item.find('span', class_='price')
-                if price_elem:
-                    price_text = price_elem.get_text().strip()
-                    price = self.parse_price(price_text)
-                    
-                    return {
-                        'caseNumber': case_number,
-                        'marketPrice': price,
-                        'appraisalPrice': int(price * 0.9),
-                        'minimumBid': int(price * 0.7),
-                        'source': '부동산114 (실제)',
-                        'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'isRealData': True
-                    }
-            
-            return None
-            
+            return self.fetch_candidate(*self.get_listing_request('real_estate114', case_number))
         except Exception as e:
             logger.warning(f"부동산114 경매 검색 실패: {e}")
             return None
@@ -247,39 +364,7 @@ class RealCourtAuctionCrawler:
     def crawl_zigbang_auction(self, case_number):
         """직방 경매 검색"""
         try:
-            url = "https://www.zigbang.com/auction/search"
-            params = {
-                'q': case_number
-            }
-            
-            response = self.session.get(url, params=params, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 경매 정보 추출
-            auction_items = soup.find_all('div', class_='auction-card')
-            if auction_items:
-                item = auction_items[0]  # 첫 번째 결과
-                
-                # 가격 정보 추출
-                price_elem = item.find('div', class_='price')
-                if price_elem:
-                    price_text = price_elem.get_text().strip()
-                    price = self.parse_price(price_text)
-                    
-                    return {
-                        'caseNumber': case_number,
-                        'marketPrice': price,
-                        'appraisalPrice': int(price * 0.9),
-                        'minimumBid': int(price * 0.7),
-                        'source': '직방 (실제)',
-                        'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'isRealData': True
-                    }
-            
-            return None
-            
+            return self.fetch_candidate(*self.get_listing_request('zigbang', case_number))
         except Exception as e:
             logger.warning(f"직방 경매 검색 실패: {e}")
             return None
@@ -287,39 +372,7 @@ class RealCourtAuctionCrawler:
     def crawl_naver_real_estate_auction(self, case_number):
         """네이버 부동산 경매 검색"""
         try:
-            url = "https://land.naver.com/auction/search"
-            params = {
-                'q': case_number
-            }
-            
-            response = self.session.get(url, params=params, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 경매 정보 추출
-            auction_items = soup.find_all('div', class_='auction-item')
-            if auction_items:
-                item = auction_items[0]  # 첫 번째 결과
-                
-                # 가격 정보 추출
-                price_elem = item.find('span', class_='price')
-                if price_elem:
-                    price_text = price_elem.get_text().strip()
-                    price = self.parse_price(price_text)
-                    
-                    return {
-                        'caseNumber': case_number,
-                        'marketPrice': price,
-                        'appraisalPrice': int(price * 0.9),
-                        'minimumBid': int(price * 0.7),
-                        'source': '네이버 부동산 (실제)',
-                        'lastUpdated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'isRealData': True
-                    }
-            
-            return None
-            
+            return self.fetch_candidate(*self.get_listing_request('naver', case_number))
         except Exception as e:
             logger.warning(f"네이버 부동산 경매 검색 실패: {e}")
             return None
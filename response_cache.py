@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+읽기 전용 API 응답 캐시
+정규화된 요청 본문을 키로 직렬화된 JSON 응답을 보관하고 ETag/If-None-Match(304)를 지원
+"""
+
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Dict, Hashable, Optional
+
+from flask import request, make_response
+
+class CachedResponse:
+    """캐시된 응답 (본문, 상태 코드, ETag)"""
+    __slots__ = ('body', 'status', 'etag')
+
+    def __init__(self, body: bytes, status: int):
+        self.body = body
+        self.status = status
+        self.etag = hashlib.sha1(body).hexdigest()
+
+class ResponseCache:
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024, max_entries: int = 1024):
+        """
+        - max_bytes: 캐시에 보관할 응답 본문의 최대 총 크기
+        - max_entries: 최대 항목 수
+        크기나 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.generation = None
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, generation) -> Optional[CachedResponse]:
+        """캐시 조회 (데이터 세대가 바뀌었으면 전체 무효화 후 None)"""
+        with self._lock:
+            self._sync_generation(generation)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(self, key: Hashable, body: bytes, status: int, generation) -> CachedResponse:
+        """응답 저장 (예산보다 큰 응답은 저장하지 않고 그대로 반환)"""
+        entry = CachedResponse(body, status)
+        if len(body) > self.max_bytes:
+            return entry
+
+        with self._lock:
+            self._sync_generation(generation)
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.body)
+
+            self._entries[key] = entry
+            self._size += len(body)
+
+            while self._size > self.max_bytes or len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+
+        return entry
+
+    def clear(self):
+        """모든 항목 제거"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get_stats(self) -> Dict:
+        """캐시 사용 현황"""
+        with self._lock:
+            return {
+                'generation': self.generation,
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses
+            }
+
+    def _sync_generation(self, generation):
+        if generation != self.generation:
+            self._entries.clear()
+            self._size = 0
+            self.generation = generation
+
+def normalize_request_body(body) -> str:
+    """
+    요청 본문을 캐시 키용 문자열로 정규화 (키 순서만 정렬)
+    값은 바꾸지 않음: 뷰가 받는 본문이 다르면(" 서울"과 "서울" 등) 응답도 다를 수 있으므로 같은 키로 묶지 않는다.
+    """
+    return json.dumps(body, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+def cached_json_response(cache: ResponseCache, get_generation: Callable[[], Hashable]):
+    """
+    Flask 뷰 데코레이터: 같은 경로와 정규화된 요청 본문이면 캐시된 응답을 반환
+    ETag를 함께 보내고, If-None-Match가 일치하면 본문 없이 304 응답
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method == 'GET':
+                body = request.args.to_dict()
+            else:
+                body = request.get_json(silent=True)
+            key = (request.path, normalize_request_body(body))
+            generation = get_generation()
+
+            entry = cache.get(key, generation)
+            if entry is None:
+                response = make_response(view(*args, **kwargs))
+                # 서버 오류는 일시적일 수 있으므로 캐시하지 않음
+                if response.status_code >= 500:
+                    return response
+                entry = cache.put(key, response.get_data(), response.status_code, generation)
+
+            if entry.status == 200 and request.if_none_match.contains(entry.etag):
+                response = make_response('', 304)
+            else:
+                response = make_response(entry.body, entry.status)
+                response.mimetype = 'application/json'
+            response.set_etag(entry.etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
@@ -5,7 +5,6 @@
 부동산 투자 분석 데이터 수집
 """
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import re
@@ -13,11 +12,12 @@ from urllib.parse import quote, urljoin
 import time
 from datetime import datetime
 import random
+from http_transport import create_session
 
 class RichgoCrawler:
     def __init__(self):
         self.base_url = "https://m.richgo.ai"
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+권장 입찰가 민감도/시나리오 분석
+경쟁자 수, 입찰긴급도(getUrgencyMultiplier), 시장 상황, 수리비 조합별 calculateOptimalBid 결과를
+완전요인 설계 또는 라틴 하이퍼큐브 표본으로 한 번의 벡터 연산으로 계산하고
+요인별 토네이도(민감도) 표를 만든다.
+
+시나리오와 무관한 값(매각가율 기반 권장 입찰가 구성요소)과
+경쟁자 수 × 입찰긴급도 조합별 목표 확률 탐색 결과는 한 번만 계산하여 모든 시나리오에서 공유한다.
+"""
+
+import math
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+
+import bid_simulation
+from bid_simulation import DEFAULT_SALE_PRICE_RATE, TARGET_SEARCH_RATIOS, URGENCY_LEVELS
+
+logger = logging.getLogger(__name__)
+
+MARKET_CONDITIONS = ('hot', 'normal', 'cold')
+
+# 분석 요인 (범주형 요인은 가능한 값 목록)
+SWEEP_FACTORS = ('competitorCount', 'urgency', 'marketCondition', 'renovationCost')
+CATEGORICAL_FACTORS = {
+    'urgency': URGENCY_LEVELS,
+    'marketCondition': MARKET_CONDITIONS
+}
+
+# 요인을 지정하지 않았을 때의 기본 수준 (수리비는 시세 대비 비율)
+DEFAULT_COMPETITOR_COUNTS = (1, 3, 5, 8, 12)
+DEFAULT_COMPETITOR_RANGE = (1, 15)
+DEFAULT_RENOVATION_RATES = (0, 0.01, 0.03, 0.05)
+
+# 요인별 최대 수준 수 (라틴 하이퍼큐브 설계에서도 토네이도 표는 수준마다 계산하므로 제한)
+SWEEP_MAX_LEVELS = 100
+
+# 입찰긴급도별 권장 입찰가 배수 (URGENCY_LEVELS 순서)
+URGENCY_MULTIPLIER_ARRAY = np.array([bid_simulation.URGENCY_MULTIPLIERS[level] for level in URGENCY_LEVELS])
+
+def full_factorial(levels: Dict[str, list]) -> Dict[str, np.ndarray]:
+    """요인별 수준의 모든 조합 (요인 순서대로 마지막 요인이 가장 빠르게 바뀜)"""
+    names = list(levels)
+    grids = np.meshgrid(*[np.arange(len(levels[name])) for name in names], indexing='ij')
+    return {
+        name: np.asarray(levels[name], dtype=object if name in CATEGORICAL_FACTORS else float)[grid.ravel()]
+        for name, grid in zip(names, grids)
+    }
+
+def latin_hypercube(specs: Dict, samples: int, seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    라틴 하이퍼큐브 표본 (요인마다 [0, 1)을 samples개 구간으로 나누어 구간마다 한 번씩 추출)
+    specs 값이 {'min', 'max'}이면 연속 구간, 목록이면 목록에서 고르게 선택
+    경쟁자 수는 모델이 정수만 구분하므로 정수로 반올림
+    """
+    rng = np.random.default_rng(seed)
+    scenarios = {}
+    for name, spec in specs.items():
+        quantiles = (rng.permutation(samples) + rng.random(samples)) / samples
+        if isinstance(spec, dict):
+            values = spec['min'] + quantiles * (spec['max'] - spec['min'])
+            if name == 'competitorCount':
+                values = np.floor(values + 0.5)
+        else:
+            dtype = object if name in CATEGORICAL_FACTORS else float
+            index = np.minimum((quantiles * len(spec)).astype(np.intp), len(spec) - 1)
+            values = np.asarray(spec, dtype=dtype)[index]
+        scenarios[name] = values
+    return scenarios
+
+class ScenarioSweep:
+    def __init__(self, market_price: float, appraisal_price: float, minimum_bid: float, bid_price: float,
+                 failed_count: float = 0, sale_price_rate: float = DEFAULT_SALE_PRICE_RATE,
+                 auction_type: str = 'realEstate'):
+        """물건 조건 (시나리오마다 바뀌지 않는 값)"""
+        self.market_price = market_price
+        self.appraisal_price = appraisal_price
+        self.minimum_bid = minimum_bid
+        self.bid_price = bid_price
+        self.failed_count = failed_count
+        self.sale_price_rate = sale_price_rate
+
+        # 매각가율 기반 권장 입찰가 구성요소 (calculateRecommendedBidPrice, 수리비 제외)
+        target_profit_rate = bid_simulation.js_round((bid_price - market_price) / market_price * 100)
+        fee_rate = bid_simulation.AUCTION_FEE_RATES.get(auction_type, bid_simulation.AUCTION_FEE_RATES['general'])
+        self.expected_auction_price = market_price * (sale_price_rate / 100)
+        self.base_additional_costs = self.expected_auction_price * 0.015
+        self.total_fees = self.expected_auction_price * fee_rate
+        self.target_profit = self.expected_auction_price * (target_profit_rate / 100)
+
+    def win_probability(self, bids, competitor_counts, urgencies) -> np.ndarray:
+        """감정가 대비 가격비율 기준 낙찰 확률 (calculateOptimalBid와 같은 기준)"""
+        return bid_simulation.calculate_advanced_win_probability(
+            bids / self.appraisal_price, competitor_counts, urgencies, self.failed_count, self.sale_price_rate
+        )
+
+    def get_target_ratios(self, competitor_counts: np.ndarray, codes: np.ndarray,
+                          target_probabilities: np.ndarray) -> np.ndarray:
+        """
+        시나리오별 목표 확률 가격비율 (calculate_price_ratio_for_target_probability의 벡터 버전)
+        탐색 구간의 낙찰 확률은 경쟁자 수 × 입찰긴급도 조합마다 한 번만 계산
+        """
+        pairs, inverse = np.unique(np.stack([competitor_counts, codes]), axis=1, return_inverse=True)
+        pair_probabilities = bid_simulation.calculate_advanced_win_probability(
+            TARGET_SEARCH_RATIOS[np.newaxis, :],
+            pairs[0][:, np.newaxis],
+            np.array(URGENCY_LEVELS, dtype=object)[pairs[1].astype(np.intp)][:, np.newaxis],
+            self.failed_count, self.sale_price_rate
+        )
+
+        errors = np.abs(pair_probabilities[inverse.ravel()] - target_probabilities[:, np.newaxis])
+        # 오차 0.01 이하인 첫 비율, 없으면 오차가 가장 작은 비율
+        close_enough = errors <= 0.01
+        index = np.where(close_enough.any(axis=1), close_enough.argmax(axis=1), errors.argmin(axis=1))
+        return TARGET_SEARCH_RATIOS[index]
+
+    def evaluate(self, competitor_counts, urgencies, market_conditions, renovation_costs) -> Dict[str, np.ndarray]:
+        """
+        시나리오별 calculateOptimalBid 권장 입찰가와 낙찰 확률, 수익률 (인자는 같은 길이의 배열)
+        리스크 조정 수익률은 시세를 가치로 사용 (calculateRiskAdjustedProfit)
+        """
+        competitor_counts = np.asarray(competitor_counts, dtype=float)
+        renovation_costs = np.asarray(renovation_costs, dtype=float)
+        market_conditions = np.asarray(market_conditions, dtype=object)
+        codes = bid_simulation.get_urgency_codes(urgencies)
+        urgencies = np.array(URGENCY_LEVELS, dtype=object)[codes]
+
+        # 1. 매각가율 기반 권장 입찰가 × 입찰긴급도 배수
+        recommended = (self.expected_auction_price - (renovation_costs + self.base_additional_costs)
+                       - self.total_fees - self.target_profit)
+        recommended = np.floor(np.maximum(recommended, self.market_price * 0.3) + 0.5)
+        recommended = recommended * URGENCY_MULTIPLIER_ARRAY[codes]
+
+        # 2. 유찰 횟수 조정과 시세 대비 안전성 조정
+        if self.failed_count > 0:
+            recommended = recommended * max(0.95 ** self.failed_count, 0.7)
+        recommended = np.where(recommended / self.market_price > 0.9, recommended * 0.95, recommended)
+
+        # 3. 최저입찰가의 105% 이상, 감정가의 98% 이하, 최저입찰가의 200% 이하
+        recommended = np.maximum(recommended, self.minimum_bid * 1.05)
+        recommended = np.minimum(recommended, self.appraisal_price * 0.98)
+        recommended = np.minimum(recommended, self.minimum_bid * 2.0)
+
+        # 4. 낙찰 확률이 50~60%를 벗어나면 목표 확률에 맞는 가격비율로 다시 계산
+        probabilities = self.win_probability(recommended, competitor_counts, urgencies)
+        outside = (probabilities < 0.50) | (probabilities > 0.60)
+        if outside.any():
+            target_ratios = self.get_target_ratios(
+                competitor_counts[outside], codes[outside], np.where(probabilities[outside] < 0.50, 0.52, 0.58)
+            )
+            recommended[outside] = np.maximum(self.appraisal_price * target_ratios, self.minimum_bid * 1.05)
+            probabilities[outside] = self.win_probability(
+                recommended[outside], competitor_counts[outside], urgencies[outside]
+            )
+
+        # 5. 수익률 (예상 수익률은 JS와 같이 입력 입찰가를 가치로 사용)
+        total_costs = recommended + bid_simulation.calculate_additional_costs(recommended) + renovation_costs
+        expected_profits = bid_simulation.calculate_expected_profit(self.bid_price, total_costs)
+
+        risk_adjusted_profits = np.empty(len(recommended))
+        for condition in set(market_conditions):
+            mask = market_conditions == condition
+            risk_adjusted_profits[mask] = bid_simulation.calculate_risk_adjusted_profit(
+                self.market_price, total_costs[mask], probabilities[mask], condition, self.failed_count
+            )
+
+        return {
+            'recommended_bids': recommended,
+            'win_probabilities': probabilities,
+            'total_costs': total_costs,
+            'expected_profits': expected_profits,
+            'risk_adjusted_profits': risk_adjusted_profits
+        }
+
+    def get_default_factors(self, design: str) -> Dict:
+        """요인을 지정하지 않았을 때의 기본 수준 (lhs이면 연속 요인은 구간)"""
+        renovation_costs = [self.market_price * rate for rate in DEFAULT_RENOVATION_RATES]
+        if design == 'lhs':
+            return {
+                'competitorCount': {'min': DEFAULT_COMPETITOR_RANGE[0], 'max': DEFAULT_COMPETITOR_RANGE[1]},
+                'urgency': list(URGENCY_LEVELS),
+                'marketCondition': list(MARKET_CONDITIONS),
+                'renovationCost': {'min': renovation_costs[0], 'max': renovation_costs[-1]}
+            }
+        return {
+            'competitorCount': list(DEFAULT_COMPETITOR_COUNTS),
+            'urgency': list(URGENCY_LEVELS),
+            'marketCondition': list(MARKET_CONDITIONS),
+            'renovationCost': renovation_costs
+        }
+
+    def normalize_factors(self, factors: Optional[Dict], design: str) -> Dict:
+        """요청 요인 검증 및 기본값 적용 (잘못된 값이면 ValueError)"""
+        normalized = self.get_default_factors(design)
+        for name, spec in (factors or {}).items():
+            if name not in SWEEP_FACTORS:
+                raise ValueError(f'알 수 없는 요인입니다: {name}')
+
+            if isinstance(spec, dict):
+                if name in CATEGORICAL_FACTORS or design != 'lhs':
+                    raise ValueError(f'{name}는 값 목록이어야 합니다.')
+                try:
+                    spec = {'min': float(spec['min']), 'max': float(spec['max'])}
+                except (KeyError, TypeError, ValueError):
+                    raise ValueError(f'{name} 구간은 숫자 min, max가 필요합니다.')
+                if not (math.isfinite(spec['min']) and math.isfinite(spec['max'])):
+                    raise ValueError(f'{name} 구간은 숫자 min, max가 필요합니다.')
+                if spec['max'] < spec['min']:
+                    raise ValueError(f'{name} 구간의 max가 min보다 작습니다.')
+            else:
+                if not isinstance(spec, list) or not spec:
+                    raise ValueError(f'{name}는 비어 있지 않은 목록이어야 합니다.')
+                if len(spec) > SWEEP_MAX_LEVELS:
+                    raise ValueError(f'{name} 수준은 최대 {SWEEP_MAX_LEVELS}개입니다.')
+                if name == 'urgency':
+                    spec = [bid_simulation.normalize_urgency(value) for value in spec]
+                elif name == 'marketCondition':
+                    if any(value not in MARKET_CONDITIONS for value in spec):
+                        raise ValueError(f'marketCondition은 {", ".join(MARKET_CONDITIONS)} 중 하나여야 합니다.')
+                else:
+                    try:
+                        spec = [float(value) for value in spec]
+                    except (TypeError, ValueError):
+                        raise ValueError(f'{name}는 숫자 목록이어야 합니다.')
+                    if not all(math.isfinite(value) for value in spec):
+                        raise ValueError(f'{name}는 숫자 목록이어야 합니다.')
+            normalized[name] = spec
+        return normalized
+
+    @staticmethod
+    def count_scenarios(factors: Dict, design: str, samples: int) -> int:
+        if design == 'lhs':
+            return samples
+        return int(np.prod([len(levels) for levels in factors.values()]))
+
+    @staticmethod
+    def get_tornado_levels(spec) -> list:
+        """토네이도 표에 쓸 요인 수준 (연속 구간은 5개 균등 간격)"""
+        if isinstance(spec, dict):
+            return np.linspace(spec['min'], spec['max'], 5).tolist()
+        return list(dict.fromkeys(spec))
+
+    def tornado(self, factors: Dict, base: Dict) -> List[Dict]:
+        """
+        요인별 민감도 (다른 요인은 기준값에 고정하고 한 요인만 바꾼 결과)
+        권장 입찰가 변동폭(swing)이 큰 요인부터 정렬
+        """
+        names, level_lists = [], []
+        for name in SWEEP_FACTORS:
+            levels = self.get_tornado_levels(factors[name])
+            if name == 'competitorCount':
+                levels = list(dict.fromkeys(np.floor(np.asarray(levels) + 0.5).tolist()))
+            names.append(name)
+            level_lists.append(levels)
+
+        # 모든 한 요인 변경 시나리오를 한 번에 계산
+        columns = {name: [] for name in SWEEP_FACTORS}
+        for name, levels in zip(names, level_lists):
+            for level in levels:
+                for column in SWEEP_FACTORS:
+                    columns[column].append(level if column == name else base[column])
+        result = self.evaluate(columns['competitorCount'], columns['urgency'],
+                               columns['marketCondition'], columns['renovationCost'])
+
+        rows, start = [], 0
+        for name, levels in zip(names, level_lists):
+            rows_slice = slice(start, start + len(levels))
+            start += len(levels)
+            bids = result['recommended_bids'][rows_slice]
+            profits = result['risk_adjusted_profits'][rows_slice]
+            rows.append({
+                'factor': name,
+                'levels': levels,
+                'recommendedBids': bids.tolist(),
+                'winProbabilities': result['win_probabilities'][rows_slice].tolist(),
+                'riskAdjustedProfits': profits.tolist(),
+                'lowBid': float(bids.min()),
+                'highBid': float(bids.max()),
+                'swing': float(bids.max() - bids.min()),
+                'profitSwing': float(profits.max() - profits.min())
+            })
+
+        rows.sort(key=lambda row: (row['swing'], row['profitSwing']), reverse=True)
+        return rows
+
+    def run(self, base: Dict, factors: Optional[Dict] = None, design: str = 'factorial',
+            samples: int = 1000, seed: Optional[int] = None) -> Dict:
+        """
+        시나리오 분석 실행
+        base: 기준 시나리오 {'competitorCount', 'urgency', 'marketCondition', 'renovationCost'}
+        design: 'factorial'(완전요인 설계) 또는 'lhs'(라틴 하이퍼큐브, samples개)
+        """
+        factors = self.normalize_factors(factors, design)
+        if design == 'lhs':
+            scenarios = latin_hypercube(factors, samples, seed)
+        else:
+            scenarios = full_factorial(factors)
+
+        result = self.evaluate(scenarios['competitorCount'], scenarios['urgency'],
+                               scenarios['marketCondition'], scenarios['renovationCost'])
+        baseline = self.evaluate([base['competitorCount']], [base['urgency']],
+                                 [base['marketCondition']], [base['renovationCost']])
+        logger.info(f"시나리오 분석 완료: {design}, {len(result['recommended_bids'])}개 시나리오")
+
+        return {
+            'design': design,
+            'scenarios': {
+                'competitorCounts': scenarios['competitorCount'].tolist(),
+                'urgencies': scenarios['urgency'].tolist(),
+                'marketConditions': scenarios['marketCondition'].tolist(),
+                'renovationCosts': scenarios['renovationCost'].tolist(),
+                'recommendedBids': result['recommended_bids'].tolist(),
+                'winProbabilities': result['win_probabilities'].tolist(),
+                'totalCosts': result['total_costs'].tolist(),
+                'expectedProfits': result['expected_profits'].tolist(),
+                'riskAdjustedProfits': result['risk_adjusted_profits'].tolist()
+            },
+            'baseline': {
+                'competitorCount': base['competitorCount'],
+                'urgency': bid_simulation.normalize_urgency(base['urgency']),
+                'marketCondition': base['marketCondition'],
+                'renovationCost': base['renovationCost'],
+                'recommendedBid': baseline['recommended_bids'][0].item(),
+                'winProbability': baseline['win_probabilities'][0].item(),
+                'expectedProfit': baseline['expected_profits'][0].item(),
+                'riskAdjustedProfit': baseline['risk_adjusted_profits'][0].item()
+            },
+            'tornado': self.tornado(factors, base)
+        }
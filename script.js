@@ -5616,17 +5616,40 @@ class AuctionSimulator {
 // 전역 시뮬레이터 인스턴스
 let auctionSimulator;
 
+// 매각통계 API 응답 캐시 (ETag 기반 재검증, 변경이 없으면 서버가 304 응답)
+const statisticsResponseCache = new Map();
+
+async function fetchStatisticsJson(url, options = {}) {
+    const cacheKey = `${options.method || 'GET'} ${url} ${options.body || ''}`;
+    const cached = statisticsResponseCache.get(cacheKey);
+    const headers = { ...(options.headers || {}) };
+    if (cached) {
+        headers['If-None-Match'] = cached.etag;
+    }
+
+    const response = await fetch(url, { ...options, headers });
+    if (response.status === 304 && cached) {
+        return cached.data;
+    }
+
+    const data = await response.json();
+    const etag = response.headers.get('ETag');
+    if (etag && response.ok) {
+        statisticsResponseCache.set(cacheKey, { etag, data });
+    }
+    return data;
+}
+
 // 매각통계 API 함수들
 async function fetchDistrictStatistics(region, district) {
     try {
-        const response = await fetch('http://localhost:5001/api/statistics/district', {
+        const data = await fetchStatisticsJson('http://localhost:5001/api/statistics/district', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
             },
             body: JSON.stringify({ region, district })
         });
-        const data = await response.json();
         return data;
     } catch (error) {
         console.error('지역 통계 조회 오류:', error);
@@ -5636,14 +5659,13 @@ async function fetchDistrictStatistics(region, district) {
 
 async function fetchRegionSummary(region) {
     try {
-        const response = await fetch('http://localhost:5001/api/statistics/region-summary', {
+        const data = await fetchStatisticsJson('http://localhost:5001/api/statistics/region-summary', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
             },
             body: JSON.stringify({ region })
         });
-        const data = await response.json();
         return data;
     } catch (error) {
         console.error('지역 요약 조회 오류:', error);
@@ -5653,14 +5675,13 @@ async function fetchRegionSummary(region) {
 
 async function fetchInvestmentRecommendation(region, district) {
     try {
-        const response = await fetch('http://localhost:5001/api/statistics/investment-recommendation', {
+        const data = await fetchStatisticsJson('http://localhost:5001/api/statistics/investment-recommendation', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
             },
             body: JSON.stringify({ region, district })
         });
-        const data = await response.json();
         return data;
     } catch (error) {
         console.error('투자 추천 조회 오류:', error);
@@ -5670,14 +5691,13 @@ async function fetchInvestmentRecommendation(region, district) {
 
 async function fetchTopDistricts(region, criteria = 'sale_rate', limit = 5) {
     try {
-        const response = await fetch('http://localhost:5001/api/statistics/top-districts', {
+        const data = await fetchStatisticsJson('http://localhost:5001/api/statistics/top-districts', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
             },
             body: JSON.stringify({ region, criteria, limit })
         });
-        const data = await response.json();
         return data;
     } catch (error) {
         console.error('상위 구/군 조회 오류:', error);
@@ -5687,8 +5707,7 @@ async function fetchTopDistricts(region, criteria = 'sale_rate', limit = 5) {
 
 async function fetchAllRegionsSummary() {
     try {
-        const response = await fetch('http://localhost:5001/api/statistics/all-regions');
-        const data = await response.json();
+        const data = await fetchStatisticsJson('http://localhost:5001/api/statistics/all-regions');
         return data;
     } catch (error) {
         console.error('전체 지역 요약 조회 오류:', error);
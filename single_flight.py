@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+중복 요청 병합 (single-flight)
+같은 키의 작업이 이미 실행 중이면 새로 실행하지 않고 그 결과를 함께 받음
+이벤트를 차례로 내보내는 스트리밍 작업은 이벤트 목록을 공유하여 나중에 온 요청도 처음부터 받음
+"""
+
+import asyncio
+import threading
+import logging
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+class _Call:
+    """실행 중인 작업 하나의 결과 공유 상태"""
+    __slots__ = ('event', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+class _Stream:
+    """실행 중인 스트리밍 작업 하나의 이벤트 공유 상태"""
+    __slots__ = ('condition', 'events', 'done', 'error', 'subscribers', 'active', 'cancelled')
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.events = []
+        self.done = False
+        self.error = None
+        self.subscribers = 1
+        self.active = 1
+        self.cancelled = False
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._streams = {}
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        key에 해당하는 작업이 실행 중이면 끝날 때까지 기다려 같은 결과(또는 예외)를 반환하고,
+        아니면 func(*args, **kwargs)를 실행한다. 공유되는 결과는 호출자가 수정하지 않아야 한다.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            logger.info(f"진행 중인 동일 요청 결과 대기: {key}")
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.waiters:
+                logger.info(f"동일 요청 {call.waiters}건이 결과 공유: {key}")
+            call.event.set()
+
+    def stream(self, key: Hashable, func: Callable[..., Iterable], *args, **kwargs) -> Iterator:
+        """
+        key에 해당하는 스트리밍 작업이 실행 중이면 그 이벤트를 처음부터 함께 받고,
+        아니면 func(*args, **kwargs)가 반환하는 이벤트를 별도 스레드에서 끝까지 읽어 공유한다.
+        (먼저 요청한 클라이언트가 연결을 끊어도 같은 작업을 기다리는 다른 요청은 계속 받음)
+        모든 요청이 연결을 끊으면 다음 이벤트에서 제너레이터를 닫아 작업을 중단한다.
+        공유되는 이벤트는 호출자가 수정하지 않아야 한다.
+        """
+        with self._lock:
+            call = self._streams.get(key)
+            if call is not None:
+                call.subscribers += 1
+                call.active += 1
+                logger.info(f"진행 중인 동일 스트리밍 요청 이벤트 공유: {key}")
+            else:
+                call = _Stream()
+                self._streams[key] = call
+                threading.Thread(
+                    target=self._produce, args=(key, call, func, args, kwargs),
+                    name='single-flight-stream', daemon=True
+                ).start()
+
+        return self._consume(key, call)
+
+    def _produce(self, key: Hashable, call: _Stream, func: Callable[..., Iterable], args, kwargs):
+        events = None
+        try:
+            events = iter(func(*args, **kwargs))
+            for event in events:
+                if call.cancelled:
+                    logger.info(f"구독자가 없어 스트리밍 작업 중단: {key}")
+                    break
+                with call.condition:
+                    call.events.append(event)
+                    call.condition.notify_all()
+        except Exception as e:
+            call.error = e
+        finally:
+            # 제너레이터를 닫아 아직 시작하지 않은 작업 취소 (중단된 경우)
+            if hasattr(events, 'close'):
+                events.close()
+            with self._lock:
+                if self._streams.get(key) is call:
+                    del self._streams[key]
+            if call.subscribers > 1:
+                logger.info(f"동일 스트리밍 요청 {call.subscribers - 1}건이 이벤트 공유: {key}")
+            with call.condition:
+                call.done = True
+                call.condition.notify_all()
+
+    def _consume(self, key: Hashable, call: _Stream) -> Iterator:
+        index = 0
+        try:
+            while True:
+                with call.condition:
+                    while index >= len(call.events) and not call.done:
+                        call.condition.wait()
+                    events = call.events[index:]
+                    done = call.done
+                yield from events
+                index += len(events)
+                if done and index >= len(call.events):
+                    if call.error is not None:
+                        raise call.error
+                    return
+        finally:
+            with self._lock:
+                call.active -= 1
+                if call.active == 0 and not call.done:
+                    # 마지막 구독자가 연결을 끊으면 작업을 중단하고 같은 키의 새 요청은 새로 실행
+                    call.cancelled = True
+                    if self._streams.get(key) is call:
+                        del self._streams[key]
+
+    def in_flight(self) -> int:
+        """현재 실행 중인 작업 수 (스트리밍 작업 포함)"""
+        with self._lock:
+            return len(self._calls) + len(self._streams)
+
+class AsyncSingleFlight:
+    """SingleFlight의 asyncio 버전 (같은 이벤트 루프 안에서만 사용)"""
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        key에 해당하는 코루틴이 실행 중이면 그 결과를 함께 기다리고, 아니면 func(*args, **kwargs)를 실행한다.
+        기다리던 요청 하나가 취소되어도 공유 작업은 계속 실행된다.
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            logger.info(f"진행 중인 동일 요청 결과 대기: {key}")
+        else:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """현재 실행 중인 작업 수"""
+        return len(self._calls)
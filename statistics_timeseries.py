@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기간별 매각통계 시계열 저장소
+지역별 매각통계 파일(지역별 매각통계_서울_202408~202509.xls)의 기간을 파일 이름에서 읽어
+구/군별 경매건수, 매각건수, 감정가, 매각가를 지역별 NumPy 구조화 배열(기간 × 구/군 레코드)로 보관하고
+기간 구간 합계, 이동 매각률, 전년 동기 대비 변화를 벡터 연산으로 계산
+"""
+
+import os
+import re
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# "지역별 매각통계_{지역}_{시작 YYYYMM}~{끝 YYYYMM}.xls(x)"
+STATISTICS_FILENAME_PATTERN = re.compile(r'^지역별 매각통계_(?P<region>.+)_(?P<start>\d{6})~(?P<end>\d{6})\.xlsx?$')
+
+# 레코드 하나 = 한 원본 파일 기간의 구/군 하나 (기간은 연 × 12 + 월 - 1의 월 번호)
+RECORD_DTYPE = np.dtype([
+    ('start', np.int32),
+    ('end', np.int32),
+    ('district', np.int32),
+    ('auctions', np.int64),
+    ('sales', np.int64),
+    ('appraisal_value', np.int64),
+    ('sale_value', np.int64)
+])
+
+# 합계를 내는 항목 (DISTRICT_FIELDS와 같은 이름)
+SUM_FIELDS = ('auctions', 'sales', 'appraisal_value', 'sale_value')
+
+# 추세 조회의 최대 이동 구간과 최대 조회 구간 (개월)
+TREND_MAX_WINDOW = 120
+TREND_MAX_MONTHS = 240
+
+def parse_period(text: str) -> int:
+    """YYYYMM 문자열을 월 번호로 변환 (잘못된 값이면 ValueError)"""
+    text = str(text)
+    if not re.fullmatch(r'\d{6}', text) or not 1 <= int(text[4:]) <= 12:
+        raise ValueError(f'기간은 YYYYMM 형식이어야 합니다: {text}')
+    return int(text[:4]) * 12 + int(text[4:]) - 1
+
+def format_period(period: int) -> str:
+    """월 번호를 YYYYMM 문자열로 변환"""
+    return f"{period // 12:04d}{period % 12 + 1:02d}"
+
+def parse_statistics_filename(filename: str) -> Optional[Tuple[str, int, int]]:
+    """파일 이름에서 (지역, 시작 월 번호, 끝 월 번호) 추출 (형식이 다르면 None)"""
+    match = STATISTICS_FILENAME_PATTERN.match(os.path.basename(filename))
+    if not match:
+        return None
+    try:
+        start, end = parse_period(match.group('start')), parse_period(match.group('end'))
+    except ValueError:
+        return None
+    if end < start:
+        return None
+    return match.group('region'), start, end
+
+def calculate_rates(totals: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """합계로 매각률(매각건수/경매건수)과 매각가율(매각가/감정가) 계산 (%, 소수점 1자리, 분모가 0이면 0)"""
+    auctions = totals['auctions'].astype(np.float64)
+    appraisal_value = totals['appraisal_value'].astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sale_rate = np.where(auctions > 0, totals['sales'] / auctions * 100, 0.0)
+        sale_price_rate = np.where(appraisal_value > 0, totals['sale_value'] / appraisal_value * 100, 0.0)
+    return {'sale_rate': np.round(sale_rate, 1), 'sale_price_rate': np.round(sale_price_rate, 1)}
+
+class StatisticsTimeSeries:
+    def __init__(self, regions: Optional[Dict] = None):
+        """
+        지역별 {
+            'districts': 구/군 이름 목록,
+            'records': RECORD_DTYPE 배열 (기간, 구/군 순 정렬),
+            'periods': (기간 수, 2) 배열 [시작 월, 끝 월] (시작 월 순),
+            'order': 기간 선택 우선순위 (짧은 기간, 이른 기간 순),
+            'totals': 항목별 (기간, 구/군) 합계 행렬 (구간 합계를 행 합으로 계산)
+        }
+        지역을 갱신할 때는 새 딕셔너리로 교체 (읽는 쪽은 잠그지 않음)
+        regions를 주면 그 지역 데이터를 공유하는 새 시계열 (다시 로드할 때 바뀐 지역만 교체)
+        """
+        self.regions = dict(regions) if regions else {}
+
+    def set_region(self, region: str, periods: List[Tuple[int, int, Dict[str, Dict]]]):
+        """
+        지역 하나의 전체 기간 데이터 교체
+        periods: [(시작 월 번호, 끝 월 번호, {구/군 이름: 통계})], 같은 기간이 여러 번 있으면 마지막 값 사용
+        """
+        by_period = {(start, end): districts for start, end, districts in periods}
+        names = list(dict.fromkeys(name for districts in by_period.values() for name in districts))
+        codes = {name: code for code, name in enumerate(names)}
+
+        records = np.zeros(sum(len(districts) for districts in by_period.values()), dtype=RECORD_DTYPE)
+        period_ids = np.zeros(len(records), dtype=np.intp)
+        period_list = sorted(by_period)
+        row = 0
+        for period_id, (start, end) in enumerate(period_list):
+            for name, stats in by_period[(start, end)].items():
+                records[row] = (start, end, codes[name], stats['auctions'], stats['sales'],
+                                stats['appraisal_value'], stats['sale_value'])
+                period_ids[row] = period_id
+                row += 1
+
+        period_array = np.array(period_list, dtype=np.int64).reshape(-1, 2)
+        totals = {}
+        for field in SUM_FIELDS:
+            matrix = np.zeros((len(period_list), len(names)), dtype=np.int64)
+            np.add.at(matrix, (period_ids, records['district']), records[field])
+            totals[field] = matrix
+
+        regions = dict(self.regions)
+        regions[region] = {
+            'districts': names,
+            'records': records,
+            'periods': period_array,
+            'order': np.lexsort((period_array[:, 0], period_array[:, 1] - period_array[:, 0])),
+            'totals': totals
+        }
+        self.regions = regions
+        logger.info(f"{region} 매각통계 시계열: {len(period_list)}개 기간, {len(records)}개 레코드")
+
+    def get_periods(self, region: str) -> List[Tuple[int, int]]:
+        """지역의 보관 기간 목록 (시작 월 순)"""
+        data = self.regions.get(region)
+        if not data:
+            return []
+        return [(start, end) for start, end in data['periods'].tolist()]
+
+    @staticmethod
+    def select_periods(data: Dict, start: int, end: int) -> np.ndarray:
+        """
+        구간 [start, end]에 완전히 들어가는 기간 중 서로 겹치지 않는 기간 번호
+        (짧은 기간 우선, 월별 파일과 누적 기간 파일이 함께 있어도 이중 집계하지 않음)
+        """
+        periods, order = data['periods'], data['order']
+        candidates = order[(periods[order, 0] >= start) & (periods[order, 1] <= end)]
+
+        occupied = np.zeros(max(end - start + 1, 0), dtype=bool)
+        selected = []
+        for period_id in candidates.tolist():
+            first, last = periods[period_id] - start
+            if not occupied[first:last + 1].any():
+                occupied[first:last + 1] = True
+                selected.append(period_id)
+        return np.sort(np.array(selected, dtype=np.intp))
+
+    def aggregate(self, region: str, start: int, end: int) -> Optional[Dict]:
+        """
+        구간 [start, end]의 구/군별 합계와 매각률, 매각가율
+        반환값: {'districts', 'periods', 'auctions', 'sales', 'appraisal_value', 'sale_value', 'sale_rate', 'sale_price_rate'}
+        (구간에 완전히 들어가는 기간이 없으면 None)
+        """
+        data = self.regions.get(region)
+        if not data:
+            return None
+        period_ids = self.select_periods(data, start, end)
+        if not len(period_ids):
+            return None
+
+        totals = {field: data['totals'][field][period_ids].sum(axis=0) for field in SUM_FIELDS}
+        totals.update(calculate_rates(totals))
+        totals['districts'] = data['districts']
+        totals['periods'] = [(start, end) for start, end in data['periods'][period_ids].tolist()]
+        return totals
+
+    def get_district_totals(self, region: str, start: int, end: int, district: Optional[str] = None) -> Optional[Dict]:
+        """구/군 하나(없으면 지역 전체 합계)의 구간 합계와 매각률, 매각가율"""
+        totals = self.aggregate(region, start, end)
+        if totals is None:
+            return None
+
+        if district is None:
+            values = {field: np.array([totals[field].sum()]) for field in SUM_FIELDS}
+        elif district in totals['districts']:
+            index = totals['districts'].index(district)
+            values = {field: totals[field][index:index + 1] for field in SUM_FIELDS}
+        else:
+            return None
+        if values['auctions'][0] == 0 and values['appraisal_value'][0] == 0:
+            return None
+
+        values.update(calculate_rates(values))
+        result = {name: value[0].item() for name, value in values.items()}
+        result['periods'] = [{'start': format_period(s), 'end': format_period(e)} for s, e in totals['periods']]
+        return result
+
+    def get_trend(self, region: str, district: Optional[str] = None, start: Optional[int] = None,
+                  end: Optional[int] = None, window: int = 12) -> Optional[Dict]:
+        """
+        구간 합계, window개월 이동 매각률, 전년 동기 대비 변화
+        - rolling: 구간 안의 각 월을 끝으로 하는 window개월 합계 (집계할 기간이 없는 월은 제외)
+        - yoy: 12개월 전 같은 구간 대비 매각률/매각가율 차이(%p)와 경매/매각건수 증감률(%)
+        window나 조회 구간이 최대값을 넘으면 ValueError
+        """
+        if not 1 <= window <= TREND_MAX_WINDOW:
+            raise ValueError(f'window는 1 이상 {TREND_MAX_WINDOW}개월 이하여야 합니다.')
+
+        periods = self.get_periods(region)
+        if not periods:
+            return None
+        start = min(p[0] for p in periods) if start is None else start
+        end = max(p[1] for p in periods) if end is None else end
+        if end - start + 1 > TREND_MAX_MONTHS:
+            raise ValueError(f'조회 구간은 최대 {TREND_MAX_MONTHS}개월입니다.')
+
+        current = self.get_district_totals(region, start, end, district)
+        if current is None:
+            return None
+
+        rolling = []
+        for month in range(start, end + 1):
+            totals = self.get_district_totals(region, month - window + 1, month, district)
+            if totals:
+                rolling.append({
+                    'period': format_period(month),
+                    'auctions': totals['auctions'],
+                    'sales': totals['sales'],
+                    'sale_rate': totals['sale_rate'],
+                    'sale_price_rate': totals['sale_price_rate']
+                })
+
+        previous = self.get_district_totals(region, start - 12, end - 12, district)
+        yoy = None
+        if previous:
+            yoy = {
+                'previous': previous,
+                'sale_rate_change': round(current['sale_rate'] - previous['sale_rate'], 1),
+                'sale_price_rate_change': round(current['sale_price_rate'] - previous['sale_price_rate'], 1),
+                'auctions_change': (round((current['auctions'] - previous['auctions']) / previous['auctions'] * 100, 1)
+                                    if previous['auctions'] else None),
+                'sales_change': (round((current['sales'] - previous['sales']) / previous['sales'] * 100, 1)
+                                 if previous['sales'] else None)
+            }
+
+        return {
+            'region': region,
+            'district': district,
+            'start': format_period(start),
+            'end': format_period(end),
+            'window': window,
+            'available_periods': [{'start': format_period(s), 'end': format_period(e)} for s, e in periods],
+            'totals': current,
+            'rolling': rolling,
+            'yoy': yoy
+        }
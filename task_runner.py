@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+병렬 작업 실행 유틸리티
+여러 데이터 소스 수집 작업을 스레드 풀(또는 이벤트 루프)에서 동시에 실행하고 완료 순서대로 결과 반환
+"""
+
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+def iter_completed(tasks: Dict[str, Callable[[], Any]], max_workers: Optional[int] = None,
+                   deadline: Optional[float] = None) -> Iterator[Tuple[str, Any, Optional[Exception]]]:
+    """
+    작업들을 병렬로 실행하고 완료되는 순서대로 (이름, 결과, 오류) 반환
+
+    - tasks: {이름: 인자 없는 함수}, 딕셔너리 순서가 우선순위 (동시에 끝나면 앞선 작업 먼저)
+    - max_workers: 동시에 실행할 최대 작업 수 (기본값: 작업 수)
+    - deadline: 전체 제한 시간(초). 초과하면 남은 작업은 취소하고 반환 종료
+
+    제너레이터를 중간에 닫으면 (break 등) 아직 시작하지 않은 작업은 취소된다.
+    이미 실행 중인 스레드는 강제 종료할 수 없으므로 각 작업 자체의 timeout으로 끝난다.
+    """
+    if not tasks:
+        return
+
+    priority = {name: index for index, name in enumerate(tasks)}
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(tasks), thread_name_prefix='task-runner')
+    futures = {executor.submit(func): name for name, func in tasks.items()}
+    pending = set(futures)
+    end_time = time.monotonic() + deadline if deadline else None
+
+    try:
+        while pending:
+            timeout = None
+            if end_time is not None:
+                timeout = end_time - time.monotonic()
+                if timeout <= 0:
+                    break
+
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            # 같은 시점에 끝난 작업은 우선순위 순서로 반환
+            for future in sorted(done, key=lambda f: priority[futures[f]]):
+                name = futures[future]
+                try:
+                    yield name, future.result(), None
+                except Exception as e:
+                    yield name, None, e
+
+        if pending:
+            logger.warning(f"제한 시간 초과로 미완료 작업 취소: {sorted(futures[f] for f in pending)}")
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+async def aiter_completed(tasks: Dict[str, Callable[[], Awaitable[Any]]], max_concurrency: Optional[int] = None,
+                          deadline: Optional[float] = None) -> AsyncIterator[Tuple[str, Any, Optional[Exception]]]:
+    """
+    iter_completed의 비동기 버전: 코루틴 작업들을 이벤트 루프에서 동시에 실행하고 완료 순서대로 반환
+
+    - tasks: {이름: 인자 없는 코루틴 함수}, 딕셔너리 순서가 우선순위
+    - max_concurrency: 동시에 실행할 최대 작업 수 (기본값: 제한 없음)
+    - deadline: 전체 제한 시간(초). 초과하면 남은 작업은 취소하고 반환 종료
+
+    스레드와 달리 남은 작업은 즉시 취소된다 (제너레이터를 중간에 닫는 경우 포함).
+    """
+    if not tasks:
+        return
+
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def run(func):
+        if semaphore is None:
+            return await func()
+        async with semaphore:
+            return await func()
+
+    priority = {name: index for index, name in enumerate(tasks)}
+    futures = {asyncio.ensure_future(run(func)): name for name, func in tasks.items()}
+    pending = set(futures)
+    loop = asyncio.get_running_loop()
+    end_time = loop.time() + deadline if deadline else None
+
+    try:
+        while pending:
+            timeout = None
+            if end_time is not None:
+                timeout = end_time - loop.time()
+                if timeout <= 0:
+                    break
+
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+            # 같은 시점에 끝난 작업은 우선순위 순서로 반환
+            for future in sorted(done, key=lambda f: priority[futures[f]]):
+                name = futures[future]
+                try:
+                    yield name, future.result(), None
+                except Exception as e:
+                    yield name, None, e
+
+        if pending:
+            logger.warning(f"제한 시간 초과로 미완료 작업 취소: {sorted(futures[f] for f in pending)}")
+    finally:
+        for future in pending:
+            future.cancel()
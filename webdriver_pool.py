@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Selenium WebDriver 풀
+미리 띄워둔 headless Chrome을 요청 간에 재사용하여 브라우저 기동 비용을 줄임
+"""
+
+import queue
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+class WebDriverPool:
+    def __init__(self, driver_factory: Callable[[], Optional[object]], max_size: int = 2,
+                 max_uses: int = 50, checkout_timeout: float = 30):
+        """
+        - driver_factory: 설정이 끝난 WebDriver를 반환하는 함수 (실패 시 None)
+        - max_size: 동시에 존재할 수 있는 최대 드라이버 수
+        - max_uses: 드라이버 하나를 재사용할 최대 횟수 (초과 시 종료 후 새로 생성)
+        - checkout_timeout: 드라이버를 빌릴 때 기다리는 최대 시간(초)
+        """
+        self.driver_factory = driver_factory
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.checkout_timeout = checkout_timeout
+
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def warm(self, count: int = 1) -> int:
+        """드라이버를 미리 생성하여 대기열에 넣음 (생성된 개수 반환)"""
+        created = 0
+        for _ in range(min(count, self.max_size - self._idle.qsize())):
+            if not self._slots.acquire(blocking=False):
+                break
+            try:
+                driver = self._create_driver()
+                if driver is None:
+                    break
+                self._idle.put(driver)
+                created += 1
+            finally:
+                self._slots.release()
+
+        logger.info(f"WebDriver 풀 예열 완료: {created}개")
+        return created
+
+    def acquire(self, timeout: Optional[float] = None):
+        """드라이버 대여 (제한 시간 내 빌리지 못하면 None)"""
+        if self._closed:
+            return None
+
+        timeout = self.checkout_timeout if timeout is None else timeout
+        if not self._slots.acquire(timeout=timeout):
+            logger.warning(f"WebDriver 풀 대여 시간 초과 ({timeout}초)")
+            return None
+
+        try:
+            # 대기 중인 드라이버 중 정상인 것을 사용
+            while True:
+                try:
+                    driver = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if self.is_healthy(driver):
+                    return driver
+                logger.warning("비정상 WebDriver 폐기")
+                self._dispose(driver)
+
+            driver = self._create_driver()
+            if driver is None:
+                self._slots.release()
+            return driver
+
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, driver, discard: bool = False):
+        """드라이버 반납 (discard=True이거나 최대 사용 횟수에 도달하면 종료)"""
+        if driver is None:
+            return
+
+        try:
+            with self._lock:
+                self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+                exhausted = self._uses[id(driver)] >= self.max_uses
+
+            if discard or exhausted or self._closed or not self._reset(driver):
+                self._dispose(driver)
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """with 문으로 드라이버를 빌리고 자동 반납 (예외 발생 시 폐기)"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        except Exception:
+            self.release(driver, discard=True)
+            driver = None
+            raise
+        finally:
+            if driver is not None:
+                self.release(driver)
+
+    def is_healthy(self, driver) -> bool:
+        """드라이버 상태 확인 (브라우저 프로세스가 응답하는지)"""
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def close(self):
+        """대기 중인 모든 드라이버 종료"""
+        self._closed = True
+        while True:
+            try:
+                self._dispose(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def get_status(self) -> dict:
+        """풀 상태 정보"""
+        return {
+            'max_size': self.max_size,
+            'idle': self._idle.qsize(),
+            'max_uses': self.max_uses,
+            'closed': self._closed
+        }
+
+    def _create_driver(self):
+        driver = self.driver_factory()
+        if driver is not None:
+            with self._lock:
+                self._uses[id(driver)] = 0
+        return driver
+
+    def _reset(self, driver) -> bool:
+        """다음 요청을 위해 쿠키와 페이지 초기화"""
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning(f"WebDriver 초기화 실패: {e}")
+            return False
+
+    def _dispose(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"WebDriver 종료 실패: {e}")